@@ -1,6 +1,7 @@
 # action_bar.py
-from pathlib import Path
 from paths import asset
+from text_cache import render_text, sys_font
+from asset_manager import load_image
 import pygame
 import os
 import sys
@@ -26,23 +27,7 @@ class ActionBar:
         self.action_bar_top = game.height() - game.ACTION_BAR_HEIGHT
         self.gui_font = game.gui_font
         self.item_dir = asset("items")
-
-    def resolve_asset_path(self, rel_or_full) -> Path:
-        """Accepts absolute paths, 'assets/...', 'items/...', or bare filenames."""
-        if not rel_or_full:
-            return None
-        p = Path(rel_or_full)
-        if p.is_absolute():
-            return p
-
-        s = str(p).replace("\\", "/").lstrip("./")
-
-        # Strip leading 'assets/' if present (so JSON can use 'assets/...').
-        if s.startswith("assets/"):
-            s = s[len("assets/"):]  # -> 'items/cerberus.png'
-
-        parts = s.split("/")  # e.g., ['items', 'cerberus.png']
-        return asset(*parts)  # joins under your packaged assets dir
+        self.ghost_rect = None
 
     def draw(self):
         self.__draw_score_and_wallet()
@@ -59,11 +44,11 @@ class ActionBar:
         padding = 20
 
         # Draw Target Score above score
-        target_surface = self.gui_font.render(f"Target: {self.game.target_score}", True, (255, 180, 120))
+        target_surface = render_text(self.gui_font, f"Target: {self.game.target_score}", (255, 180, 120))
         self.surface.blit(target_surface, (padding, bar_y - 20))
 
-        score_surface = font.render(f"Score: {self.game.score}", True, (255, 255, 255))
-        wallet_surface = font.render(f"Wallet: {self.game.wallet}", True, (200, 200, 100))
+        score_surface = render_text(font, f"Score: {self.game.score}", (255, 255, 255))
+        wallet_surface = render_text(font, f"Wallet: {self.game.wallet}", (200, 200, 100))
 
         self.surface.blit(score_surface, (padding, bar_y + 10))
         self.surface.blit(wallet_surface, (padding, bar_y + 45))
@@ -89,7 +74,7 @@ class ActionBar:
         encounter_text = f"Encounter: {encounter_name} Will Trigger In {turns_remaining} {turns_string}"
 
         # Render the text surface
-        encounter_surface = font.render(encounter_text, True, (255, 150, 150))
+        encounter_surface = render_text(font, encounter_text, (255, 150, 150))
 
         # === POSITIONING ===
         x_offset = 600  # ➡️ Increase to move right, decrease to move left
@@ -113,33 +98,25 @@ class ActionBar:
             alpha = int(255 * (1 - progress ** 2))
 
         combo_color = self.game.get_combo_color(self.game.combo_level)
-        font = pygame.font.SysFont("Arial", 28, bold=True)
-        text_surface = font.render(self.game.combo_display_text, True, combo_color)
-        text_surface.set_alpha(alpha)
-
-        stroke_color = (0, 0, 0)
-        stroke_surfaces = [
-            (font.render(self.game.combo_display_text, True, stroke_color), dx, dy)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        ]
+        font = sys_font("Arial", 28, bold=True)
+        # Text with a 1px black stroke, composited once per (text, colour)
+        text_surface = render_text(font, self.game.combo_display_text, combo_color, outline=(0, 0, 0))
+        text_w, text_h = text_surface.get_width() - 2, text_surface.get_height() - 2
 
         surface_w = self.surface.get_width()
-        combo_text_x = surface_w // 2 - text_surface.get_width() // 2
+        combo_text_x = surface_w // 2 - text_w // 2
         fuse_y = (
-            self.game.combo_bands[0].y + self.game.combo_bands[0].height // 2 - text_surface.get_height() // 2
+            self.game.combo_bands[0].y + self.game.combo_bands[0].height // 2 - text_h // 2
             if self.game.combo_bands else self.action_bar_top - 20
         )
 
-        for stroke, dx, dy in stroke_surfaces:
-            stroke.set_alpha(alpha)
-            self.surface.blit(stroke, (combo_text_x + dx, fuse_y + dy))
-        self.surface.blit(text_surface, (combo_text_x, fuse_y))
+        self.surface.blit(self.game.alpha_sprites.get(text_surface, alpha), (combo_text_x - 1, fuse_y - 1))
 
     def __draw_possible_matches(self):
         font = self.gui_font
         surface_w = self.surface.get_width()
         bar_y = self.surface.get_height() - 100
-        matches_surface = font.render(f"Possible Matches: {self.game.get_possible_match_count()}", True, (180, 180, 255))
+        matches_surface = render_text(font, f"Possible Matches: {self.game.get_possible_match_count()}", (180, 180, 255))
         self.surface.blit(matches_surface, (surface_w - 250, bar_y - 50))
 
     def __draw_music_controls(self):
@@ -165,7 +142,7 @@ class ActionBar:
             current_track_name = "No Track"
             print(f"[MUSIC ERROR] Failed to get current track name: {e}")
 
-        track_label = font.render(current_track_name, True, (255, 255, 255))
+        track_label = render_text(font, current_track_name, (255, 255, 255))
         self.surface.blit(track_label, (padding + 250, bar_y + 10))
 
         prev_rect = pygame.Rect(padding + 250, bar_y + 45, button_size, button_size)
@@ -215,40 +192,21 @@ class ActionBar:
         slot_h = TILE_HEIGHT
         start_x = surface_w - (slot_w + slot_margin) * 5 - padding
         slot_y = bar_y - 10
+        self.ghost_rect = None  # where the dragged item ghost was drawn this frame
 
         # Setup drag state (from game)
         dragging_idx = getattr(self.game, "dragging_item_idx", None)
         drag_pos = getattr(self.game, "drag_mouse_pos", None)
         hover_drop = getattr(self.game, "hover_drop_index", None)
 
-        # Cache for scaled icons (avoid scaling every frame)
-        if not hasattr(self, "_inv_icon_cache"):
-            self._inv_icon_cache = {}  # {(path, slot_w, slot_h): Surface}
+        item_dir = getattr(self.game, "item_dir", self.item_dir)
+        atlas = getattr(self.game, "texture_atlas", None)
 
         def get_scaled_icon(icon_path):
-            key = (icon_path, slot_w, slot_h)
-            surf = self._inv_icon_cache.get(key)
-            if surf:
-                return surf
-
-            # Try full resolution via asset()
-            full_path = self.resolve_asset_path(icon_path)
-
-            # Fallbacks: allow bare filenames by looking in items/
-            if (not full_path) or (not full_path.exists()):
-                # If JSON only provided 'cerberus.png', look in self.game.item_dir
-                cand = (self.game.item_dir / str(icon_path)) if hasattr(self.game, "item_dir") else None
-                if cand and cand.exists():
-                    full_path = cand
-
-            if (not full_path) or (not full_path.exists()):
-                print(f"[ICON] not found: {icon_path}")
-                return None
-
-            raw = pygame.image.load(str(full_path)).convert_alpha()
-            surf = pygame.transform.smoothscale(raw, (slot_w - 4, slot_h - 4))
-            self._inv_icon_cache[key] = surf
-            return surf
+            size = (slot_w - 4, slot_h - 4)
+            icon = atlas.surface(("icon", icon_path, size)) if atlas else None
+            # JSON may give 'assets/items/x.png', 'items/x.png' or just 'x.png'
+            return icon or load_image(icon_path, size, smooth=True, fallback_dir=item_dir)
 
         # Build & draw slots
         self.slot_rects = []
@@ -295,14 +253,13 @@ class ActionBar:
                 if icon_path:
                     icon = get_scaled_icon(icon_path)
                     if icon:
-                        ghost = icon.copy()
-                        ghost.set_alpha(200)  # a bit transparent
+                        ghost = self.game.alpha_sprites.get(icon, 200)  # a bit transparent
                         gx = drag_pos[0] - (icon.get_width() // 2)
                         gy = drag_pos[1] - (icon.get_height() // 2)
                         self.surface.blit(ghost, (gx, gy))
                         # optional ghost outline
-                        pygame.draw.rect(self.surface, (120, 190, 255), (gx, gy, icon.get_width(), icon.get_height()),
-                                         2)
+                        self.ghost_rect = pygame.Rect(gx, gy, icon.get_width(), icon.get_height())
+                        pygame.draw.rect(self.surface, (120, 190, 255), self.ghost_rect, 2)
 
 
 
@@ -0,0 +1,85 @@
+# animation_store.py
+
+
+class Tween:
+    """
+    In-flight animation state for one tile: where it started, where it is
+    going (pixels and grid cell) and how it is being drawn on the way.
+
+    Start/target default to the tile's current position, so a tween that
+    only moves along one axis doesn't have to fill in the other.
+    """
+
+    __slots__ = (
+        "start_x", "start_y", "target_x", "target_y",
+        "target_grid_x", "target_grid_y", "target_z",
+        "alpha", "fading", "flicker",
+    )
+
+    def __init__(self, tile):
+        self.start_x = self.target_x = tile.x
+        self.start_y = self.target_y = tile.y
+        self.target_grid_x = tile.grid_x
+        self.target_grid_y = tile.grid_y
+        self.target_z = tile.z
+        self.alpha = 255
+        self.fading = False
+        self.flicker = False
+
+    def position_at(self, progress):
+        return (self.start_x + (self.target_x - self.start_x) * progress,
+                self.start_y + (self.target_y - self.start_y) * progress)
+
+    @property
+    def target_cell(self):
+        return (self.target_grid_x, self.target_grid_y, self.target_z)
+
+    @property
+    def target_pos(self):
+        return (self.target_x, self.target_y)
+
+
+class AnimationStore:
+    """
+    Tweens for the tiles currently animating, keyed by tile uid.
+
+    Encounters and item effects begin() a tween when they set a tile in
+    motion and finish() it when the move lands, so board tiles never carry
+    leftover animation fields and render loops only have to check one set
+    of ids.
+    """
+
+    def __init__(self):
+        self.tweens = {}  # tile uid -> Tween
+
+    def begin(self, tile, **fields):
+        """Start (or restart) a tween from the tile's current position."""
+        tween = self.tweens[tile.uid] = Tween(tile)
+        for name, value in fields.items():
+            setattr(tween, name, value)
+        return tween
+
+    def get(self, tile):
+        return self.tweens.get(tile.uid)
+
+    def __contains__(self, tile):
+        return tile.uid in self.tweens
+
+    def __len__(self):
+        return len(self.tweens)
+
+    @property
+    def ids(self):
+        """Live view of the uids with a tween in flight."""
+        return self.tweens.keys()
+
+    def alpha(self, tile):
+        tween = self.tweens.get(tile.uid)
+        return 255 if tween is None else tween.alpha
+
+    def finish(self, tiles):
+        for tile in tiles:
+            self.tweens.pop(tile.uid, None)
+
+    def clear(self):
+        self.tweens.clear()
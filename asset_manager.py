@@ -0,0 +1,114 @@
+# asset_manager.py
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame
+
+from paths import ASSETS_DIR, BASE_DIR
+
+
+class AssetManager:
+    """
+    Shared image cache on top of paths.asset().
+
+    image(path, size) resolves the path once, decodes the file once and
+    keeps every requested scaled size, so UI code can ask for an icon
+    every frame without touching the disk. Entries are evicted least
+    recently used first once their pixel memory passes budget_bytes.
+    Missing files are remembered (and reported once) instead of being
+    looked up again every frame.
+    """
+
+    def __init__(self, budget_bytes=128 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.surfaces = OrderedDict()  # (path, size, smooth, alpha) -> Surface
+        self.resolved = {}  # (rel_or_full, fallback_dir) -> Path or None
+
+    def resolve(self, rel_or_full, fallback_dir=None):
+        """
+        Accepts absolute paths, 'assets/...', paths relative to the game
+        folder or to assets/, and bare filenames (looked up in fallback_dir).
+        Returns an existing Path, or None.
+        """
+        if not rel_or_full:
+            return None
+        key = (str(rel_or_full), str(fallback_dir) if fallback_dir else None)
+        if key in self.resolved:
+            return self.resolved[key]
+
+        p = Path(rel_or_full)
+        if p.is_absolute():
+            candidates = [p]
+        else:
+            s = str(p).replace("\\", "/")
+            while s.startswith("./"):
+                s = s[2:]
+            if s.startswith("assets/"):
+                candidates = [ASSETS_DIR / s[len("assets/"):]]
+            else:
+                candidates = [BASE_DIR / s, ASSETS_DIR / s]
+            if fallback_dir:
+                candidates.append(Path(fallback_dir) / p.name)
+
+        found = next((c for c in candidates if c.exists()), None)
+        if found is None:
+            print(f"[ASSET] not found: {rel_or_full}")
+        self.resolved[key] = found
+        return found
+
+    def image(self, rel_or_full, size=None, smooth=False, alpha=True, fallback_dir=None):
+        """
+        The image at rel_or_full, optionally scaled to size (w, h); None if missing.
+        smooth picks smoothscale over scale; alpha=False converts without per-pixel alpha.
+        Cached surfaces are shared: blit them, don't draw on them.
+        """
+        path = self.resolve(rel_or_full, fallback_dir)
+        if path is None:
+            return None
+        size = tuple(size) if size else None
+        key = (str(path), size, smooth and size is not None, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        original = self._original(path, alpha)
+        if size is None or original.get_size() == size:
+            return original
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        return self._store(key, scale(original, size))
+
+    def _original(self, path, alpha):
+        key = (str(path), None, False, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        loaded = pygame.image.load(str(path))
+        return self._store(key, loaded.convert_alpha() if alpha else loaded.convert())
+
+    @staticmethod
+    def _bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _store(self, key, surface):
+        self.surfaces[key] = surface
+        self.used_bytes += self._bytes(surface)
+        while self.used_bytes > self.budget_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.used_bytes -= self._bytes(evicted)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.resolved.clear()
+        self.used_bytes = 0
+
+
+asset_manager = AssetManager()
+
+
+def load_image(rel_or_full, size=None, smooth=False, alpha=True, fallback_dir=None):
+    """Cached, converted pygame.image.load(); see AssetManager.image."""
+    return asset_manager.image(rel_or_full, size, smooth, alpha, fallback_dir)
@@ -0,0 +1,115 @@
+# colormaps.py
+"""
+Precomputed 256-entry RGB lookup tables for the matplotlib colormaps the
+effects use, so colour lookups are plain list indexing (no matplotlib or
+NumPy scalar calls per particle per frame).
+
+sample(table, x) matches matplotlib's cmap(x)[:3] scaled to 0-255 ints:
+x in [0, 1] picks entry int(x * 256), clamped to the table.
+"""
+
+INFERNO = [
+    (0, 0, 3), (0, 0, 4), (0, 0, 6), (1, 0, 7), (1, 1, 9), (1, 1, 11),
+    (2, 1, 14), (2, 2, 16), (3, 2, 18), (4, 3, 20), (4, 3, 22), (5, 4, 24),
+    (6, 4, 27), (7, 5, 29), (8, 6, 31), (9, 6, 33), (10, 7, 35), (11, 7, 38),
+    (13, 8, 40), (14, 8, 42), (15, 9, 45), (16, 9, 47), (18, 10, 50), (19, 10, 52),
+    (20, 11, 54), (22, 11, 57), (23, 11, 59), (25, 11, 62), (26, 11, 64), (28, 12, 67),
+    (29, 12, 69), (31, 12, 71), (32, 12, 74), (34, 11, 76), (36, 11, 78), (38, 11, 80),
+    (39, 11, 82), (41, 11, 84), (43, 10, 86), (45, 10, 88), (46, 10, 90), (48, 10, 92),
+    (50, 9, 93), (52, 9, 95), (53, 9, 96), (55, 9, 97), (57, 9, 98), (59, 9, 100),
+    (60, 9, 101), (62, 9, 102), (64, 9, 102), (65, 9, 103), (67, 10, 104), (69, 10, 105),
+    (70, 10, 105), (72, 11, 106), (74, 11, 106), (75, 12, 107), (77, 12, 107), (79, 13, 108),
+    (80, 13, 108), (82, 14, 108), (83, 14, 109), (85, 15, 109), (87, 15, 109), (88, 16, 109),
+    (90, 17, 109), (91, 17, 110), (93, 18, 110), (95, 18, 110), (96, 19, 110), (98, 20, 110),
+    (99, 20, 110), (101, 21, 110), (102, 21, 110), (104, 22, 110), (106, 23, 110), (107, 23, 110),
+    (109, 24, 110), (110, 24, 110), (112, 25, 110), (114, 25, 109), (115, 26, 109), (117, 27, 109),
+    (118, 27, 109), (120, 28, 109), (122, 28, 109), (123, 29, 108), (125, 29, 108), (126, 30, 108),
+    (128, 31, 107), (129, 31, 107), (131, 32, 107), (133, 32, 106), (134, 33, 106), (136, 33, 106),
+    (137, 34, 105), (139, 34, 105), (141, 35, 105), (142, 36, 104), (144, 36, 104), (145, 37, 103),
+    (147, 37, 103), (149, 38, 102), (150, 38, 102), (152, 39, 101), (153, 40, 100), (155, 40, 100),
+    (156, 41, 99), (158, 41, 99), (160, 42, 98), (161, 43, 97), (163, 43, 97), (164, 44, 96),
+    (166, 44, 95), (167, 45, 95), (169, 46, 94), (171, 46, 93), (172, 47, 92), (174, 48, 91),
+    (175, 49, 91), (177, 49, 90), (178, 50, 89), (180, 51, 88), (181, 51, 87), (183, 52, 86),
+    (184, 53, 86), (186, 54, 85), (187, 55, 84), (189, 55, 83), (190, 56, 82), (191, 57, 81),
+    (193, 58, 80), (194, 59, 79), (196, 60, 78), (197, 61, 77), (199, 62, 76), (200, 62, 75),
+    (201, 63, 74), (203, 64, 73), (204, 65, 72), (205, 66, 71), (207, 68, 70), (208, 69, 68),
+    (209, 70, 67), (210, 71, 66), (212, 72, 65), (213, 73, 64), (214, 74, 63), (215, 75, 62),
+    (217, 77, 61), (218, 78, 59), (219, 79, 58), (220, 80, 57), (221, 82, 56), (222, 83, 55),
+    (223, 84, 54), (224, 86, 52), (226, 87, 51), (227, 88, 50), (228, 90, 49), (229, 91, 48),
+    (230, 92, 46), (230, 94, 45), (231, 95, 44), (232, 97, 43), (233, 98, 42), (234, 100, 40),
+    (235, 101, 39), (236, 103, 38), (237, 104, 37), (237, 106, 35), (238, 108, 34), (239, 109, 33),
+    (240, 111, 31), (240, 112, 30), (241, 114, 29), (242, 116, 28), (242, 117, 26), (243, 119, 25),
+    (243, 121, 24), (244, 122, 22), (245, 124, 21), (245, 126, 20), (246, 128, 18), (246, 129, 17),
+    (247, 131, 16), (247, 133, 14), (248, 135, 13), (248, 136, 12), (248, 138, 11), (249, 140, 9),
+    (249, 142, 8), (249, 144, 8), (250, 145, 7), (250, 147, 6), (250, 149, 6), (250, 151, 6),
+    (251, 153, 6), (251, 155, 6), (251, 157, 6), (251, 158, 7), (251, 160, 7), (251, 162, 8),
+    (251, 164, 10), (251, 166, 11), (251, 168, 13), (251, 170, 14), (251, 172, 16), (251, 174, 18),
+    (251, 176, 20), (251, 177, 22), (251, 179, 24), (251, 181, 26), (251, 183, 28), (251, 185, 30),
+    (250, 187, 33), (250, 189, 35), (250, 191, 37), (250, 193, 40), (249, 195, 42), (249, 197, 44),
+    (249, 199, 47), (248, 201, 49), (248, 203, 52), (248, 205, 55), (247, 207, 58), (247, 209, 60),
+    (246, 211, 63), (246, 213, 66), (245, 215, 69), (245, 217, 72), (244, 219, 75), (244, 220, 79),
+    (243, 222, 82), (243, 224, 86), (243, 226, 89), (242, 228, 93), (242, 230, 96), (241, 232, 100),
+    (241, 233, 104), (241, 235, 108), (241, 237, 112), (241, 238, 116), (241, 240, 121), (241, 242, 125),
+    (242, 243, 129), (242, 244, 133), (243, 246, 137), (244, 247, 141), (245, 248, 145), (246, 250, 149),
+    (247, 251, 153), (249, 252, 157), (250, 253, 160), (252, 254, 164),
+]
+
+PRISM = [
+    (255, 0, 0), (255, 0, 0), (255, 33, 0), (255, 81, 0), (255, 130, 0), (255, 176, 0),
+    (255, 215, 0), (255, 246, 0), (226, 255, 0), (178, 255, 0), (129, 255, 0), (83, 254, 0),
+    (42, 226, 0), (10, 188, 57), (0, 144, 125), (0, 96, 185), (0, 47, 232), (0, 0, 255),
+    (25, 0, 255), (61, 0, 255), (105, 0, 254), (153, 0, 215), (202, 0, 162), (249, 0, 99),
+    (255, 0, 28), (255, 0, 0), (255, 14, 0), (255, 61, 0), (255, 111, 0), (255, 158, 0),
+    (255, 200, 0), (255, 235, 0), (245, 255, 0), (197, 255, 0), (148, 255, 0), (101, 255, 0),
+    (58, 238, 0), (22, 204, 28), (0, 163, 98), (0, 116, 162), (0, 67, 215), (0, 19, 253),
+    (13, 0, 255), (46, 0, 255), (87, 0, 255), (133, 0, 232), (182, 0, 185), (231, 0, 125),
+    (255, 0, 57), (255, 0, 0), (255, 0, 0), (255, 42, 0), (255, 91, 0), (255, 139, 0),
+    (255, 184, 0), (255, 222, 0), (255, 251, 0), (217, 255, 0), (168, 255, 0), (119, 255, 0),
+    (74, 249, 0), (35, 219, 0), (5, 180, 71), (0, 135, 137), (0, 86, 195), (0, 38, 240),
+    (3, 0, 255), (32, 0, 255), (70, 0, 255), (114, 0, 247), (163, 0, 206), (212, 0, 150),
+    (255, 0, 85), (255, 0, 14), (255, 0, 0), (255, 23, 0), (255, 71, 0), (255, 120, 0),
+    (255, 167, 0), (255, 208, 0), (255, 241, 0), (236, 255, 0), (188, 255, 0), (139, 255, 0),
+    (92, 255, 0), (50, 232, 0), (16, 197, 42), (0, 154, 111), (0, 106, 173), (0, 57, 224),
+    (0, 10, 255), (19, 0, 255), (53, 0, 255), (96, 0, 255), (143, 0, 224), (192, 0, 174),
+    (240, 0, 112), (255, 0, 43), (255, 0, 0), (255, 4, 0), (255, 51, 0), (255, 100, 0),
+    (255, 148, 0), (255, 192, 0), (255, 229, 0), (254, 255, 0), (207, 255, 0), (158, 255, 0),
+    (110, 255, 0), (66, 244, 0), (29, 212, 13), (1, 172, 84), (0, 126, 150), (0, 77, 205),
+    (0, 28, 247), (7, 0, 255), (38, 0, 255), (78, 0, 255), (124, 0, 240), (172, 0, 196),
+    (221, 0, 138), (255, 0, 72), (255, 0, 0), (255, 0, 0), (255, 32, 0), (255, 81, 0),
+    (255, 129, 0), (255, 175, 0), (255, 215, 0), (255, 246, 0), (227, 255, 0), (178, 255, 0),
+    (129, 255, 0), (83, 254, 0), (43, 226, 0), (11, 189, 56), (0, 145, 124), (0, 96, 184),
+    (0, 47, 232), (0, 1, 255), (25, 0, 255), (61, 0, 255), (105, 0, 254), (153, 0, 215),
+    (202, 0, 163), (249, 0, 99), (255, 0, 29), (255, 0, 0), (255, 13, 0), (255, 61, 0),
+    (255, 110, 0), (255, 157, 0), (255, 200, 0), (255, 235, 0), (245, 255, 0), (198, 255, 0),
+    (149, 255, 0), (101, 255, 0), (58, 238, 0), (22, 205, 27), (0, 163, 98), (0, 116, 161),
+    (0, 67, 214), (0, 19, 253), (13, 0, 255), (45, 0, 255), (86, 0, 255), (133, 0, 233),
+    (182, 0, 185), (230, 0, 126), (255, 0, 58), (255, 0, 0), (255, 0, 0), (255, 41, 0),
+    (255, 90, 0), (255, 139, 0), (255, 184, 0), (255, 222, 0), (255, 251, 0), (217, 255, 0),
+    (169, 255, 0), (120, 255, 0), (75, 249, 0), (36, 219, 0), (5, 181, 70), (0, 135, 137),
+    (0, 87, 195), (0, 38, 239), (2, 0, 255), (31, 0, 255), (69, 0, 255), (114, 0, 248),
+    (162, 0, 206), (211, 0, 151), (255, 0, 86), (255, 0, 15), (255, 0, 0), (255, 22, 0),
+    (255, 71, 0), (255, 120, 0), (255, 166, 0), (255, 207, 0), (255, 240, 0), (236, 255, 0),
+    (188, 255, 0), (139, 255, 0), (92, 255, 0), (50, 233, 0), (16, 197, 42), (0, 154, 111),
+    (0, 107, 173), (0, 57, 223), (0, 10, 255), (18, 0, 255), (53, 0, 255), (95, 0, 255),
+    (143, 0, 225), (192, 0, 175), (239, 0, 113), (255, 0, 44), (255, 0, 0), (255, 4, 0),
+    (255, 51, 0), (255, 100, 0), (255, 148, 0), (255, 192, 0), (255, 228, 0), (254, 255, 0),
+    (208, 255, 0), (159, 255, 0), (111, 255, 0), (66, 244, 0), (29, 212, 13), (1, 172, 84),
+    (0, 126, 149), (0, 77, 204), (0, 29, 246), (7, 0, 255), (38, 0, 255), (77, 0, 255),
+    (123, 0, 241), (172, 0, 196), (221, 0, 139), (255, 0, 72), (255, 0, 1), (255, 0, 0),
+    (255, 32, 0), (255, 80, 0), (255, 129, 0), (255, 175, 0), (255, 215, 0), (255, 246, 0),
+    (227, 255, 0), (179, 255, 0), (130, 255, 0), (84, 254, 0),
+]
+
+INFERNO_R = INFERNO[::-1]  # matplotlib's inferno.reversed()
+
+LAST = len(INFERNO) - 1
+
+
+def index(x):
+    """Table index for a 0..1 colormap position."""
+    i = int(x * 256)
+    return 0 if i < 0 else LAST if i > LAST else i
+
+
+def sample(table, x):
+    return table[index(x)]
@@ -1,13 +1,13 @@
 import random
 import pygame
-from matplotlib import colormaps
-import matplotlib.colors as mcolors
+from assets.fx.colormaps import INFERNO_R, PRISM, index
+from assets.fx.particle_atlas import atlas
 import math
 import logging
 
 TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH = 64, 96, 6
-INFERNO_CMAP = colormaps.get_cmap("inferno").reversed()
-PRISM_CMAP = colormaps.get_cmap("prism")
+INFERNO_CMAP = INFERNO_R  # reversed inferno, 256 RGB entries; index with colormaps.index(progress)
+PRISM_CMAP = PRISM
 LIGHT_RAY_COLOR_MAP = [
     (255, 255, 255),   # Pure White
     (240, 240, 200),   # Pale Yellow
@@ -39,12 +39,16 @@ class SmokeParticle:
         self.y += self.dy
         return True
 
-    def draw(self, surface):
+    def sprite(self):
+        """(sprite, position) to blit this frame, or None."""
         if self.alpha <= 0:
-            return
-        surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (180, 180, 180, int(self.alpha)), (self.radius, self.radius), self.radius)
-        surface.blit(surf, (self.x - self.radius, self.y - self.radius))
+            return None
+        return atlas.circle(self.radius, (180, 180, 180), self.alpha), (self.x - self.radius, self.y - self.radius)
+
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 class SparkleParticle:
     def __init__(self, x, y):
@@ -79,18 +83,21 @@ class SparkleParticle:
         self.y += self.dy + random.uniform(-self.jitter, self.jitter)
         return True
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha <= 0:
-            return
+            return None
 
         # Color from prism colormap based on progress
         progress = 1 - self.alpha / 255
-        r, g, b, _ = PRISM_CMAP(progress)
-        color = (int(r * 255), int(g * 255), int(b * 255))
+        color = PRISM_CMAP[index(progress)]
+
+        image = atlas.circle(int(self.radius), color, self.alpha, int(self.radius * 2))
+        return image, (self.x - self.radius, self.y - self.radius)
 
-        surf = pygame.Surface((int(self.radius * 2), int(self.radius * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*color, int(self.alpha)), (int(self.radius), int(self.radius)), int(self.radius))
-        surface.blit(surf, (self.x - self.radius, self.y - self.radius))
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 
 class FireParticle:
@@ -116,17 +123,18 @@ class FireParticle:
         self.y += self.dy
         return True
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha <= 0:
-            return
+            return None
         # Get RGB from colormap based on progress (inverse of fade-out)
         progress = 1 - self.alpha / 255
-        r, g, b, _ = INFERNO_CMAP(progress)
-        rgb_color = (int(r * 255), int(g * 255), int(b * 255))
+        rgb_color = INFERNO_CMAP[index(progress)]
+        return atlas.circle(self.radius, rgb_color, self.alpha), (self.x - self.radius, self.y - self.radius)
 
-        surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*rgb_color, int(self.alpha)), (self.radius, self.radius), self.radius)
-        surface.blit(surf, (self.x - self.radius, self.y - self.radius))
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 class WindParticle:
     def __init__(self, x, y, direction="east"):
@@ -170,13 +178,15 @@ class WindParticle:
 
         return True
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha <= 0:
-            return
+            return None
+        return atlas.circle(self.radius, (180, 220, 255), self.alpha), (self.x - self.radius, self.y - self.radius)
 
-        surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (180, 220, 255, self.alpha), (self.radius, self.radius), self.radius)
-        surface.blit(surf, (self.x - self.radius, self.y - self.radius))
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 class SelectedParticle:
     def __init__(self, x, y, width, height):
@@ -218,23 +228,17 @@ class SelectedParticle:
     def is_alive(self):
         return self.lifetime > 0
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha <= 0:
-            return
-
-        # Create feathered 3x14 surface with transparent background
-        surf = pygame.Surface((3, 14), pygame.SRCALPHA)
-
-        # Outer feather (1px border)
-        feather_alpha = int(self.alpha * 0.25)
-        feather_color = (*self.stroke_color, feather_alpha)
-        pygame.draw.rect(surf, feather_color, pygame.Rect(0, 0, 3, 14), border_radius=2)
+            return None
 
-        # Center white beam
-        white_color = (255, 255, 255, self.alpha)
-        pygame.draw.rect(surf, white_color, pygame.Rect(1, 1, 1, 12))  # Inner bright line
+        # Feathered 3x14 beam: stroke-colour outline around a white centre line
+        return atlas.beam(self.stroke_color, self.alpha), (self.x - 1, self.y - 1)  # Offset to center the 3px beam
 
-        surface.blit(surf, (self.x - 1, self.y - 1))  # Offset to center the 3px beam
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 class SelectedParticle_B:
     def __init__(self, x, y, width, height):
@@ -266,9 +270,9 @@ class SelectedParticle_B:
     def is_alive(self):
         return self.lifetime > 0
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha <= 0:
-            return
+            return None
 
         x, y = self.rect_x, self.rect_y
         w, h = self.width, self.height
@@ -285,15 +289,19 @@ class SelectedParticle_B:
             px, py = x, y + h - (pos - 2 * w - h)
 
         # Draw particle
-        surf = pygame.Surface((4, 4), pygame.SRCALPHA)
         color = (self.stroke_color)
         try:
-            pygame.draw.circle(surf, color, (2, 2), 2)
+            image = atlas.circle(2, color)
         except ValueError:
             print(f"[ERROR] Invalid color: {color}")
-            return
+            return None
 
-        surface.blit(surf, (px - 2, py - 2))
+        return image, (px - 2, py - 2)
+
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 class SelectedParticle_Fire:
     """
@@ -365,15 +373,14 @@ class SelectedParticle_Fire:
         self.perimeter_pos = (self.perimeter_pos + self.speed) % self.perimeter
 
         # Color & alpha from Inferno
-        r, g, b, _ = INFERNO_CMAP(progress)  # 0..1 floats
-        self.rgb = (int(r * 255), int(g * 255), int(b * 255))
+        self.rgb = INFERNO_CMAP[index(progress)]
         self.alpha = int(255 * (1.0 - progress))  # fade out over lifetime
 
         return True
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha <= 0:
-            return
+            return None
 
         # Base point + outward drift
         (px, py), (nx, ny) = self._edge_point_and_normal(self.perimeter_pos)
@@ -392,11 +399,12 @@ class SelectedParticle_Fire:
         t = 1.0 - self.alpha / 255.0
         radius = max(2, int(self.base_radius + 2 * (1.0 - abs(2 * t - 1.0))))
 
-        # Draw
-        size = radius * 2
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*self.rgb, self.alpha), (radius, radius), radius)
-        surface.blit(surf, (px + ox - radius, py + oy - radius))
+        return atlas.circle(radius, self.rgb, self.alpha), (px + ox - radius, py + oy - radius)
+
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
 
 class ComboBand:
     def __init__(self, x, y, width, height, color, duration, current_points=0, max_points=5):
@@ -472,15 +480,12 @@ class FuseParticle:
         self.y += self.vy
         self.alpha -= 5  # Fade out
 
-    def draw(self, surface):
+    def sprite(self):
         if self.alpha > 0:
-            surface_color = (*self.color[:3], max(0, min(255, int(self.alpha))))
-            s = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, surface_color, (self.radius, self.radius), self.radius)
-            surface.blit(s, (self.x, self.y))
-
-
-
-
-
+            return atlas.circle(self.radius, self.color[:3], self.alpha), (self.x, self.y)
+        return None
 
+    def draw(self, surface):
+        item = self.sprite()
+        if item:
+            surface.blit(*item)
@@ -0,0 +1,86 @@
+# particle_atlas.py
+from collections import OrderedDict
+
+import pygame
+
+
+class ParticleAtlas:
+    """
+    Pre-rendered particle sprites: circles bucketed by radius, colour and
+    alpha, plus the feathered selection beams.
+
+    Alpha is quantized to `levels` steps so a fading particle reuses a
+    handful of sprites instead of drawing a fresh surface every frame.
+    warm() renders the fixed-colour sprites up front; colormap-coloured
+    ones are made on first use. Least recently used sprites are dropped
+    past max_entries. Sprites are shared: blit them, don't draw on them.
+    """
+
+    def __init__(self, levels=32, max_entries=4096):
+        self.levels = levels
+        self.max_entries = max_entries
+        self.sprites = OrderedDict()  # (shape, size, rgb, level) -> Surface
+
+    def level_for(self, alpha):
+        alpha = max(0, min(255, int(alpha)))
+        return round(alpha * (self.levels - 1) / 255)
+
+    def _alpha(self, level):
+        return round(level * 255 / (self.levels - 1))
+
+    def _store(self, key, sprite):
+        self.sprites[key] = sprite
+        while len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def circle(self, radius, rgb, alpha=255, size=None):
+        """Circle of `radius` centred in a size x size sprite (size defaults to 2 * radius)."""
+        return self.circle_level(radius, tuple(rgb), self.level_for(alpha), size)
+
+    def circle_level(self, radius, rgb, level, size=None):
+        """circle() for an rgb tuple and an alpha already quantized with level_for()."""
+        size = radius * 2 if size is None else size
+        key = ("circle", radius, size, rgb, level)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*rgb, self._alpha(level)), (radius, radius), radius)
+        return self._store(key, sprite)
+
+    def beam(self, rgb, alpha):
+        """3x14 selection beam: a stroke-coloured feather around a white core."""
+        return self.beam_level(tuple(rgb), self.level_for(alpha))
+
+    def beam_level(self, rgb, level):
+        key = ("beam", 3, 14, rgb, level)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+        alpha = self._alpha(level)
+        sprite = pygame.Surface((3, 14), pygame.SRCALPHA)
+        pygame.draw.rect(sprite, (*rgb, int(alpha * 0.25)), pygame.Rect(0, 0, 3, 14), border_radius=2)
+        pygame.draw.rect(sprite, (255, 255, 255, alpha), pygame.Rect(1, 1, 1, 12))
+        return self._store(key, sprite)
+
+    def warm(self):
+        """Render the fixed-colour sprites (smoke, wind, selection beams/dots, fuse sparks) ahead of time."""
+        alphas = [self._alpha(level) for level in range(1, self.levels)]
+        for alpha in alphas:
+            for radius in range(5, 16):
+                self.circle(radius, (180, 180, 180), alpha)
+            for radius in range(6, 11):
+                self.circle(radius, (180, 220, 255), alpha)
+            for rgb in ((200, 255, 255), (180, 220, 255)):
+                self.beam(rgb, alpha)
+        for rgb in ((255, 255, 100), (255, 200, 240), (180, 220, 255)):
+            self.circle(2, rgb)
+
+    def clear(self):
+        self.sprites.clear()
+
+
+atlas = ParticleAtlas()
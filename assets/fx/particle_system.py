@@ -0,0 +1,446 @@
+# particle_system.py
+from abc import ABC, abstractmethod
+
+try:
+    import numpy as np
+except ImportError:  # optional: ParticleSystem falls back to per-object particles
+    np = None
+import pygame
+
+from assets.fx.colormaps import INFERNO_R, PRISM
+from assets.fx.particle_atlas import atlas
+from assets.fx.particle import SmokeParticle, SparkleParticle, FireParticle, WindParticle, \
+    SelectedParticle, SelectedParticle_B, SelectedParticle_Fire, FuseParticle
+
+
+def _lut_index(progress):
+    """Vectorized colormaps.index()."""
+    return np.clip((progress * 256).astype(np.int32), 0, 255)
+
+
+def _levels(alpha):
+    """Vectorized atlas.level_for()."""
+    alpha = np.clip(np.trunc(alpha), 0, 255)
+    return np.rint(alpha * (atlas.levels - 1) / 255).astype(np.int32)
+
+
+class Emitter(ABC):
+    """
+    Structure-of-arrays store for one particle type.
+
+    Every field is a NumPy column; spawn() takes a constructed particle
+    object (the existing classes still pick the random start values) and
+    queues its row, step() advances and culls all live particles at once,
+    sprites() turns the finished columns into atlas (sprite, position)
+    pairs for the frame's single blits() call. Emitters with `perimeter` set trace
+    an emitter rect and report that rect (not their point) for dirty rects.
+    """
+
+    particle_cls = None
+    fields = ()
+    perimeter = False
+
+    def __init__(self):
+        self.columns = {name: np.empty(0) for name in self.fields + ("tag",)}
+        self.pending = []
+
+    def __len__(self):
+        return len(self.columns["tag"]) + len(self.pending)
+
+    def spawn(self, particle, tag=0):
+        self.pending.append(self.row(particle) + (tag,))
+
+    @abstractmethod
+    def row(self, particle):
+        """The particle's field values, in `fields` order."""
+
+    def flush(self):
+        if not self.pending:
+            return
+        rows = np.array(self.pending, dtype=np.float64).reshape(len(self.pending), -1)
+        self.pending = []
+        for i, name in enumerate(self.fields + ("tag",)):
+            self.columns[name] = np.concatenate((self.columns[name], rows[:, i]))
+
+    def keep(self, mask):
+        for name, column in self.columns.items():
+            self.columns[name] = column[mask]
+
+    def remove_tag(self, tag):
+        self.flush()
+        self.keep(self.columns["tag"] != tag)
+
+    def clear(self):
+        self.pending = []
+        self.keep(np.zeros(len(self.columns["tag"]), dtype=bool))
+
+    def trim(self, count):
+        """Keep only the newest `count` particles."""
+        self.flush()
+        excess = len(self.columns["tag"]) - count
+        if excess > 0:
+            self.keep(slice(excess, None))
+
+    @abstractmethod
+    def step(self, now):
+        """Advance every live particle to `now` and drop the dead ones."""
+
+    @abstractmethod
+    def sprites(self, batch):
+        """Append (sprite, position) for every visible particle to batch."""
+
+    def points(self):
+        c = self.columns
+        return np.stack((c["x"], c["y"]), axis=1)
+
+    def rects(self):
+        c = self.columns
+        return np.unique(np.stack((c["rect_x"], c["rect_y"], c["w"], c["h"]), axis=1), axis=0)
+
+    @staticmethod
+    def batch(batch, mask, x, y, keys, sprite_for):
+        """
+        Append (sprite, (x, y)) for the particles in mask (None = all).
+
+        keys are small non-negative integer columns (< 4096) naming each
+        particle's sprite; they are packed into one int64 so sprite_for is
+        called once per distinct key, not once per particle.
+        """
+        packed = np.zeros(len(x), dtype=np.int64)
+        for column in keys:
+            packed = (packed << 12) | np.asarray(column, dtype=np.int64)
+        if mask is not None:
+            x, y, packed = x[mask], y[mask], packed[mask]
+        if not len(packed):
+            return
+        codes, inverse = np.unique(packed, return_inverse=True)
+        sprites = []
+        for code in codes.tolist():
+            row = []
+            for _ in keys:
+                row.append(code & 0xFFF)
+                code >>= 12
+            sprites.append(sprite_for(*reversed(row)))
+        batch.extend(zip([sprites[i] for i in inverse.tolist()], zip(x.tolist(), y.tolist())))
+
+    def _timed(self, now):
+        """Drop expired time-based particles; returns progress 0..1 of the rest."""
+        c = self.columns
+        elapsed = now - c["start"]
+        self.keep(elapsed <= c["life"])
+        return (now - c["start"]) / c["life"]
+
+
+class SmokeEmitter(Emitter):
+    particle_cls = SmokeParticle
+    fields = ("x", "y", "vx", "vy", "start", "life")
+
+    def row(self, p):
+        return p.x, p.y, p.dx, p.dy, p.start_time, p.lifetime
+
+    def step(self, now):
+        progress = self._timed(now)
+        c = self.columns
+        c["x"] += c["vx"]
+        c["y"] += c["vy"]
+        self.radius = 5 + (10 * progress).astype(np.int32)
+        self.alpha = np.maximum(0, 255 * (1 - progress))
+
+    def sprites(self, batch):
+        r, level = self.radius, _levels(self.alpha)
+        self.batch(batch, level > 0, self.columns["x"] - r, self.columns["y"] - r, (r, level),
+                   lambda r, level: atlas.circle_level(r, (180, 180, 180), level))
+
+
+class SparkleEmitter(Emitter):
+    particle_cls = SparkleParticle
+    fields = ("x", "y", "vx", "vy", "start", "life", "base_radius", "jitter")
+
+    def row(self, p):
+        return p.x, p.y, p.dx, p.dy, p.start_time, p.lifetime, p.base_radius, p.jitter
+
+    def step(self, now):
+        progress = self._timed(now)
+        c = self.columns
+        n = len(progress)
+        c["x"] += c["vx"] + np.random.uniform(-1, 1, n) * c["jitter"]
+        c["y"] += c["vy"] + np.random.uniform(-1, 1, n) * c["jitter"]
+        self.radius = np.maximum(1, c["base_radius"] * (1 - progress))
+        self.alpha = np.maximum(0, 255 * (1 - progress))
+        self.color = _lut_index(1 - self.alpha / 255)
+
+    def sprites(self, batch):
+        r, level = self.radius, _levels(self.alpha)
+        self.batch(batch, level > 0, self.columns["x"] - r, self.columns["y"] - r,
+                   (r.astype(np.int32), (r * 2).astype(np.int32), self.color, level),
+                   lambda r, size, i, level: atlas.circle_level(r, PRISM[i], level, size))
+
+
+class FireEmitter(Emitter):
+    particle_cls = FireParticle
+    fields = ("x", "y", "vx", "vy", "start", "life")
+
+    def row(self, p):
+        return p.x, p.y, p.dx, p.dy, p.start_time, p.lifetime
+
+    def step(self, now):
+        progress = self._timed(now)
+        c = self.columns
+        c["x"] += c["vx"]
+        c["y"] += c["vy"]
+        self.radius = (5 + 3 * (1 - progress)).astype(np.int32)
+        self.alpha = np.maximum(0, 255 * (1 - progress))
+        self.color = _lut_index(1 - self.alpha / 255)
+
+    def sprites(self, batch):
+        r, level = self.radius, _levels(self.alpha)
+        self.batch(batch, level > 0, self.columns["x"] - r, self.columns["y"] - r, (r, self.color, level),
+                   lambda r, i, level: atlas.circle_level(r, INFERNO_R[i], level))
+
+
+class WindEmitter(Emitter):
+    particle_cls = WindParticle
+    fields = ("x", "y", "vx", "vy", "start", "life", "phase", "wobble")
+
+    def row(self, p):
+        return p.x, p.y, p.dx, p.dy, p.start_time, p.lifetime, p.phase, p.wobble_amplitude
+
+    def step(self, now):
+        progress = self._timed(now)
+        c = self.columns
+        angle = progress * 6 + c["phase"]
+        c["x"] += c["vx"] + np.sin(angle) * c["wobble"] * 0.1
+        c["y"] += c["vy"] + np.cos(angle) * c["wobble"] * 0.1
+        self.radius = np.maximum(1, (6 + 4 * (1 - progress)).astype(np.int32))
+        self.alpha = np.maximum(0, (200 * (1 - progress)).astype(np.int32))
+
+    def sprites(self, batch):
+        r, level = self.radius, _levels(self.alpha)
+        self.batch(batch, level > 0, self.columns["x"] - r, self.columns["y"] - r, (r, level),
+                   lambda r, level: atlas.circle_level(r, (180, 220, 255), level))
+
+
+class SelectedEmitter(Emitter):
+    """Frame-counted rising beams around a selected tile."""
+
+    particle_cls = SelectedParticle
+    fields = ("x", "y", "vx", "vy", "frames", "alpha0", "color")
+    COLORS = [(200, 255, 255), (180, 220, 255)]
+
+    def row(self, p):
+        color = self.COLORS.index(p.stroke_color) if p.stroke_color in self.COLORS else 0
+        return p.x, p.y, p.vx, p.vy, p.lifetime, p.initial_alpha, color
+
+    def step(self, now):
+        c = self.columns
+        c["x"] += c["vx"]
+        c["y"] += c["vy"]
+        c["frames"] -= 1
+        self.keep(c["frames"] > 0)
+        self.alpha = (self.columns["alpha0"] * (self.columns["frames"] / 60)).astype(np.int32)
+
+    def sprites(self, batch):
+        c = self.columns
+        self.batch(batch, self.alpha > 0, c["x"] - 1, c["y"] - 1, (c["color"], _levels(self.alpha)),
+                   lambda color, level: atlas.beam_level(self.COLORS[color], level))
+
+
+def _perimeter_point(c, pos):
+    """Point on each emitter rect's perimeter plus its outward normal (top, right, bottom, left)."""
+    x, y, w, h = c["rect_x"], c["rect_y"], c["w"], c["h"]
+    edges = [pos < w, pos < w + h, pos < w + h + w]
+    px = np.select(edges, [x + pos, x + w, x + w - (pos - w - h)], x)
+    py = np.select(edges, [y, y + (pos - w), y + h], y + h - (pos - 2 * w - h))
+    nx = np.select(edges, [0.0, 1.0, 0.0], -1.0)
+    ny = np.select(edges, [-1.0, 0.0, 1.0], 0.0)
+    return px, py, nx, ny
+
+
+class SelectedBEmitter(Emitter):
+    """Frame-counted dots running round a tile's outline (hints, Cerberus)."""
+
+    particle_cls = SelectedParticle_B
+    fields = ("rect_x", "rect_y", "w", "h", "pos", "speed", "frames", "color")
+    COLORS = [(255, 255, 100), (255, 200, 240), (180, 220, 255)]
+    perimeter = True
+
+    def row(self, p):
+        color = self.COLORS.index(p.stroke_color) if p.stroke_color in self.COLORS else 0
+        return p.rect_x, p.rect_y, p.width, p.height, p.perimeter_pos, p.speed, p.lifetime, color
+
+    def step(self, now):
+        c = self.columns
+        c["pos"] = (c["pos"] + c["speed"]) % (2 * (c["w"] + c["h"]))
+        c["frames"] -= 1
+        self.keep(c["frames"] > 0)
+
+    def sprites(self, batch):
+        c = self.columns
+        px, py, _, _ = _perimeter_point(c, c["pos"])
+        self.batch(batch, None, px - 2, py - 2, (c["color"],),
+                   lambda color: atlas.circle_level(2, self.COLORS[color], atlas.levels - 1))
+
+
+class SelectedFireEmitter(Emitter):
+    """Inferno-coloured flames tracing a tile's outline and licking outward."""
+
+    particle_cls = SelectedParticle_Fire
+    fields = ("rect_x", "rect_y", "w", "h", "pos", "speed", "start", "life",
+              "base_radius", "max_drift", "jitter")
+    perimeter = True
+
+    def row(self, p):
+        return (p.rect_x, p.rect_y, p.width, p.height, p.perimeter_pos, p.speed, p.start_time,
+                p.lifetime_ms, p.base_radius, p.max_perp_drift, p.jitter)
+
+    def step(self, now):
+        c = self.columns
+        self.keep(now - c["start"] < c["life"])
+        c = self.columns
+        progress = np.clip((now - c["start"]) / c["life"], 0.0, 1.0)
+        c["pos"] = (c["pos"] + c["speed"]) % (2 * (c["w"] + c["h"]))
+        self.color = _lut_index(progress)
+        self.alpha = (255 * (1.0 - progress)).astype(np.int32)
+
+    def sprites(self, batch):
+        c = self.columns
+        px, py, nx, ny = _perimeter_point(c, c["pos"])
+        phase = c["pos"] * 0.025
+        wobble = (np.sin(phase) + np.cos(1.37 * phase)) * 0.5
+        t = 1.0 - self.alpha / 255.0
+        drift = c["max_drift"] * (0.35 + 0.65 * t)
+        x = px + nx * drift + wobble * c["jitter"]
+        y = py + ny * drift + wobble * c["jitter"]
+        radius = np.maximum(2, (c["base_radius"] + 2 * (1.0 - np.abs(2 * t - 1.0))).astype(np.int32))
+        level = _levels(self.alpha)
+        self.batch(batch, level > 0, x - radius, y - radius, (radius, self.color, level),
+                   lambda r, i, level: atlas.circle_level(r, INFERNO_R[i], level))
+
+
+class FuseEmitter(Emitter):
+    """Sparks from the combo fuse; each keeps the gradient colour it was emitted with."""
+
+    particle_cls = FuseParticle
+    fields = ("x", "y", "vx", "vy", "alpha", "radius", "r", "g", "b")
+
+    def row(self, p):
+        return (p.x, p.y, p.vx, p.vy, p.alpha, p.radius) + tuple(p.color[:3])
+
+    def step(self, now):
+        c = self.columns
+        c["x"] += c["vx"]
+        c["y"] += c["vy"]
+        c["alpha"] -= 5
+        self.keep(c["alpha"] > 0)
+
+    def sprites(self, batch):
+        c = self.columns
+        self.batch(batch, None, c["x"], c["y"], (c["radius"], c["r"], c["g"], c["b"], _levels(c["alpha"])),
+                   lambda r, red, green, blue, level: atlas.circle_level(r, (red, green, blue), level))
+
+
+EMITTERS = (SmokeEmitter, SparkleEmitter, FireEmitter, WindEmitter, SelectedEmitter,
+            SelectedBEmitter, SelectedFireEmitter, FuseEmitter)
+
+
+class ParticleSystem:
+    """
+    Drop-in replacement for the game's particle lists.
+
+    append(SomeParticle(...)) routes the new particle to its type's
+    Emitter, where it is updated, culled and drawn together with the rest
+    of its kind; a `tag` attribute set on the particle before appending
+    is kept (remove_tag() drops them all). Particle types without an
+    emitter, and everything when NumPy is missing, run through their own
+    update() and sprite(). Either way the frame's particles go out in a
+    single Surface.blits() call.
+    """
+
+    available = np is not None
+
+    def __init__(self):
+        self.emitters = {}
+        if self.available:
+            self.emitters = {cls.particle_cls: cls() for cls in EMITTERS}
+        self.objects = []  # particles handled one by one
+        self.tags = {None: 0}
+
+    def append(self, particle):
+        emitter = self.emitters.get(type(particle))
+        if emitter is None:
+            self.objects.append(particle)
+            return
+        tag = getattr(particle, "tag", None)
+        emitter.spawn(particle, self.tags.setdefault(tag, len(self.tags)))
+
+    def __len__(self):
+        return len(self.objects) + sum(len(e) for e in self.emitters.values())
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def remove_tag(self, tag):
+        self.objects = [p for p in self.objects if getattr(p, "tag", None) != tag]
+        if tag in self.tags:
+            for emitter in self.emitters.values():
+                emitter.remove_tag(self.tags[tag])
+
+    def clear(self):
+        self.objects = []
+        for emitter in self.emitters.values():
+            emitter.clear()
+
+    def limit(self, cap):
+        """Drop the oldest particles of every type until at most cap remain (None = no limit)."""
+        total = len(self)
+        if cap is None or total <= cap:
+            return
+        share = cap / total
+        for emitter in self.emitters.values():
+            emitter.trim(int(len(emitter) * share))
+        self.objects = self.objects[len(self.objects) - int(len(self.objects) * share):]
+
+    def update_and_draw(self, surface, now=None):
+        """Advance every particle one frame, drop the dead ones and draw the rest in one blits() call."""
+        now = pygame.time.get_ticks() if now is None else now
+        batch = []
+        for emitter in self.emitters.values():
+            emitter.flush()
+            if len(emitter):
+                emitter.step(now)
+                emitter.sprites(batch)
+        alive = []
+        for p in self.objects:
+            alive_flag = p.update()
+            if alive_flag is None:  # FuseParticle.update() returns nothing; it lives while visible
+                alive_flag = p.alpha > 0
+            if not alive_flag:
+                continue
+            alive.append(p)
+            if hasattr(p, "sprite"):
+                item = p.sprite()
+                if item:
+                    batch.append(item)
+            else:
+                p.draw(surface)
+        self.objects = alive
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    def dirty_regions(self, margin=24):
+        """(x, y, w, h) boxes covering every live particle (margin px around point particles)."""
+        regions = []
+        for emitter in self.emitters.values():
+            if not len(emitter.columns["tag"]):
+                continue
+            if emitter.perimeter:  # perimeter emitters drift a few px outside their rect
+                regions.extend((x - 16, y - 16, w + 32, h + 32) for x, y, w, h in emitter.rects().tolist())
+            else:
+                regions.extend((x - margin, y - margin, margin * 2, margin * 2)
+                               for x, y in emitter.points().tolist())
+        for p in self.objects:
+            if hasattr(p, "rect_x"):
+                regions.append((p.rect_x - 16, p.rect_y - 16, p.width + 32, p.height + 32))
+            else:
+                regions.append((p.x - margin, p.y - margin, margin * 2, margin * 2))
+        return regions
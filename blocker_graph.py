@@ -0,0 +1,86 @@
+# blocker_graph.py
+
+
+def _blockers_of(cell):
+    gx, gy, gz = cell
+    return ((gx, gy, gz + 1), (gx - 1, gy, gz), (gx + 1, gy, gz))
+
+
+def _dependents_of(cell):
+    gx, gy, gz = cell
+    return ((gx, gy, gz - 1), (gx + 1, gy, gz), (gx - 1, gy, gz))
+
+
+class BlockerGraph:
+    """
+    Blocking DAG over board cells.
+
+    A cell is blocked by the cell above it and by its left/right neighbours;
+    in turn it blocks the cell below it and its two neighbours. Both lists
+    are precomputed for the layout positions from build_centered_pyramid_layout
+    and added lazily for any other cell an encounter moves a tile into.
+
+    Occupying or vacating a cell adjusts two counters on its dependents
+    (covered-from-above, occupied sides), so freedom is a counter check:
+    nothing above and fewer than two blocked sides.
+    """
+
+    def __init__(self):
+        self.blocked_by = {}  # cell -> (above, left, right)
+        self.blocks = {}      # cell -> (below, right neighbour, left neighbour)
+        self.covered = {}     # cell -> 1 if the cell above is occupied
+        self.sides = {}       # cell -> number of occupied left/right neighbours
+
+    def prepare(self, positions):
+        """Precompute blocker/dependent lists for a layout's positions."""
+        for cell in positions:
+            self._edges(cell)
+
+    def _edges(self, cell):
+        deps = self.blocks.get(cell)
+        if deps is None:
+            deps = self.blocks[cell] = _dependents_of(cell)
+            self.blocked_by[cell] = _blockers_of(cell)
+        return deps
+
+    def clear(self):
+        """Forget the layout: both adjacency tables and the counters."""
+        self.blocked_by.clear()
+        self.blocks.clear()
+        self.reset_counts()
+
+    def reset_counts(self):
+        self.covered.clear()
+        self.sides.clear()
+
+    def rebuild(self, cells):
+        """Recount occupancy for cells, keeping the adjacency tables."""
+        self.reset_counts()
+        for cell in cells:
+            self.occupy(cell)
+
+    def occupy(self, cell):
+        below, right_of, left_of = self._edges(cell)
+        covered, sides = self.covered, self.sides
+        covered[below] = covered.get(below, 0) + 1
+        sides[right_of] = sides.get(right_of, 0) + 1
+        sides[left_of] = sides.get(left_of, 0) + 1
+
+    def vacate(self, cell):
+        below, right_of, left_of = self._edges(cell)
+        covered, sides = self.covered, self.sides
+        covered[below] -= 1
+        sides[right_of] -= 1
+        sides[left_of] -= 1
+
+    def dependents(self, cell):
+        """Cells whose freedom can change when cell is occupied/vacated."""
+        return self._edges(cell)
+
+    def blockers(self, cell, occupied):
+        """The cells in occupied that keep cell from being free (above, left, right)."""
+        self._edges(cell)
+        return [c for c in self.blocked_by[cell] if c in occupied]
+
+    def is_free(self, cell):
+        return not self.covered.get(cell, 0) and self.sides.get(cell, 0) < 2
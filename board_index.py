@@ -0,0 +1,283 @@
+# board_index.py
+import functools
+from collections import Counter
+
+from blocker_graph import BlockerGraph
+from occupancy_grid import OccupancyGrid
+from tile import Tile
+
+
+def _z(tile):
+    return tile.z
+
+
+def _remove_from(tiles, tile):
+    try:
+        tiles.remove(tile)  # Tile equality is identity
+    except ValueError:
+        return False
+    return True
+
+
+def memoize_per_generation(method):
+    """
+    Cache a no-argument MahjongGame query until board_index.generation or the
+    game's selection_rules (selectability overrides such as Cerberus) change.
+    Cached containers are shared between callers, so treat them as read-only.
+    """
+    attr = "_memo_" + method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        key = (self.board_index.generation, getattr(self, "selection_rules", None))
+        cached = getattr(self, attr, None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = method(self)
+        setattr(self, attr, (key, value))
+        return value
+
+    return wrapper
+
+
+class BoardIndex:
+    """
+    Stack-indexed view of the board.
+
+    Keeps one bottom→top sorted stack per (grid_x, grid_y), the occupied
+    (grid_x, grid_y, z) cells and a name → tiles map, so board queries don't
+    have to walk every tile. MahjongGame keeps it in sync on the same code
+    paths that update tile_positions.
+
+    Also tracks which tiles are selectable (nothing on top, one free side)
+    and how many selectable pairs exist per name. Freedom comes from the
+    BlockerGraph counters; a change at a cell can only flip the cell itself
+    and its dependents (side neighbours, the cell below), so those are the
+    only cells re-checked.
+
+    generation goes up on every mutation (and on touch() for pixel-only
+    moves); derived queries are cached against it.
+
+    When numpy is available an OccupancyGrid mirrors the cells so bulk
+    work (rebuilds, fog, per-type counts) runs vectorized.
+    """
+
+    def __init__(self):
+        self.stacks = {}   # (gx, gy) -> [tile, ...] sorted by z, bottom first
+        self.cells = {}    # (gx, gy, gz) -> tile
+        self.by_name = {}  # name -> [tile, ...]
+        self.selectable = {}  # id(tile) -> tile
+        self.selectable_names = Counter()
+        self.pair_count = 0
+        self.generation = 0
+        self.grid = OccupancyGrid() if OccupancyGrid.available else None
+        self.blockers = BlockerGraph()
+
+    def __len__(self):
+        return len(self.cells)
+
+    def touch(self):
+        """Mark the board changed without touching the index (animation steps)."""
+        self.generation += 1
+
+    def clear(self):
+        """Empty the index and forget the layout's blocking edges (new board)."""
+        self._reset()
+        self.blockers.clear()
+
+    def _reset(self):
+        self.generation += 1
+        self.stacks.clear()
+        self.cells.clear()
+        self.by_name.clear()
+        self.selectable.clear()
+        self.selectable_names.clear()
+        self.pair_count = 0
+        self.blockers.reset_counts()
+        if self.grid is not None:
+            self.grid.rebuild(self.cells)
+
+    def prepare_layout(self, positions):
+        """Precompute blocking edges for a freshly built layout."""
+        self.blockers.prepare(positions)
+
+    def rebuild(self, board):
+        """Re-index the whole board (after encounters / bulk moves)."""
+        self._reset()
+        for tile in board:
+            key = (tile.grid_x, tile.grid_y)
+            self.stacks.setdefault(key, []).append(tile)
+            self.cells[(tile.grid_x, tile.grid_y, tile.z)] = tile
+            self.by_name.setdefault(tile.name, []).append(tile)
+        for stack in self.stacks.values():
+            stack.sort(key=_z)
+        self.blockers.rebuild(self.cells)
+        if self.grid is None:
+            for tile in board:
+                self._set_selectable(tile, self.blockers.is_free((tile.grid_x, tile.grid_y, tile.z)))
+            return
+        self.grid.rebuild(self.cells)
+        for gx, gy, gz in self.grid.selectable_cells():
+            for tile in self.stacks[(gx, gy)]:
+                if tile.z == gz:
+                    self._set_selectable(tile, True)
+
+    def add(self, tile):
+        self.generation += 1
+        key = (tile.grid_x, tile.grid_y)
+        stack = self.stacks.setdefault(key, [])
+        stack.append(tile)
+        if len(stack) > 1 and stack[-2].z > tile.z:
+            stack.sort(key=_z)
+        self._set_cell((key[0], key[1], tile.z), tile)
+        self.by_name.setdefault(tile.name, []).append(tile)
+        self._refresh_around(key[0], key[1], tile.z)
+
+    def remove(self, tile):
+        self.generation += 1
+        key = (tile.grid_x, tile.grid_y)
+        stack = self.stacks.get(key)
+        if stack is not None and _remove_from(stack, tile) and not stack:
+            del self.stacks[key]
+        cell = (key[0], key[1], tile.z)
+        if self.cells.get(cell) is tile:
+            self._del_cell(cell)
+            # Two tiles sharing a cell (encounter collisions): hand it to the survivor
+            for other in self.stacks.get(key, ()):
+                if other.z == tile.z:
+                    self._set_cell(cell, other)
+                    break
+        named = self.by_name.get(tile.name)
+        if named is not None and _remove_from(named, tile) and not named:
+            del self.by_name[tile.name]
+        self._set_selectable(tile, False)
+        self._refresh_around(*cell)
+
+    def restack(self, key, new_order):
+        """
+        Rewrite the stack at key bottom→top as new_order (z = 0..n-1).
+        Tiles in new_order must already belong to this stack.
+        """
+        self.generation += 1
+        gx, gy = key
+        old = self.stacks.get(key, ())
+        height = max(len(old), len(new_order))
+        for tile in old:
+            cell = (gx, gy, tile.z)
+            if self.cells.get(cell) is tile:
+                self._del_cell(cell)
+            height = max(height, tile.z + 1)
+            self._set_selectable(tile, False)
+        for z, tile in enumerate(new_order):
+            tile.z = z
+            self._set_cell((gx, gy, z), tile)
+        if new_order:
+            self.stacks[key] = list(new_order)
+        else:
+            self.stacks.pop(key, None)
+        for z in range(height):
+            self._refresh_around(gx, gy, z)
+
+    def _set_cell(self, cell, tile):
+        if cell not in self.cells:
+            self.blockers.occupy(cell)
+        self.cells[cell] = tile
+        if self.grid is not None:
+            self.grid.set(*cell, tile.type_id)
+
+    def _del_cell(self, cell):
+        del self.cells[cell]
+        self.blockers.vacate(cell)
+        if self.grid is not None:
+            self.grid.clear(*cell)
+
+    # ── Selectable tracking ────────────────────────────────────────────────
+    def _set_selectable(self, tile, flag):
+        key = id(tile)
+        if flag == (key in self.selectable):
+            return
+        name = tile.name
+        count = self.selectable_names[name]
+        self.pair_count -= count // 2
+        if flag:
+            self.selectable[key] = tile
+            count += 1
+        else:
+            del self.selectable[key]
+            count -= 1
+        self.pair_count += count // 2
+        if count:
+            self.selectable_names[name] = count
+        else:
+            del self.selectable_names[name]
+
+    def _refresh(self, cell):
+        if cell not in self.cells:
+            return
+        gx, gy, gz = cell
+        free = self.blockers.is_free(cell)
+        for tile in self.stacks.get((gx, gy), ()):
+            if tile.z == gz:
+                self._set_selectable(tile, free)
+
+    def _refresh_around(self, gx, gy, gz):
+        cell = (gx, gy, gz)
+        self._refresh(cell)
+        for dependent in self.blockers.dependents(cell):
+            self._refresh(dependent)
+
+    # ── Queries ────────────────────────────────────────────────────────────
+    def stack(self, gx, gy):
+        """Tiles at (gx, gy), bottom→top. Treat the returned list as read-only."""
+        return self.stacks.get((gx, gy), ())
+
+    def top(self, gx, gy):
+        stack = self.stacks.get((gx, gy))
+        return stack[-1] if stack else None
+
+    def top_tiles(self):
+        """(gx, gy) -> topmost tile of that stack."""
+        return {key: stack[-1] for key, stack in self.stacks.items()}
+
+    def stack_keys(self):
+        return self.stacks.keys()
+
+    def is_top(self, tile):
+        stack = self.stacks.get((tile.grid_x, tile.grid_y))
+        return not stack or stack[-1].z <= tile.z
+
+    def at(self, gx, gy, gz):
+        return self.cells.get((gx, gy, gz))
+
+    def occupied(self, gx, gy, gz):
+        return (gx, gy, gz) in self.cells
+
+    def tiles_named(self, name):
+        return self.by_name.get(name, ())
+
+    def is_selectable(self, tile):
+        return id(tile) in self.selectable
+
+    def blockers_of(self, tile):
+        """Tiles keeping tile from being free: the one above, then left/right neighbours."""
+        cells = self.cells
+        return [cells[c] for c in self.blockers.blockers((tile.grid_x, tile.grid_y, tile.z), cells)]
+
+    def selectable_tiles(self):
+        return list(self.selectable.values())
+
+    def selectable_cells(self):
+        """Set of (gx, gy, gz) cells holding a selectable tile."""
+        if self.grid is not None:
+            return set(self.grid.selectable_cells())
+        return {(t.grid_x, t.grid_y, t.z) for t in self.selectable.values()}
+
+    def selectable_type_counts(self):
+        """Selectable tiles per Tile.type_id (index with tile.type_id)."""
+        size = Tile.type_count()
+        if self.grid is not None:
+            return self.grid.type_counts(self.grid.selectable_mask(), minlength=size)
+        counts = [0] * size
+        for tile in self.selectable.values():
+            counts[tile.type_id] += 1
+        return counts
@@ -0,0 +1,56 @@
+# board_journal.py
+from collections import deque, namedtuple
+
+# kind: "add" | "remove" | "move" | "rename" | "reset"
+# old/new: (gx, gy, gz) cells for add/remove/move, names for rename, None for reset
+BoardChange = namedtuple("BoardChange", "kind tile old new")
+
+
+class BoardJournal:
+    """
+    Recent board changes and the consumers that want to hear about them.
+
+    MahjongGame's mutation API (move_tiles, remove_tile, reorder_stack,
+    rename_tiles, clear_board, replace_board) publishes one batch per call;
+    subscribers get the batch and can update only the positions it names,
+    and the last maxlen changes stay in entries. A "reset" change means the
+    whole board was cleared or replaced.
+    """
+
+    def __init__(self, maxlen=512):
+        self.entries = deque(maxlen=maxlen)  # (generation, BoardChange), oldest first
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def publish(self, generation, changes):
+        if not changes:
+            return
+        for change in changes:
+            self.entries.append((generation, change))
+        for callback in list(self.subscribers):
+            callback(changes)
+
+    @staticmethod
+    def touched_cells(changes):
+        """Every cell a batch vacated or filled; None if the batch contains a reset."""
+        cells = set()
+        for change in changes:
+            if change.kind == "reset":
+                return None
+            if change.kind == "rename":
+                tile = change.tile
+                cells.add((tile.grid_x, tile.grid_y, tile.z))
+                continue
+            if change.old is not None:
+                cells.add(change.old)
+            if change.new is not None:
+                cells.add(change.new)
+        return cells
@@ -0,0 +1,50 @@
+# board_layer.py
+import pygame
+
+
+class BoardLayer:
+    """
+    Cached render of the settled board (shadows + topmost static tiles).
+
+    The layer is redrawn only when the board changes (journal batch), when
+    the set of animating/fading tiles changes, or when the tileset is
+    reloaded; every other frame is a single blit. Animating, fading and
+    newly exposed tiles are drawn on top of it each frame as before.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.surface = None
+        self.dirty = True
+        self.signature = None
+        self.top_tiles = []  # tiles drawn into the layer, bottom to top
+        game.board_journal.subscribe(self.invalidate)
+
+    def invalidate(self, changes=None):
+        self.dirty = True
+
+    def _signature(self):
+        game = self.game
+        return (
+            frozenset(game.animations.ids),
+            frozenset(t.uid for t in getattr(game, "fading_matched_tiles", [])),
+            getattr(game, "offset_x", 0),
+            getattr(game, "offset_y", 0),
+        )
+
+    def _render(self, size):
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self.game.draw_tile_shadows(self.surface)
+        self.top_tiles = self.game.draw_top_static_tiles(self.surface)
+
+    def is_stale(self):
+        return self.dirty or self.surface is None or self._signature() != self.signature
+
+    def draw(self, target):
+        if self.is_stale():
+            self._render(target.get_size())
+            self.signature = self._signature()
+            self.dirty = False
+        target.blit(self.surface, (0, 0))
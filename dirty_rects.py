@@ -0,0 +1,89 @@
+# dirty_rects.py
+import pygame
+
+
+class DirtyRects:
+    """
+    Per-frame record of the screen regions the draw stages touched.
+
+    Regions are snapped to a coarse cell grid so overlapping stages merge for
+    free. A frame's dirty area is what it drew plus what the previous frame
+    drew (which has to be erased); past FULL_FRAME_RATIO of the screen it is
+    cheaper to treat the frame as full.
+    """
+
+    CELL = 50
+    FULL_FRAME_RATIO = 0.5
+
+    def __init__(self, size):
+        self.resize(size)
+
+    def resize(self, size):
+        self.width, self.height = size
+        self.cols = -(-self.width // self.CELL)
+        self.rows = -(-self.height // self.CELL)
+        self.current = set()   # (col, row) cells drawn this frame
+        self.previous = set()  # cells drawn last frame
+        self.full = True
+
+    def invalidate(self):
+        """Force the next presented frame to cover the whole screen."""
+        self.full = True
+
+    def add(self, rect):
+        if rect is None:
+            return
+        x, y, w, h = rect
+        if w <= 0 or h <= 0:
+            return
+        c = self.CELL
+        c0, c1 = max(0, int(x) // c), min(self.cols - 1, int(x + w) // c)
+        r0, r1 = max(0, int(y) // c), min(self.rows - 1, int(y + h) // c)
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                self.current.add((col, row))
+
+    def add_points(self, points, margin):
+        """Mark a margin-sized box around every (x, y) point."""
+        size = margin * 2
+        for x, y in points:
+            self.add((x - margin, y - margin, size, size))
+
+    def previous_rects(self):
+        """Regions last frame drew over, to be restored before drawing this one."""
+        return self._rects(self.previous)
+
+    def end_frame(self):
+        """Rects to present for this frame, or None for the whole screen."""
+        cells = self.current | self.previous
+        full = self.full or len(cells) > self.FULL_FRAME_RATIO * self.cols * self.rows
+        self.previous, self.current = self.current, set()
+        self.full = False
+        return None if full else self._rects(cells)
+
+    def _rects(self, cells):
+        """Merge cells into horizontal runs, then stack equal runs vertically."""
+        c = self.CELL
+        runs = {}  # (col0, col1) -> [row, ...]
+        for row in range(self.rows):
+            col = 0
+            while col < self.cols:
+                if (col, row) not in cells:
+                    col += 1
+                    continue
+                start = col
+                while col < self.cols and (col, row) in cells:
+                    col += 1
+                runs.setdefault((start, col), []).append(row)
+        rects = []
+        bounds = pygame.Rect(0, 0, self.width, self.height)
+        for (col0, col1), rows in runs.items():
+            top = prev = rows[0]
+            for row in rows[1:] + [None]:
+                if row is not None and row == prev + 1:
+                    prev = row
+                    continue
+                rects.append(pygame.Rect(col0 * c, top * c, (col1 - col0) * c, (prev - top + 1) * c).clip(bounds))
+                if row is not None:
+                    top = prev = row
+        return rects
@@ -19,29 +19,23 @@ class EncounterEngine:
 
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
+                moves = []
                 for tile in ctx.animating_tiles:
-                    tile.update({
-                        "x": tile["target_x"],
-                        "y": tile["target_y"],
-                        "grid_x": tile["target_grid_x"],
-                        "grid_y": tile["target_grid_y"],
-                        "z": tile["target_z"],
-                        "alpha": 255
-                    })
-                    tile.pop("fading", None)
-
-                ctx.rebuild_tile_positions()
+                    tween = ctx.animations.get(tile)
+                    moves.append((tile, tween.target_cell, tween.target_pos))
+
+                ctx.animations.finish(ctx.animating_tiles)
+                ctx.move_tiles(moves)
                 ctx.animating_tiles = []
                 ctx.update_canvas()
                 return
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in ctx.animating_tiles:
-                tile["x"] = tile["start_x"] + (tile["target_x"] - tile["start_x"]) * progress
-                tile["y"] = tile["start_y"] + (tile["target_y"] - tile["start_y"]) * progress
-                tile["alpha"] = 255  # Optional: can also fade or style drop differently
+                tile.x, tile.y = ctx.animations.get(tile).position_at(progress)
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
@@ -55,28 +49,23 @@ class EncounterEngine:
 
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
+                moves = []
                 for tile in tiles:
-                    tile.update({
-                        "x": tile["target_x"],
-                        "y": tile["target_y"],
-                        "grid_x": tile["target_grid_x"],
-                        "grid_y": tile["target_grid_y"],
-                        "z": tile["target_z"],
-                        "alpha": 255
-                    })
-                    tile.pop("fading", None)
-
-                ctx.rebuild_tile_positions()
+                    tween = ctx.animations.get(tile)
+                    moves.append((tile, tween.target_cell, tween.target_pos))
+
+                ctx.animations.finish(tiles)
+                ctx.move_tiles(moves)
                 ctx.animating_tiles = []
                 ctx.update_canvas()
                 return
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in tiles:
-                tile["x"] = tile["start_x"] + (tile["target_x"] - tile["start_x"]) * progress
-                tile["y"] = tile["start_y"] + (tile["target_y"] - tile["start_y"]) * progress
+                tile.x, tile.y = ctx.animations.get(tile).position_at(progress)
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
@@ -90,31 +79,27 @@ class EncounterEngine:
 
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
+                moves = []
                 for tile in ctx.animating_tiles:
-                    tile.update({
-                        "x": tile["target_x"],
-                        "y": tile["target_y"],
-                        "grid_x": tile["target_grid_x"],
-                        "grid_y": tile["target_grid_y"],
-                        "z": tile["target_z"],
-                        "alpha": 255
-                    })
-                    tile.pop("fading", None)
-
-                ctx.rebuild_tile_positions()
+                    tween = ctx.animations.get(tile)
+                    moves.append((tile, tween.target_cell, tween.target_pos))
+
+                ctx.animations.finish(ctx.animating_tiles)
+                ctx.move_tiles(moves)
                 ctx.animating_tiles = []
                 ctx.update_canvas()
                 return
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in ctx.animating_tiles:
-                tile["x"] = tile["start_x"] + (tile["target_x"] - tile["start_x"]) * progress
-                tile["y"] = tile["start_y"] + (tile["target_y"] - tile["start_y"]) * progress
+                tween = ctx.animations.get(tile)
+                tile.x, tile.y = tween.position_at(progress)
 
-                if tile.get("fading"):
-                    tile["alpha"] = int(255 * (1 - 2 * progress)) if progress <= 0.5 else int(255 * (2 * progress - 1))
+                if tween.fading:
+                    tween.alpha = int(255 * (1 - 2 * progress)) if progress <= 0.5 else int(255 * (2 * progress - 1))
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
@@ -128,32 +113,26 @@ class EncounterEngine:
 
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
+                moves = []
                 for tile in ctx.animating_tiles:
-                    tile["x"] = tile["target_x"]
-                    tile["y"] = tile.get("target_y", tile["y"])
-                    tile["grid_x"] = tile["target_grid_x"]  # ✅ properly update here
-                    tile["grid_y"] = tile.get("target_grid_y", tile["grid_y"])
-                    tile["alpha"] = 255
-                    tile.pop("fading", None)
-
-                ctx.rebuild_tile_positions()
+                    tween = ctx.animations.get(tile)
+                    moves.append((tile, tween.target_cell, tween.target_pos))
+
+                ctx.animations.finish(ctx.animating_tiles)
+                ctx.move_tiles(moves)
                 ctx.animating_tiles = []
                 return
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in ctx.animating_tiles:
-                sx = tile.get("start_x", tile["x"])
-                tx = tile.get("target_x", tile["x"])
-                tile["x"] = sx + (tx - sx) * progress
+                tween = ctx.animations.get(tile)
+                tile.x, tile.y = tween.position_at(progress)
 
-                sy = tile.get("start_y", tile["y"])
-                ty = tile.get("target_y", tile.get("y", sy))
-                tile["y"] = sy + (ty - sy) * progress
-
-                if tile.get("fading"):
-                    tile["alpha"] = int(80 + (255 - 80) * progress)
+                if tween.fading:
+                    tween.alpha = int(80 + (255 - 80) * progress)
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
@@ -167,29 +146,28 @@ class EncounterEngine:
 
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
+                moves = []
                 for tile in ctx.animating_tiles:
-                    tile.update({
-                        "y": tile["target_y"],
-                        "grid_y": tile["target_grid_y"],
-                        "z": tile["target_z"],
-                        "alpha": 255
-                    })
-                    tile.pop("flicker", None)
-
-                ctx.rebuild_tile_positions()
+                    tween = ctx.animations.get(tile)
+                    moves.append((tile, tween.target_cell, tween.target_pos))
+
+                ctx.animations.finish(ctx.animating_tiles)
+                ctx.move_tiles(moves)
                 ctx.animating_tiles = []
                 ctx.update_canvas()
                 return
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in ctx.animating_tiles:
-                tile["y"] = tile["start_y"] + (tile["target_y"] - tile["start_y"]) * progress
+                tween = ctx.animations.get(tile)
+                tile.x, tile.y = tween.position_at(progress)
 
-                if tile.get("flicker"):
+                if tween.flicker and ctx.governor.allows("glow"):
                     flicker_phase = (ctx.animation_step % 4) / 4
-                    tile["alpha"] = int(180 + 75 * (0.5 + 0.5 * math.sin(2 * math.pi * flicker_phase)))
+                    tween.alpha = int(180 + 75 * (0.5 + 0.5 * math.sin(2 * math.pi * flicker_phase)))
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
@@ -198,9 +176,6 @@ class EncounterEngine:
     def animate_wind_shift(self, tiles, new_positions, steps=12, interval=30):
         ctx = self.context
 
-        if not hasattr(ctx, "particles"):
-            ctx.particles = []
-
         ctx.animation_step = 0
         ctx.animation_steps = steps
         ctx.animating_tiles = tiles
@@ -210,7 +185,7 @@ class EncounterEngine:
             for (gx, gy, gz) in ctx.tile_positions
             if not any((gx, gy, gz + 1) in ctx.tile_positions for gz in range(10))
         )
-        post_top = {(t["target_grid_x"], t["target_grid_y"]) for t in tiles}
+        post_top = {ctx.animations.get(t).target_cell[:2] for t in tiles}
         newly_exposed = post_top - pre_top
 
         for tile in ctx.board:
@@ -222,20 +197,14 @@ class EncounterEngine:
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
                 for tile in ctx.animating_tiles:
-                    tile.update({
-                        "x": tile["target_x"],
-                        "y": tile["target_y"],
-                        "grid_x": tile["target_grid_x"],
-                        "grid_y": tile["target_grid_y"],
-                        "z": tile["target_z"],
-                        "alpha": 255
-                    })
-                    tile.pop("fading", None)
+                    tween = ctx.animations.get(tile)
+                    tile.x, tile.y = tween.target_pos
+                    tile.grid_x, tile.grid_y, tile.z = tween.target_cell
                     tile.pop("will_become_exposed", None)
-                    new_positions[(tile["grid_x"], tile["grid_y"], tile["z"])] = tile
+                    new_positions[(tile.grid_x, tile.grid_y, tile.z)] = tile
 
-                ctx.board = list(new_positions.values())
-                ctx.tile_positions = new_positions
+                ctx.animations.finish(ctx.animating_tiles)
+                ctx.replace_board(list(new_positions.values()))
                 ctx.animating_tiles = []
                 ctx.update_canvas()
                 del ctx._vacated_during_animation
@@ -243,18 +212,20 @@ class EncounterEngine:
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in ctx.animating_tiles:
-                tile["x"] = tile["start_x"] + (tile["target_x"] - tile["start_x"]) * progress
-                tile["y"] = tile["start_y"] + (tile["target_y"] - tile["start_y"]) * progress
+                tween = ctx.animations.get(tile)
+                tile.x, tile.y = tween.position_at(progress)
 
-                if tile.get("fading"):
-                    tile["alpha"] = int(200 + 55 * math.sin(progress * math.pi))
+                if tween.fading:
+                    tween.alpha = int(200 + 55 * math.sin(progress * math.pi))
 
                 if ctx.animation_step % 2 == 0:
-                    px = tile["x"] + TILE_WIDTH // 2 + random.randint(-4, 4)
-                    py = tile["y"] + TILE_HEIGHT // 2 + random.randint(-4, 4)
-                    ctx.particles.append(WindParticle(px, py, direction=ctx.current_wind_direction))
+                    for _ in range(ctx.governor.emit(1)):
+                        px = tile["x"] + TILE_WIDTH // 2 + random.randint(-4, 4)
+                        py = tile["y"] + TILE_HEIGHT // 2 + random.randint(-4, 4)
+                        ctx.particles.append(WindParticle(px, py, direction=ctx.current_wind_direction))
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
@@ -307,15 +278,8 @@ class EncounterEngine:
                             tx, ty, tile["z"], tile_w, tile_h, tile_d, offset_x, offset_y
                         )
 
-                        tile.update({
-                            "start_x": tile["x"],
-                            "start_y": tile["y"],
-                            "target_grid_x": tx,
-                            "target_grid_y": ty,
-                            "target_z": tile["z"],
-                            "target_x": abs_x,
-                            "target_y": abs_y
-                        })
+                        ctx.animations.begin(tile, target_x=abs_x, target_y=abs_y,
+                                             target_grid_x=tx, target_grid_y=ty)
                         animating_tiles.append(tile)
 
         ctx.animation_step = 0
@@ -325,32 +289,25 @@ class EncounterEngine:
         def animate_step():
             if ctx.animation_step >= ctx.animation_steps:
                 for tile in ctx.animating_tiles:
-                    tile.update({
-                        "x": tile["target_x"],
-                        "y": tile["target_y"],
-                        "grid_x": tile["target_grid_x"],
-                        "grid_y": tile["target_grid_y"],
-                        "z": tile["target_z"],
-                        "alpha": 255
-                    })
-                    for k in ["start_x", "start_y", "target_x", "target_y", "target_grid_x", "target_grid_y", "target_z"]:
-                        tile.pop(k, None)
+                    tween = ctx.animations.get(tile)
+                    tile.x, tile.y = tween.target_pos
+                    tile.grid_x, tile.grid_y, tile.z = tween.target_cell
                     new_board.append(tile)
-                    new_positions[(tile["grid_x"], tile["grid_y"], tile["z"])] = tile
+                    new_positions[(tile.grid_x, tile.grid_y, tile.z)] = tile
 
+                ctx.animations.finish(ctx.animating_tiles)
                 ctx.animating_tiles = []
-                ctx.board = new_board
-                ctx.tile_positions = new_positions
+                ctx.replace_board(new_board)
                 ctx.normalize_stacks()
                 ctx.update_canvas()
                 return
 
             progress = (ctx.animation_step + 1) / ctx.animation_steps
             for tile in ctx.animating_tiles:
-                tile["x"] = tile["start_x"] + (tile["target_x"] - tile["start_x"]) * progress
-                tile["y"] = tile["start_y"] + (tile["target_y"] - tile["start_y"]) * progress
+                tile.x, tile.y = ctx.animations.get(tile).position_at(progress)
 
             ctx.animation_step += 1
+            ctx.board_index.touch()
             ctx.update_canvas()
             QTimer.singleShot(interval, animate_step)
 
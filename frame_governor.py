@@ -0,0 +1,91 @@
+# frame_governor.py
+import random
+import time
+
+
+class FrameGovernor:
+    """
+    Keeps update_canvas inside a frame budget by trading visual extras for time.
+
+    Each frame's duration feeds a smoothed average. When it runs over
+    budget_ms the governor steps up one load level: fewer particles are
+    emitted, live particles are capped and optional layers are switched
+    off. After recover_frames frames with real headroom (under
+    RECOVER_RATIO of the budget) it steps back down, one level at a time.
+    Each change is held for HOLD_FRAMES frames so it can take effect.
+    """
+
+    # per level: share of requested particles emitted, live particle cap (None = no cap)
+    EMISSION = (1.0, 0.5, 0.25, 0.1)
+    PARTICLE_CAP = (None, 1500, 600, 250)
+    # optional layer -> first level at which it is skipped
+    OPTIONAL_LAYERS = {
+        "glow": 1,
+        "fog_feather": 1,  # partly covered fogged tiles get the full fog; draw_fog_of_war is off for now
+        "background_scroll": 2,
+    }
+    RECOVER_RATIO = 0.6
+    SMOOTHING = 0.2
+    HOLD_FRAMES = 15
+
+    def __init__(self, budget_ms=16.0, recover_frames=60, debug=False):
+        self.budget_ms = budget_ms
+        self.recover_frames = recover_frames
+        self.debug = debug
+        self.level = 0
+        self.average_ms = 0.0
+        self.calm_frames = 0
+        self.hold = 0
+        self._start = None
+
+    @property
+    def max_level(self):
+        return len(self.EMISSION) - 1
+
+    def begin(self):
+        self._start = time.perf_counter()
+
+    def end(self):
+        if self._start is None:
+            return
+        self.record((time.perf_counter() - self._start) * 1000)
+        self._start = None
+
+    def record(self, frame_ms):
+        """Feed one frame's duration and adjust the load level."""
+        self.average_ms += (frame_ms - self.average_ms) * self.SMOOTHING
+        if self.hold:
+            self.hold -= 1
+        elif self.average_ms > self.budget_ms:
+            self.calm_frames = 0
+            if self.level < self.max_level:
+                self._set_level(self.level + 1)
+        elif self.average_ms < self.budget_ms * self.RECOVER_RATIO and self.level > 0:
+            self.calm_frames += 1
+            if self.calm_frames >= self.recover_frames:
+                self.calm_frames = 0
+                self._set_level(self.level - 1)
+        else:
+            self.calm_frames = 0
+
+    def _set_level(self, level):
+        if self.debug:
+            print(f"[GOVERNOR] Load level {self.level} -> {level} (avg {self.average_ms:.1f} ms, budget {self.budget_ms} ms)")
+        self.level = level
+        self.hold = self.HOLD_FRAMES
+
+    def emit(self, count):
+        """How many of `count` requested particles to actually spawn this frame."""
+        scaled = count * self.EMISSION[self.level]
+        whole = int(scaled)
+        if random.random() < scaled - whole:  # keep the average rate for small counts
+            whole += 1
+        return whole
+
+    @property
+    def particle_cap(self):
+        return self.PARTICLE_CAP[self.level]
+
+    def allows(self, layer):
+        """False while the optional layer is switched off to save time."""
+        return self.level < self.OPTIONAL_LAYERS.get(layer, self.max_level + 1)
@@ -0,0 +1,81 @@
+# game_canvas.py
+import pygame
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QWidget
+
+
+class GameCanvas(QWidget):
+    """
+    Qt widget showing the pygame frame.
+
+    For a 32-bit surface with the usual 0x00RRGGBB layout the widget wraps
+    the surface's own pixel memory in a QImage (no per-frame copy or
+    repacking); present() only schedules repaints of the given regions and
+    paintEvent draws straight from the surface. Other surface formats fall
+    back to uploading the regions through an RGB byte string.
+    """
+
+    def __init__(self, size, parent=None):
+        super().__init__(parent)
+        width, height = size
+        self.setFixedSize(width, height)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.frame = QImage(width, height, QImage.Format_RGB888)
+        self.frame.fill(Qt.black)
+        self.source = None  # surface self.frame currently wraps, if any
+        self._raw = None  # keeps the bytes behind a full-frame QImage alive
+
+    @staticmethod
+    def can_wrap(surface):
+        return surface.get_bitsize() == 32 and surface.get_masks()[:3] == (0xFF0000, 0xFF00, 0xFF)
+
+    def attach(self, surface):
+        """Point the frame image at the surface's pixel buffer."""
+        # Not get_view()/get_buffer(): once their pointer is exported the surface
+        # stays locked for as long as the proxy lives, and every blit into it
+        # fails ("Surfaces must not be locked during blit"). _pixels_address is
+        # the same address without the lock; the surface outlives the QImage
+        # because self.source keeps it referenced.
+        width, height = surface.get_size()
+        self.frame = QImage(sip.voidptr(surface._pixels_address), width, height,
+                            surface.get_pitch(), QImage.Format_RGB32)
+        self.source = surface
+        self._raw = None
+
+    def present(self, surface, rects=None):
+        if surface is self.source or self.can_wrap(surface):
+            if surface is not self.source:
+                self.attach(surface)
+            if rects is None:
+                self.update()
+            for rect in rects or ():
+                self.update(QRect(rect.x, rect.y, rect.w, rect.h))
+            return
+
+        self.source = None
+        if rects is None:
+            self._raw = pygame.image.tostring(surface, "RGB")
+            width, height = surface.get_size()
+            self.frame = QImage(self._raw, width, height, width * 3, QImage.Format_RGB888)
+            self.update()
+            return
+        if not rects:
+            return
+        if self._raw is not None:
+            self.frame = self.frame.copy()  # detach from the last full frame's bytes before painting into it
+            self._raw = None
+        painter = QPainter(self.frame)
+        for rect in rects:
+            raw = pygame.image.tostring(surface.subsurface(rect), "RGB")
+            painter.drawImage(rect.x, rect.y, QImage(raw, rect.w, rect.h, rect.w * 3, QImage.Format_RGB888))
+        painter.end()
+        for rect in rects:
+            self.update(QRect(rect.x, rect.y, rect.w, rect.h))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        region = event.rect()
+        painter.drawImage(region, self.frame, region)
+        painter.end()
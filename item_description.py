@@ -1,5 +1,7 @@
 import pygame
 import os
+from collections import OrderedDict
+from text_cache import render_text
 WIDTH = 1000
 HEIGHT = 1000
 
@@ -13,12 +15,22 @@ RARITY_COLORS = {
 
 
 class ItemDescriptionCard:
+    """
+    Hover card for an item. The composed card is cached per item state
+    (unique_id plus the fields it shows, charges and cooldowns included),
+    so a card that stays up is a single blit per frame.
+    """
+
+    MAX_CACHED = 32
+
     def __init__(self, font_title, font_body):
         self.font_title = font_title
         self.font_body = font_body
         self.visible = False
         self.item_data = None
         self.position = (0, 0)
+        self.rect = None  # last drawn card rect
+        self.cards = OrderedDict()  # card key -> composed Surface
 
     def show(self, item, position):
         # print(f"[SHOW] Showing item card for: {item}")
@@ -30,6 +42,12 @@ class ItemDescriptionCard:
         self.visible = False
         self.item_data = None
 
+    def _card_key(self, item):
+        return (
+            item.get("unique_id"), item.get("title"), item.get("rarity"), item.get("description"),
+            item.get("cooldown_match"), item.get("cooldown_time"), item.get("charges"),
+        )
+
     def draw(self, surface):
         # print(f"[CARD] Visible: {self.visible}, Item Data: {self.item_data}")
         if not self.visible or not self.item_data:
@@ -37,34 +55,46 @@ class ItemDescriptionCard:
 
         # print(f"[DRAW] Showing card for {self.item_data['title']} at {self.position}")
 
-        x, y = self.position
+        key = self._card_key(self.item_data)
+        card = self.cards.get(key)
+        if card is None:
+            card = self.cards[key] = self._compose(self.item_data)
+            while len(self.cards) > self.MAX_CACHED:
+                self.cards.popitem(last=False)
+        self.cards.move_to_end(key)
+
+        self.rect = card.get_rect(topleft=self.position)
+        surface.blit(card, self.rect)
+
+    def _compose(self, item):
+        """Render the whole card (background, border, text) into one surface."""
         width = 300
         padding = 10
         line_height = 26
         spacing = 1  # lines worth of vertical spacing between sections
 
         # Rarity
-        rarity = self.item_data.get("rarity", "common")
+        rarity = item.get("rarity", "common")
         rarity_color = RARITY_COLORS.get(rarity, (180, 180, 180))
-        rarity_surface = self.font_body.render(f"Rarity: {rarity.title()}", True, rarity_color)
+        rarity_surface = render_text(self.font_body, f"Rarity: {rarity.title()}", rarity_color)
 
         # Title
-        title_surface = self.font_title.render(self.item_data["title"], True, rarity_color)
+        title_surface = render_text(self.font_title, item["title"], rarity_color)
 
         # Cooldown type
         cooldown_str = ""
-        if "cooldown_match" in self.item_data:
-            cooldown_str = f"Cooldown: {self.item_data['cooldown_match']} matches"
-        elif "cooldown_time" in self.item_data:
-            cooldown_str = f"Cooldown: {self.item_data['cooldown_time']} sec"
-        elif "charges" in self.item_data:
-            cooldown_str = f"Charges: {self.item_data['charges']}"
+        if "cooldown_match" in item:
+            cooldown_str = f"Cooldown: {item['cooldown_match']} matches"
+        elif "cooldown_time" in item:
+            cooldown_str = f"Cooldown: {item['cooldown_time']} sec"
+        elif "charges" in item:
+            cooldown_str = f"Charges: {item['charges']}"
         else:
             cooldown_str = "Cooldown: None"
-        cooldown_surface = self.font_body.render(cooldown_str, True, (220, 220, 220))
+        cooldown_surface = render_text(self.font_body, cooldown_str, (220, 220, 220))
 
         # Description (wrapped)
-        description = self.item_data.get("description", "No description available.")
+        description = item.get("description", "No description available.")
         max_chars = 20
         words = description.split()
         lines = []
@@ -83,26 +113,27 @@ class ItemDescriptionCard:
         num_spacers = 3  # title-rarity, rarity-cooldown, cooldown-description
         total_lines = 3 + num_spacers + len(lines)
         height = padding * 2 + line_height * total_lines
-        bg_rect = pygame.Rect(x, y, width, height)
+        card = pygame.Surface((width, height))
+        bg_rect = card.get_rect()
 
         # Draw background
-        pygame.draw.rect(surface, (40, 40, 40), bg_rect)
-        pygame.draw.rect(surface, rarity_color, bg_rect, 2)
+        pygame.draw.rect(card, (40, 40, 40), bg_rect)
+        pygame.draw.rect(card, rarity_color, bg_rect, 2)
 
         # Draw segments with spacing
-        line_y = y + padding
+        line_y = padding
 
-        surface.blit(title_surface, (x + padding, line_y))
+        card.blit(title_surface, (padding, line_y))
         line_y += line_height * (1 + spacing)
 
-        surface.blit(rarity_surface, (x + padding, line_y))
+        card.blit(rarity_surface, (padding, line_y))
         line_y += line_height * (1 + spacing)
 
-        surface.blit(cooldown_surface, (x + padding, line_y))
+        card.blit(cooldown_surface, (padding, line_y))
         line_y += line_height * (1 + spacing)
 
         for line in lines:
-            line_surface = self.font_body.render(line, True, (220, 220, 220))
-            surface.blit(line_surface, (x + padding, line_y))
+            line_surface = render_text(self.font_body, line, (220, 220, 220))
+            card.blit(line_surface, (padding, line_y))
             line_y += line_height
-
+        return card
@@ -6,7 +6,6 @@ from paths import asset
 import random
 from typing import List, Tuple, Optional
 import pandas as pd;
-import matplotlib.pyplot as plt
 import pygame
 import time
 import math
@@ -16,6 +15,20 @@ import logging
 from logging.handlers import RotatingFileHandler
 from shop import Shop
 from encounterengine import EncounterEngine
+from board_index import BoardIndex, memoize_per_generation
+from board_journal import BoardJournal, BoardChange
+from animation_store import AnimationStore
+from board_layer import BoardLayer
+from dirty_rects import DirtyRects
+from frame_governor import FrameGovernor
+from sprite_cache import AlphaSpriteCache, ShadowSprite, TiledBackground
+from text_cache import render_text, sys_font
+from asset_manager import load_image
+from texture_atlas import TextureAtlas
+from game_canvas import GameCanvas
+from tile import Tile
+from spatial_hash import SpatialHash
+from nearest_index import NearestIndex, RowIndex, window_offsets
 from action_bar import ActionBar
 from item_description import ItemDescriptionCard
 name = "Curiosima"
@@ -70,13 +83,13 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QMenu, QAction
 )
 from PyQt5.QtCore import QPropertyAnimation, QEasingCurve, QPoint, QTimer, QEvent, Qt
-from PyQt5.QtGui import QPixmap, QImage
 from PyQt5 import QtGui, QtCore
-from matplotlib import cm
-from matplotlib.colors import Normalize
+from assets.fx.colormaps import INFERNO_R, sample
 
 from assets.fx.particle import SmokeParticle, SparkleParticle, FireParticle, WindParticle, \
     SelectedParticle, ComboBand, SelectedParticle_B, SelectedParticle_Fire
+from assets.fx.particle_system import ParticleSystem
+from assets.fx.particle_atlas import atlas as particle_atlas
 from music import MusicManager
 
 
@@ -86,6 +99,8 @@ from music import MusicManager
 
 # ITEMS = "./assets/items/shop_items.json"
 TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH = 64, 96, 6
+# item icon sizes kept in the texture atlas: shop rows, inventory slots (see ActionBar)
+ICON_SIZES = (((TILE_WIDTH, TILE_HEIGHT), False), ((TILE_WIDTH - 4, TILE_HEIGHT - 4), True))
 MAX_ROWS = 6
 MAX_COLS = 18
 PAIR_COUNT = 4
@@ -137,6 +152,16 @@ class _HUDMessage:
         self.box_w = tw + padding * 2
         self.box_h = th + padding * 2
 
+        # Box + text composited once, premultiplied so the text's antialiased edges
+        # come out as if both were blitted separately; fades reuse scaled copies
+        box = pygame.Surface((self.box_w, self.box_h), pygame.SRCALPHA)
+        box.fill(bg_rgba)
+        self.surface = box.premul_alpha()
+        text = self.text_surf.copy().premul_alpha()  # premul_alpha() straight off font.render() comes back blank
+        self.surface.blit(text, (padding, padding),
+                          special_flags=pygame.BLEND_PREMULTIPLIED)
+        self._faded = {}  # alpha level (0-31) -> scaled copy of self.surface
+
     def _render_wrapped_text(self, text, font, color, max_width):
         if not self.max_width:
             return font.render(text, True, color)
@@ -164,6 +189,18 @@ class _HUDMessage:
             y += s.get_height()
         return surf
 
+    def surface_at(self, alpha: int) -> pygame.Surface:
+        """Premultiplied toast at the given alpha (32 levels); blit with BLEND_PREMULTIPLIED."""
+        level = round(alpha * 31 / 255)
+        if level >= 31:
+            return self.surface
+        faded = self._faded.get(level)
+        if faded is None:
+            a = round(level * 255 / 31)
+            faded = self._faded[level] = self.surface.copy()
+            faded.fill((a, a, a, a), special_flags=pygame.BLEND_RGBA_MULT)
+        return faded
+
     def alpha_at(self, now_ms: int) -> int:
         elapsed = now_ms - self.start_ms
         if elapsed <= self.hold_ms:
@@ -241,8 +278,13 @@ class MahjongGame(QWidget):
             self.booster_pool = []
             # self.shop = Shop(self)
             self.tile_positions = {}
+            self.board_index = BoardIndex()
+            self.board_journal = BoardJournal()
+            self.board_journal.subscribe(self._refresh_fog_for_changes)
+            self.board_layer = BoardLayer(self)
             self.selected_tiles = []
             self.animating_tiles = []
+            self.animations = AnimationStore()
             self.fading_matched_tiles = []
 
             self.animating_tiles = []
@@ -283,10 +325,10 @@ class MahjongGame(QWidget):
             self.music_volume = 0.05
 
 
-            self.particles = []
-            self.fuse_particles = []
-            cmap = cm.get_cmap("inferno").reversed()
-            self.fuse_gradient = [tuple(int(c * 255) for c in cmap(i / 20)[:3]) for i in range(20)]
+            particle_atlas.warm()
+            self.particles = ParticleSystem()
+            self.fuse_particles = ParticleSystem()
+            self.fuse_gradient = [sample(INFERNO_R, i / 20) for i in range(20)]
 
             # Combo timer
             self.combo_fuse_x = 50
@@ -363,9 +405,9 @@ class MahjongGame(QWidget):
             pygame.display.set_mode((1, 1), pygame.HIDDEN)
             self.icons_dir = asset("icons")
             self.icon_images = {
-                "prev": pygame.image.load(f"{self.icons_dir}/prev_track.png").convert_alpha(),
-                "next": pygame.image.load(f"{self.icons_dir}/next_track.png").convert_alpha(),
-                "volume": pygame.image.load(f"{self.icons_dir}/volume_icon.png").convert_alpha()
+                "prev": load_image(self.icons_dir / "prev_track.png"),
+                "next": load_image(self.icons_dir / "next_track.png"),
+                "volume": load_image(self.icons_dir / "volume_icon.png")
             }
             bg_path = os.path.join(self.bg_dir, "bg.png")
             pygame.font.init()
@@ -394,16 +436,23 @@ class MahjongGame(QWidget):
             self.money_font = pygame.font.Font(FacultyGlyphicRegular, 25)  # Smaller than combo_font
             self.item_font = pygame.font.Font(vergilia, 25)  # Smaller than combo_font
 
-            self.background_tile = pygame.image.load(bg_path).convert()
+            self.background_tile = load_image(bg_path, alpha=False)
+            self.background = TiledBackground(self.background_tile)
             self.bg_scroll_x = 0
             self.bg_scroll_y = 0
             self.bg_scroll_speed_x = 1  # Adjust as needed
             self.bg_scroll_speed_y = 1
 
 
-            self.surface = pygame.Surface((1500, 900))
+            self.surface = pygame.Surface((1500, 900), 0, 32)  # 32-bit so GameCanvas can wrap its pixels
+            self.alpha_sprites = AlphaSpriteCache()
+            self.tile_shadow = ShadowSprite((TILE_WIDTH, TILE_HEIGHT))
+            self.dirty_rects = DirtyRects(self.surface.get_size())
+            self.governor = FrameGovernor(budget_ms=16)
+            self._frame_base = None  # background + board layer, for restoring dirty regions
 
             self.tile_images = {}
+            self.texture_atlas = TextureAtlas()
             self.load_tileset_images()
             self._init_board_metrics()  # ← add this
             self.target_score = self.calculate_target_score()
@@ -508,11 +557,11 @@ class MahjongGame(QWidget):
         )
 
         layout.addLayout(btns)
-        self.canvas_label = QLabel()
-        self.canvas_label.setMouseTracking(True)
-        self.canvas_label.mousePressEvent = self.mousePressEvent
-        self.canvas_label.mouseMoveEvent = self.mouseMoveEvent
-        layout.addWidget(self.canvas_label)
+        self.canvas = GameCanvas(self.surface.get_size())
+        self.canvas.setMouseTracking(True)
+        self.canvas.mousePressEvent = self.mousePressEvent
+        self.canvas.mouseMoveEvent = self.mouseMoveEvent
+        layout.addWidget(self.canvas)
 
         self.setLayout(layout)
 
@@ -549,15 +598,34 @@ class MahjongGame(QWidget):
                 name = os.path.splitext(fname)[0]
                 path = os.path.join(self.tiles_dir, fname)
                 try:
-                    image = pygame.image.load(path).convert_alpha()
-                    self.tile_images[name] = image
+                    self.tile_images[name] = load_image(path)
                 except Exception as e:
                     print(f"Failed to load tile '{fname}': {e}")
+        self.build_texture_atlas()
+        if getattr(self, "board_layer", None):
+            self.board_layer.invalidate()
+        if getattr(self, "alpha_sprites", None):
+            self.alpha_sprites.clear()
+
+    def build_texture_atlas(self):
+        """Pack tile faces and item icons (shop and inventory slot sizes) into self.texture_atlas."""
+        entries = [(("tile", name), img) for name, img in self.tile_images.items()]
+        try:
+            with open(self.items_db, "r") as f:
+                icon_paths = {item["image"] for item in json.load(f) if item.get("image")}
+        except Exception as e:
+            print(f"[ATLAS] Could not read item icons: {e}")
+            icon_paths = set()
+        for path in sorted(icon_paths):
+            for size, smooth in ICON_SIZES:
+                icon = load_image(path, size, smooth=smooth, fallback_dir=asset("items"))
+                entries.append((("icon", path, size), icon))
+        self.texture_atlas.build(entries)
 
     def get_remaining_tile_count(self):
         return sum(
             1 for tile in self.board
-            if tile.get("state") != "cleared" and not tile.get("fading", False)
+            if tile.get("state") != "cleared" and not getattr(self.animations.get(tile), "fading", False)
         )
 
     def get_total_tile_count(self):
@@ -618,34 +686,18 @@ class MahjongGame(QWidget):
         # Clamp the range
         multiplier = max(1, min(multiplier, 10))
 
-        # Normalize to 0.0–1.0 for the colormap
-        norm = Normalize(vmin=1, vmax=10)
-        cmap = cm.get_cmap("inferno").reversed()
-
-        rgba = cmap(norm(multiplier))  # Returns (r, g, b, a) floats
-        r = int(rgba[0] * 255)
-        g = int(rgba[1] * 255)
-        b = int(rgba[2] * 255)
-        return (r, g, b)
+        # 1..10 -> 0.0..1.0 along reversed inferno
+        return sample(INFERNO_R, (multiplier - 1) / 9)
 
     def update_fuse_gradient(self):
-        # Reversed inferno colormap
-        cmap = cm.get_cmap("inferno").reversed()
-
         # Clamp combo_level between 1 and 10
         clamped_level = max(1, min(self.combo_level, 10))
 
-        # Normalize range from 1 to 10
-        norm = Normalize(vmin=1, vmax=10)
-
-        # Sample the gradient from 1 up to the current combo level
+        # Sample the reversed inferno gradient from 1 up to the current combo level
         levels = 20  # Number of discrete colors
-        max_ratio = norm(clamped_level)  # Get float in 0.0–1.0
+        max_ratio = (clamped_level - 1) / 9  # 0.0–1.0
 
-        self.fuse_gradient = [
-            tuple(int(c * 255) for c in cmap(i / (levels - 1) * max_ratio)[:3])
-            for i in range(levels)
-        ]
+        self.fuse_gradient = [sample(INFERNO_R, i / (levels - 1) * max_ratio) for i in range(levels)]
 
     def draw_combo_text(self):
 
@@ -668,8 +720,7 @@ class MahjongGame(QWidget):
             return  # Combo fully expired, don't draw
 
         color = self.get_combo_color(self.combo_level)
-        text_surface = self.combo_font.render(self.combo_display_text, True, color)
-        text_surface.set_alpha(alpha)
+        text_surface = self.alpha_sprites.get(render_text(self.combo_font, self.combo_display_text, color), alpha)
 
         text_rect = text_surface.get_rect(center=(self.surface.get_width() // 2,
                                                   self.surface.get_height() - 40))
@@ -777,19 +828,13 @@ class MahjongGame(QWidget):
             band.draw(self.surface, self.fuse_particles, self.fuse_gradient)
 
         # Update/draw fuse particles
-        alive_fuse_particles = []
-        for p in self.fuse_particles:
-            p.update()
-            p.draw(self.surface)
-            if p.alpha > 0:
-                alive_fuse_particles.append(p)
-        self.fuse_particles = alive_fuse_particles
+        self.fuse_particles.update_and_draw(self.surface)
 
 
     def draw_score_text(self):
         score_color = (255, 255, 255)  # White or any desired color
         score_text = f"Score: {self.score}"
-        score_surface = self.gui_font.render(score_text, True, score_color)
+        score_surface = render_text(self.gui_font, score_text, score_color)
 
         # Align below the combo text
         combo_y_offset = self.surface.get_height() - 40  # y-position of combo text
@@ -846,17 +891,31 @@ class MahjongGame(QWidget):
           - center: stacked around screen center
           - bottom: stacked from bottom-center upward
         """
+        self._hud_message_rects = []
         if not getattr(self, "hud_messages", None):
             return
 
         now = pygame.time.get_ticks()
-        width, height = surface.get_width(), surface.get_height()
+        for m, x, y in self._hud_layout(surface.get_width(), surface.get_height()):
+            alpha = m.alpha_at(now)
+            if alpha <= 0:
+                continue
+            surface.blit(m.surface_at(alpha), (x, y), special_flags=pygame.BLEND_PREMULTIPLIED)
+            self._hud_message_rects.append((x, y, m.box_w, m.box_h))
+
+    def _hud_layout(self, width, height):
+        """[(message, x, y)] for the stacked toasts; recomputed only when the set of messages changes."""
+        key = (tuple(id(m) for m in self.hud_messages), width, height)
+        cached = getattr(self, "_hud_layout_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         # Bucket by location to stack cleanly
         buckets = {"top": [], "center": [], "bottom": []}
         for m in self.hud_messages:
             buckets.get(m.where, buckets["top"]).append(m)
 
+        layout = []
         for where, items in buckets.items():
             if not items:
                 continue
@@ -872,29 +931,13 @@ class MahjongGame(QWidget):
 
             y = y_start
             for m in items:
-                alpha = m.alpha_at(now)
-                if alpha <= 0:
-                    continue
-
                 # Centered horizontally
-                x = (width - m.box_w) // 2
-
-                # Background box (with per-pixel alpha)
-                box = pygame.Surface((m.box_w, m.box_h), pygame.SRCALPHA)
-                box.fill(m.bg_rgba)
-                # Optional: tiny rounding by drawing a rect onto an alpha surface, kept simple here
-                box.set_alpha(alpha)
-
-                # Text (copy to apply alpha)
-                txt = m.text_surf.copy()
-                txt.set_alpha(alpha)
-
-                # Blit
-                surface.blit(box, (x, y))
-                surface.blit(txt, (x + m.padding, y + m.padding))
-
+                layout.append((m, (width - m.box_w) // 2, y))
                 y += m.box_h + 6
 
+        self._hud_layout_cache = (key, layout)  # holds the messages, so their ids stay unique
+        return layout
+
     def reset_round_score_state(self):
         self.tile_match_count.clear()
         self.combo_multiplier = 1
@@ -915,8 +958,10 @@ class MahjongGame(QWidget):
         self.encounter_mode = None
         self.board = []
         self.tile_positions = {}
+        self.clear_board()
         self.fading_matched_tiles = []
         self.animating_tiles = []
+        self.animations.clear()
         self._vacated_during_animation = set()
 
     def mousePressEvent(self, event):
@@ -975,16 +1020,16 @@ class MahjongGame(QWidget):
         self.handle_click(event)
 
     def _topmost_tile_at_point(self, px, py):
-        """Return topmost tile at pixel (px,py). Adapt get_tile_rect(...) to your code."""
-        # sort top-down
-        for t in sorted(self.board, key=lambda a: a.get("z", 0), reverse=True):
-            try:
-                r = self.get_tile_rect(t)  # <-- you likely have this; otherwise compute from draw pos + size
-                if r.collidepoint(px, py):
-                    return t
-            except Exception:
-                pass
-        return None
+        """Return topmost tile at screen pixel (px,py), or None."""
+        return self._tile_hit_hash().at_point(px, py)
+
+    @memoize_per_generation
+    def _tile_hit_hash(self):
+        """Screen-space hash of the visible (top-of-stack) tiles, topmost first."""
+        zoom = max(getattr(self, "zoom", 1.0), 1e-6)
+        hit_hash = SpatialHash(TILE_WIDTH * zoom, TILE_HEIGHT * zoom)
+        hit_hash.rebuild((t, self._tile_screen_rect(t)) for t in self._iter_topmost_tiles())
+        return hit_hash
 
     def _stack_draw_rect(self, key):
         """Screen-space rect of the TOP tile in this stack (what the user sees/clicks)."""
@@ -1003,7 +1048,7 @@ class MahjongGame(QWidget):
         if rect is None:
             return
         sx, sy, sw, sh = rect
-        n = 24 if not final else 48
+        n = self.governor.emit(24 if not final else 48)
 
         if hasattr(self, "particles"):
             try:
@@ -1027,9 +1072,7 @@ class MahjongGame(QWidget):
             stack = self._tiles_in_stack(key)
             if not stack:
                 continue
-            new_order = list(reversed(stack))
-            for i, t in enumerate(new_order):
-                t["z"] = i
+            self.reorder_stack(key, list(reversed(stack)))
             inverted += 1
 
         print(f"[CERBERUS] Inverted {inverted} stack(s).")
@@ -1068,7 +1111,7 @@ class MahjongGame(QWidget):
                 if not stack: continue
                 top = max(stack, key=lambda t: t.get("z", 0))
                 cx, cy = self.get_draw_pos(top)
-                for _ in range(40):
+                for _ in range(self.governor.emit(40)):
                     self.particles.append(SelectedParticle_B(cx, cy, self.TILE_WIDTH, self.TILE_HEIGHT))
         except Exception:
             pass
@@ -1121,7 +1164,7 @@ class MahjongGame(QWidget):
     def _debug_click_marker(self, x, y):
         """Small red dot to visualize clicks during debugging."""
         try:
-            pygame.draw.circle(self.surface, (255, 0, 0), (x, y), 5)
+            self.dirty_rects.add(pygame.draw.circle(self.surface, (255, 0, 0), (x, y), 5))  # restored by a later frame
         except Exception:
             pass
 
@@ -1382,7 +1425,7 @@ class MahjongGame(QWidget):
         item_name = self.inventory[self.sell_target_index].get("title", "Unknown")
         sell_price = int(self.inventory[self.sell_target_index].get("cost", 10) * 0.5)
 
-        title_text = font.render(f"Sell {item_name} for {sell_price}?", True, (255, 255, 255))
+        title_text = render_text(font, f"Sell {item_name} for {sell_price}?", (255, 255, 255))
         self.surface.blit(title_text, (overlay_x + 20, overlay_y + 20))
 
         # Buttons
@@ -1398,8 +1441,8 @@ class MahjongGame(QWidget):
         pygame.draw.rect(self.surface, (50, 150, 50), self.confirm_button_rect)  # Green confirm
         pygame.draw.rect(self.surface, (150, 50, 50), self.cancel_button_rect)  # Red cancel
 
-        confirm_text = font.render("Confirm", True, (255, 255, 255))
-        cancel_text = font.render("Cancel", True, (255, 255, 255))
+        confirm_text = render_text(font, "Confirm", (255, 255, 255))
+        cancel_text = render_text(font, "Cancel", (255, 255, 255))
         self.surface.blit(confirm_text, (confirm_x + 15, button_y + 10))
         self.surface.blit(cancel_text, (cancel_x + 20, button_y + 10))
 
@@ -1434,16 +1477,16 @@ class MahjongGame(QWidget):
         pygame.draw.rect(self.surface, (40, 40, 40), self.sell_popup_rect)
         pygame.draw.rect(self.surface, (200, 200, 200), self.sell_popup_rect, 2)
 
-        font = pygame.font.SysFont(None, 24)
-        text = font.render(f"Sell {item_name} for {refund_amount}?", True, (255, 255, 255))
+        font = sys_font(None, 24)
+        text = render_text(font, f"Sell {item_name} for {refund_amount}?", (255, 255, 255))
         self.surface.blit(text, (rect_x + 20, rect_y + 20))
 
         pygame.draw.rect(self.surface, (0, 200, 0), self.confirm_button_rect)
-        self.surface.blit(font.render("Confirm", True, (0, 0, 0)),
+        self.surface.blit(render_text(font, "Confirm", (0, 0, 0)),
                           (self.confirm_button_rect.x + 10, self.confirm_button_rect.y + 5))
 
         pygame.draw.rect(self.surface, (200, 0, 0), self.cancel_button_rect)
-        self.surface.blit(font.render("Cancel", True, (0, 0, 0)),
+        self.surface.blit(render_text(font, "Cancel", (0, 0, 0)),
                           (self.cancel_button_rect.x + 25, self.cancel_button_rect.y + 5))
 
         pygame.display.flip()
@@ -1787,10 +1830,15 @@ class MahjongGame(QWidget):
                 self.selected_inventory_index = dst
                 self.trigger_inventory_item_effect(dst)
 
+    @memoize_per_generation
     def get_possible_match_count(self):
         if len(self.board) == 0:
             return 0
 
+        if not getattr(self, "cerberus_active", False):
+            return self.board_index.pair_count
+
+        # Cerberus lifts side-blocking on marked stacks → count the slow way
         name_counts = {}
         for tile in self.get_selectable_tiles():
             name = tile["name"]
@@ -1828,7 +1876,7 @@ class MahjongGame(QWidget):
             self.target_score = base_target
 
     def get_count_exposed_tiles_of_name(self, tile_name):
-        name_tiles = [tile for tile in self.board if tile["name"] == tile_name]
+        name_tiles = self.board_index.tiles_named(tile_name)
         exposed_name_tiles = [tile for tile in name_tiles if self.is_tile_selectable(tile)]
         return len(exposed_name_tiles)
 
@@ -2025,8 +2073,7 @@ class MahjongGame(QWidget):
         self.update()
 
     def new_game(self):
-        self.board.clear()
-        self.tile_positions.clear()
+        self.clear_board()
         self.selected_tiles.clear()
         self.matched_pairs.clear()
         self.match_count = 0
@@ -2056,6 +2103,7 @@ class MahjongGame(QWidget):
 
         # 🧱 Build a centered pyramid layout starting from top layer
         layout = self.build_centered_pyramid_layout(total_tiles)
+        self.board_index.prepare_layout(layout)
 
         center_x = 6
         center_y = NUM_ROWS // 2
@@ -2086,16 +2134,13 @@ class MahjongGame(QWidget):
                 break
             abs_x, abs_y = self.get_tile_pixel_position(gx, gy, gz, tile_w, tile_h, tile_d, offset_x, offset_y)
             name = name_pool[i]
-            tile = {
-                "name": name,
-                "x": abs_x,
-                "y": abs_y,
-                "z": gz,
-                "grid_x": gx,
-                "grid_y": gy
-            }
+            tile = Tile(name, abs_x, abs_y, gz, gx, gy)
             self.board.append(tile)
             self.tile_positions[(gx, gy, gz)] = tile
+            self.board_index.add(tile)
+
+        self.fog_active = False
+        self.board_journal.publish(self.board_index.generation, [BoardChange("reset", None, None, None)])
 
             # After the board is set up, apply tile modifications
         for item in self.inventory:
@@ -2109,6 +2154,11 @@ class MahjongGame(QWidget):
 
         self.calculate_grid_bounds()
 
+    @property
+    def board_generation(self):
+        return self.board_index.generation
+
+    @memoize_per_generation
     def calculate_grid_bounds(self):
         if not self.board:
             self.min_grid_x = self.max_grid_x = 0
@@ -2131,8 +2181,7 @@ class MahjongGame(QWidget):
 
     def new_game_2(self):
         # 🧹 Clear current game state
-        self.board.clear()
-        self.tile_positions.clear()
+        self.clear_board()
         self.selected_tiles.clear()
         self.matched_pairs.clear()
         self.match_count = 0
@@ -2184,16 +2233,10 @@ class MahjongGame(QWidget):
             abs_y = offset_y + gy * tile_h - gz * 10  # stack offset
 
             name = name_pool[i]
-            tile = {
-                "name": name,
-                "x": abs_x,
-                "y": abs_y,
-                "z": gz,
-                "grid_x": gx,
-                "grid_y": gy
-            }
+            tile = Tile(name, abs_x, abs_y, gz, gx, gy)
             self.board.append(tile)
             self.tile_positions[(gx, gy, gz)] = tile
+            self.board_index.add(tile)
 
         # 📐 Grid bounds for fog/center reference
         grid_xs = [tile["grid_x"] for tile in self.board]
@@ -2205,6 +2248,13 @@ class MahjongGame(QWidget):
         self.center_x = (self.min_grid_x + self.max_grid_x) // 2
         self.center_y = (self.min_grid_y + self.max_grid_y) // 2
 
+    @property
+    def selection_rules(self):
+        """What besides the board decides selectability; part of the memoize_per_generation key."""
+        if not getattr(self, "cerberus_active", False):
+            return None
+        return frozenset(getattr(self, "cerberus_marked_stacks", ()))
+
     def is_tile_selectable(self, tile):
         # inside is_tile_selectable(self, tile):
         if getattr(self, "cerberus_active", False):
@@ -2213,25 +2263,12 @@ class MahjongGame(QWidget):
                 if self._is_exposed(tile):  # no tile above in same stack
                     return True
 
-        gx, gy, gz = tile["grid_x"], tile["grid_y"], tile["z"]
-
-        # Must have no tile above
-        if (gx, gy, gz + 1) in self.tile_positions:
-            return False
-
-        # Must have at least one free horizontal side
-        left_blocked = (gx - 1, gy, gz) in self.tile_positions
-        right_blocked = (gx + 1, gy, gz) in self.tile_positions
-
-        return not (left_blocked and right_blocked)
+        # No tile above + at least one free horizontal side (tracked by board_index)
+        return self.board_index.is_selectable(tile)
 
+    @memoize_per_generation
     def get_topmost_tiles(self):
-        topmost = {}
-        for tile in self.board:
-            key = (tile["grid_x"], tile["grid_y"])
-            if key not in topmost or tile["z"] > topmost[key]["z"]:
-                topmost[key] = tile
-        return topmost
+        return self.board_index.top_tiles()
 
     def _screen_to_board(self, px, py):
         """Undo origin + scroll + zoom → board pixels."""
@@ -2282,9 +2319,12 @@ class MahjongGame(QWidget):
         Yield tiles in top-down order (topmost first) for hit-testing.
         Uses your get_topmost_tiles() and z-order.
         """
+        return iter(self._topmost_tiles_top_down())
+
+    @memoize_per_generation
+    def _topmost_tiles_top_down(self):
         topmap = self.get_topmost_tiles().values()
-        for t in reversed(sorted(topmap, key=lambda t: t.get("z", 0))):
-            yield t
+        return list(reversed(sorted(topmap, key=lambda t: t.get("z", 0))))
 
 
 
@@ -2292,8 +2332,9 @@ class MahjongGame(QWidget):
         return len(self.board)
 
     def tick(self):
-        self.bg_scroll_x = (self.bg_scroll_x + self.bg_scroll_speed_x) % self.background_tile.get_width()
-        self.bg_scroll_y = (self.bg_scroll_y + self.bg_scroll_speed_y) % self.background_tile.get_height()
+        if self._background_scrolls():  # held still while the frame governor is shedding load
+            self.bg_scroll_x = (self.bg_scroll_x + self.bg_scroll_speed_x) % self.background_tile.get_width()
+            self.bg_scroll_y = (self.bg_scroll_y + self.bg_scroll_speed_y) % self.background_tile.get_height()
         self.update_hover_state()  # Must be here!
 
         self.update_canvas()
@@ -2348,26 +2389,16 @@ class MahjongGame(QWidget):
         self.hovered_inventory_index = None
 
     def calculate_top_tiles(self):
-        self.top_tiles = set()
-        for tile in self.board:
-            gx, gy = tile["grid_x"], tile["grid_y"]
-            if not any(
-                    other for other in self.board
-                    if other["grid_x"] == gx and
-                       other["grid_y"] == gy and
-                       other["z"] > tile["z"]
-            ):
-                self.top_tiles.add((gx, gy))
-
+        self.top_tiles = self.get_topmost_tiles()
 
     def update_canvas(self):
         ACTION_BAR_HEIGHT = 100
+        self.governor.begin()
         self._update_hud_messages()
         self.calculate_top_tiles()
-        self.clear_background()
-        self.draw_background_tiles()
-        self.draw_tile_shadows()
-        self.draw_top_static_tiles()
+        self.draw_frame_base()
+        self.emit_selected_tile_particles()
+        self.draw_animating_tile_shadows()
         self.draw_exposed_tiles()
         self.draw_animating_tiles()
         self.draw_fading_tiles()
@@ -2375,39 +2406,106 @@ class MahjongGame(QWidget):
         self.draw_combo_fuse()
         self.action_bar.draw()  # External call to encapsulated class
         self._cerberus_emit_particles()
+        self.particles.limit(self.governor.particle_cap)
         self.draw_particles()
         self.update_hover_state()
         self.draw_overlays()
         self.draw_sell_confirmation()
         self.item_card.draw(self.surface)
         self._draw_hud_messages(self.surface)
+        self.mark_dirty_stages()
         self.update_game_state()
-        self.blit_to_qt()
+        self.blit_to_qt(self.dirty_rects.end_frame())
+        self.governor.end()
+
+    def _background_scrolls(self):
+        return bool(self.bg_scroll_speed_x or self.bg_scroll_speed_y) and self.governor.allows("background_scroll")
+
+    def _frame_is_static(self):
+        """True when the base under the dynamic stages can be reused from last frame."""
+        return not (self._background_scrolls() or self.in_shop or self.in_game_over
+                    or self.show_booster_selector or self.show_sell_confirm)
+
+    def draw_frame_base(self):
+        """Background + board layer; redrawn in full or restored only where last frame drew."""
+        static = self._frame_is_static()
+        layer_changed = self.board_layer.is_stale()
+        if static and not layer_changed and self._frame_base is not None and not self.dirty_rects.full:
+            for rect in self.dirty_rects.previous_rects():
+                self.surface.blit(self._frame_base, rect, rect)
+            return
 
-    def draw_top_static_tiles(self):
+        self.dirty_rects.invalidate()
+        self.clear_background()
+        self.draw_background_tiles()
+        self.board_layer.draw(self.surface)
+        if static:
+            if self._frame_base is None:
+                self._frame_base = self.surface.copy()
+            else:
+                self._frame_base.blit(self.surface, (0, 0))
+        else:
+            self._frame_base = None
+
+    def mark_dirty_stages(self):
+        """Record where this frame's dynamic stages drew (tiles, particles, fuse, HUD, bar, card)."""
+        dirty = self.dirty_rects  # recorded on full frames too: the next partial frame restores these
+        for tiles in (self.animating_tiles, self.fading_matched_tiles):
+            for tile in tiles:
+                dirty.add((tile.x, tile.y, TILE_WIDTH, TILE_HEIGHT))
+        for tile in getattr(self, "_exposed_drawn", ()):
+            dirty.add((tile.x, tile.y, TILE_WIDTH, TILE_HEIGHT))
+        if self.combo_bands or self.combo_display_text:
+            # fuse bands plus the stroked combo text centred on them
+            combo_y = self.combo_bands[0].y if self.combo_bands else self.action_bar.action_bar_top - 20
+            dirty.add((0, combo_y - 30, self.surface.get_width(), 60))
+        for band in self.combo_bands:
+            dirty.add((band.x, band.y, band.width, band.height))
+        for rect in self.fuse_particles.dirty_regions(8):
+            dirty.add(rect)
+        for rect in self.particles.dirty_regions():
+            dirty.add(rect)
+        bar_top = self.surface.get_height() - 160  # bar is the bottom 100px; its labels sit above it
+        dirty.add((0, bar_top, self.surface.get_width(), self.surface.get_height() - bar_top))
+        ghost = getattr(self.action_bar, "ghost_rect", None)  # dragged item, can be anywhere on screen
+        if ghost:
+            dirty.add(ghost.inflate(4, 4))
+        if self.item_card.visible:
+            dirty.add(getattr(self.item_card, "rect", None))
+        for rect in getattr(self, "_hud_message_rects", ()):
+            dirty.add(rect)
+
+    def draw_top_static_tiles(self, target=None):
+        """Draw the topmost settled tile of every stack; returns them bottom to top."""
+        target = target or self.surface
         # Get safely initialized lists/sets
-        animating_tiles = getattr(self, "animating_tiles", [])
+        animating_ids = self.animations.ids
         fading_tiles = getattr(self, "fading_matched_tiles", [])
 
-        animating_coords = set((t["grid_x"], t["grid_y"], t["z"]) for t in animating_tiles)
-        fading_coords = set((t["grid_x"], t["grid_y"], t["z"]) for t in fading_tiles)
+        fading_coords = set((t.grid_x, t.grid_y, t.z) for t in fading_tiles)
 
         top_tiles = {}
-        for tile in self.board:
-            gx, gy, gz = tile["grid_x"], tile["grid_y"], tile["z"]
-            if (gx, gy, gz) in animating_coords or (gx, gy, gz) in fading_coords:
-                continue
-            key = (gx, gy)
-            if key not in top_tiles or gz > top_tiles[key]["z"]:
-                top_tiles[key] = tile
+        for (gx, gy), stack in self.board_index.stacks.items():
+            for tile in reversed(stack):
+                if tile.uid in animating_ids or (gx, gy, tile.z) in fading_coords:
+                    continue
+                top_tiles[(gx, gy)] = tile
+                break
 
-        for tile in sorted(top_tiles.values(), key=lambda t: t["z"]):
-            img = self.tile_images.get(tile["name"])
-            if img:
-                self.surface.blit(img, (tile["x"], tile["y"]))
-                if tile in self.selected_tiles:
-                    for _ in range(10):
-                        self.particles.append(SelectedParticle(tile["x"], tile["y"], TILE_WIDTH, TILE_HEIGHT))
+        drawn = sorted(top_tiles.values(), key=lambda t: t.z)
+        batch = []
+        for tile in drawn:
+            entry = self.texture_atlas.blit_entry(("tile", tile.name), (tile.x, tile.y))
+            if entry:
+                batch.append(entry)
+        target.blits(batch, doreturn=False)
+        return drawn
+
+    def emit_selected_tile_particles(self):
+        for tile in self.selected_tiles:
+            if tile in self.board_layer.top_tiles and self.tile_images.get(tile.name):
+                for _ in range(self.governor.emit(10)):
+                    self.particles.append(SelectedParticle(tile.x, tile.y, TILE_WIDTH, TILE_HEIGHT))
 
     def draw_exposed_tiles(self):
         exposed_tiles = [
@@ -2418,19 +2516,16 @@ class MahjongGame(QWidget):
         for tile in exposed_tiles:
             img = self.tile_images.get(tile["name"])
             if img:
-                temp_img = img.copy()
-                temp_img.set_alpha(tile.get("alpha", 255))
-                self.surface.blit(temp_img, (tile["x"], tile["y"]))
+                self.surface.blit(self.alpha_sprites.get(img, self.animations.alpha(tile)), (tile["x"], tile["y"]))
             tile["will_become_exposed"] = False  # ✅ Clear after drawing
+        self._exposed_drawn = exposed_tiles
 
     def draw_animating_tiles(self):
         for tile in self.animating_tiles:
             if (tile["grid_x"], tile["grid_y"], tile["z"]) not in self.fading_coords:
                 img = self.tile_images.get(tile["name"])
                 if img:
-                    temp_img = img.copy()
-                    temp_img.set_alpha(tile.get("alpha", 255))
-                    self.surface.blit(temp_img, (tile["x"], tile["y"]))
+                    self.surface.blit(self.alpha_sprites.get(img, self.animations.alpha(tile)), (tile["x"], tile["y"]))
 
     def draw_fading_tiles(self):
         now = pygame.time.get_ticks()
@@ -2441,90 +2536,86 @@ class MahjongGame(QWidget):
             alpha = int(255 * (1 - progress))
             img = self.tile_images.get(tile["name"])
             if img:
-                temp_img = img.copy()
-                temp_img.set_alpha(alpha)
-                self.surface.blit(temp_img, (tile["x"], tile["y"]))
+                self.surface.blit(self.alpha_sprites.get(img, alpha), (tile["x"], tile["y"]))
             if progress >= 1.0:
                 done.append(tile)
         for tile in done:
-            self.board.remove(tile)
-            self.tile_positions.pop((tile["grid_x"], tile["grid_y"], tile["z"]), None)
+            self.remove_tile(tile)
             self.fading_matched_tiles.remove(tile)
         for tile in self.board:
             if tile.get("will_become_exposed"):
                 tile.pop("will_become_exposed")
 
-    def draw_tile_shadows(self):
+    def draw_tile_shadows(self, target=None):
+        target = target or self.surface
         vacated = getattr(self, "_vacated_during_animation", set())
-        fading_coords = set((t["grid_x"], t["grid_y"], t["z"]) for t in self.fading_matched_tiles)
-        animating_coords = set((t["grid_x"], t["grid_y"], t["z"]) for t in self.animating_tiles)
-
+        fading_coords = set((t.grid_x, t.grid_y, t.z) for t in self.fading_matched_tiles)
         # All current tiles that are not fading or animating
         present_tiles = [
             tile for tile in self.board
-            if (tile["grid_x"], tile["grid_y"], tile["z"]) not in fading_coords
+            if (tile.grid_x, tile.grid_y, tile.z) not in fading_coords
         ]
 
         # Map (gx, gy) -> highest z of tile still present at that position
         top_z_at = {}
         for tile in present_tiles:
-            gx, gy, gz = tile["grid_x"], tile["grid_y"], tile["z"]
+            gx, gy, gz = tile.grid_x, tile.grid_y, tile.z
             top_z_at[(gx, gy)] = max(top_z_at.get((gx, gy), -1), gz)
 
         # Include animating tiles that are leaving a stack
         for tile in self.animating_tiles:
-            gx, gy, gz = tile["grid_x"], tile["grid_y"], tile["z"]
+            gx, gy, gz = tile.grid_x, tile.grid_y, tile.z
             top_z_at[(gx, gy)] = max(top_z_at.get((gx, gy), -1), gz - 1)
 
-        # Draw shadows under all tiles that are not the topmost at their (gx, gy)
+        # The settled tile draw_top_static_tiles will paint over each stack
+        animating_ids = self.animations.ids
+        covers = {}
+        for key, stack in self.board_index.stacks.items():
+            for tile in reversed(stack):
+                if tile.uid in animating_ids or (tile.grid_x, tile.grid_y, tile.z) in fading_coords:
+                    continue
+                img = self.tile_images.get(tile.name)
+                if img:
+                    covers[key] = (tile.z, (img, tile.x, tile.y))
+                break
+
+        # Draw shadows under all tiles that are not the topmost at their (gx, gy),
+        # skipping the rows the covering tile hides anyway;
+        # moving tiles get theirs per frame in draw_animating_tile_shadows
+        self._shadow_top_z = top_z_at
         for tile in self.board:
-            gx, gy, gz = tile["grid_x"], tile["grid_y"], tile["z"]
-            if gz < top_z_at.get((gx, gy), -1):
-                shadow = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
-                shadow.fill((0, 0, 0, 200))
-                self.surface.blit(shadow, (tile["x"], tile["y"]))
+            gx, gy, gz = tile.grid_x, tile.grid_y, tile.z
+            if gz < top_z_at.get((gx, gy), -1) and tile.uid not in animating_ids:
+                cover_z, cover = covers.get((gx, gy), (-1, None))
+                self.tile_shadow.draw(target, tile.x, tile.y, cover if cover_z > gz else None)
+
+    def draw_animating_tile_shadows(self):
+        top_z_at = getattr(self, "_shadow_top_z", {})
+        for tile in self.animating_tiles:
+            if tile.z < top_z_at.get((tile.grid_x, tile.grid_y), -1):
+                self.tile_shadow.draw(self.surface, tile.x, tile.y)
 
     def clear_background(self):
         self.surface.fill((0, 80, 80))
 
     def draw_background_tiles(self):
-        pygame.mixer.music.get_pos()
-
-        tile_w, tile_h = self.background_tile.get_size()
-        surface_w, surface_h = self.surface.get_size()
-        start_x = -int(self.bg_scroll_x)
-        start_y = -int(self.bg_scroll_y)
-
-        for x in range(start_x, surface_w, tile_w):
-            for y in range(start_y, surface_h, tile_h):
-                self.surface.blit(self.background_tile, (x, y))
+        self.background.draw(self.surface, self.bg_scroll_x, self.bg_scroll_y)
 
     def draw_particles(self):
-        alive_particles = []
-        for p in self.particles:
-            if p.update():
-                p.draw(self.surface)
-                alive_particles.append(p)
-        self.particles = alive_particles
+        self.particles.update_and_draw(self.surface)
 
     def draw_overlays(self):
         if self.in_shop:
             self.draw_shop_overlay()
         if self.in_game_over:
             self.draw_game_over_overlay()
-        if self.item_card:
-            # print("[DRAW] Calling item_card.draw()")
-            self.item_card.draw(self.surface)
         if self.show_booster_selector:
             self.draw_booster_selector()
             return  # Prevent drawing the rest of the shop UI behind it
 
-    def blit_to_qt(self):
-        raw_data = pygame.image.tostring(self.surface, "RGB")
-        image = QPixmap.fromImage(
-            QImage(raw_data, self.surface.get_width(), self.surface.get_height(), QImage.Format_RGB888)
-        )
-        self.canvas_label.setPixmap(image)
+    def blit_to_qt(self, rects=None):
+        """Push the frame to Qt; rects limits the upload to those regions (None = whole frame)."""
+        self.canvas.present(self.surface, rects)
 
     def draw_fog_of_war(self):
         try:
@@ -2549,7 +2640,7 @@ class MahjongGame(QWidget):
                 fog_top = tile["y"]
                 fog_bottom = tile["y"] + TILE_HEIGHT
                 cutoff_y = visibility_cutoff_y.get((gx, gy))
-                if cutoff_y is not None and cutoff_y < fog_bottom:
+                if cutoff_y is not None and cutoff_y < fog_bottom and self.governor.allows("fog_feather"):
                     fog_height = cutoff_y - fog_top
                     if fog_height > 0:
                         partial_fog = pygame.Surface((TILE_WIDTH, fog_height), pygame.SRCALPHA)
@@ -2561,6 +2652,8 @@ class MahjongGame(QWidget):
             print(f"[FOG ERROR] {e}")
 
     def get_selectable_tiles(self):
+        if not getattr(self, "cerberus_active", False):
+            return self.board_index.selectable_tiles()
         selectable = []
         for tile in self.board:
             if self.is_tile_selectable(tile):
@@ -2578,12 +2671,7 @@ class MahjongGame(QWidget):
                 return
 
         # Hit-test
-        hit_tile = None
-        for tile in self._iter_topmost_tiles():
-            sx, sy, sw, sh = self._tile_screen_rect(tile)
-            if sx <= x <= sx + sw and sy <= y <= sy + sh:
-                hit_tile = tile
-                break
+        hit_tile = self._topmost_tile_at_point(x, y)
         if not hit_tile:
             return
 
@@ -2644,8 +2732,7 @@ class MahjongGame(QWidget):
 
             # Rebuild order: saved sequence, minus removed tiles; append any new arrivals
             new_order = [t for t in saved if t in current] + [t for t in current if t not in saved]
-            for i, t in enumerate(new_order):
-                t["z"] = i
+            self.reorder_stack(key, new_order)
             restored += 1
 
         print(f"[CERBERUS] Non-marked match → reverted {restored} stack(s) and clearing effect.")
@@ -2662,7 +2749,7 @@ class MahjongGame(QWidget):
             t["fading_out"] = True
 
             particle_cls = tile_particle_map.get(t["name"], SparkleParticle)
-            for _ in range(6):
+            for _ in range(self.governor.emit(6)):
                 px = t["x"] + random.randint(-5, 5)
                 py = t["y"] + random.randint(-5, 5)
                 self.particles.append(particle_cls(px, py))
@@ -2670,10 +2757,8 @@ class MahjongGame(QWidget):
         # Mark tiles beneath as exposed
         for tile in matched:
             gx, gy, gz = tile["grid_x"], tile["grid_y"], tile["z"]
-            for other in self.board:
+            for other in self.board_index.stack(gx, gy):
                 if (
-                        other["grid_x"] == gx and
-                        other["grid_y"] == gy and
                         other["z"] < gz and
                         not other.get("will_become_exposed")
                 ):
@@ -2810,8 +2895,8 @@ class MahjongGame(QWidget):
         shadow_offset = 4
 
         # Render drop shadow
-        shadow_text = self.combo_font.render("GAME OVER", True, (0, 0, 0))
-        game_over_text = self.combo_font.render("GAME OVER", True, game_over_color)
+        shadow_text = render_text(self.combo_font, "GAME OVER", (0, 0, 0))
+        game_over_text = render_text(self.combo_font, "GAME OVER", game_over_color)
 
         text_x = self.surface.get_width() // 2 - game_over_text.get_width() // 2
         text_y = 180
@@ -2844,8 +2929,8 @@ class MahjongGame(QWidget):
         pygame.draw.rect(self.surface, border_color, self.game_over_button_rect, 3)
 
         # Render text and shadow
-        btn_text = self.button_font.render(btn_label, True, text_color)
-        shadow_text = self.button_font.render(btn_label, True, (0, 0, 0))
+        btn_text = render_text(self.button_font, btn_label, text_color)
+        shadow_text = render_text(self.button_font, btn_label, (0, 0, 0))
 
         text_x = self.game_over_button_rect.centerx - btn_text.get_width() // 2
         text_y = self.game_over_button_rect.centery - btn_text.get_height() // 2
@@ -2983,7 +3068,7 @@ class MahjongGame(QWidget):
             self.surface.blit(overlay, (0, 0))
 
             # Title
-            title = self.gui_font.render("Welcome to the Shop", True, (255, 255, 255))
+            title = render_text(self.gui_font, "Welcome to the Shop", (255, 255, 255))
             self.surface.blit(title, (80, 60))
 
             # Draw shop items
@@ -3000,22 +3085,18 @@ class MahjongGame(QWidget):
 
                 # Load and blit image (even for placeholders if image exists)
                 if img_path:
-                    # full_path = os.path.normpath(os.path.join(BASE_DIR, img_path))
-                    full_path = resource_path(*img_path.split(os.sep))
-                    if os.path.exists(full_path):
-                        icon = pygame.image.load(full_path).convert_alpha()
-                        icon = pygame.transform.scale(icon, (TILE_WIDTH, TILE_HEIGHT))
+                    size = (TILE_WIDTH, TILE_HEIGHT)
+                    icon = self.texture_atlas.surface(("icon", img_path, size)) or load_image(img_path, size)
+                    if icon:
                         self.surface.blit(icon, (90, y + 5))
-                    else:
-                        print(f"[SHOP WARNING] Icon not found at: {full_path}")
 
                 # Set colors based on placeholder status
                 name_color = (180, 180, 180) if is_placeholder else (255, 255, 255)
-                name_text = self.item_font.render(name, True, name_color)
+                name_text = render_text(self.item_font, name, name_color)
                 self.surface.blit(name_text, (100 + TILE_WIDTH, y + 5))
 
                 if not is_placeholder:
-                    cost_text = self.money_font.render(f"{cost} pts", True, (255, 255, 100))
+                    cost_text = render_text(self.money_font, f"{cost} pts", (255, 255, 100))
                     self.surface.blit(cost_text, (100 + TILE_WIDTH, y + TILE_HEIGHT // 2))
 
                 self.shop_button_rects.append((item_rect, item))
@@ -3045,8 +3126,8 @@ class MahjongGame(QWidget):
             pygame.draw.rect(self.surface, btn_bg_color, reroll_rect)
             pygame.draw.rect(self.surface, btn_border_color, reroll_rect, 3)
 
-            reroll_label = btn_font.render(f"Reroll (-{self.reroll_price})", True, reroll_text_color)
-            reroll_shadow = btn_font.render(f"Reroll (-{self.reroll_price})", True, shadow_color)
+            reroll_label = render_text(btn_font, f"Reroll (-{self.reroll_price})", reroll_text_color)
+            reroll_shadow = render_text(btn_font, f"Reroll (-{self.reroll_price})", shadow_color)
             self.surface.blit(reroll_shadow, (reroll_rect.centerx - reroll_label.get_width() // 2 + btn_shadow_offset,
                                               reroll_rect.centery - reroll_label.get_height() // 2 + btn_shadow_offset))
             self.surface.blit(reroll_label, (reroll_rect.centerx - reroll_label.get_width() // 2,
@@ -3065,8 +3146,8 @@ class MahjongGame(QWidget):
             pygame.draw.rect(self.surface, btn_bg_color, booster_rect)
             pygame.draw.rect(self.surface, booster_color, booster_rect, 3)
 
-            booster_label = btn_font.render(f"Buy Booster Pack (-{self.booster_pack_cost})", True, booster_color)
-            booster_shadow = btn_font.render(f"Buy Booster Pack (-{self.booster_pack_cost})", True, shadow_color)
+            booster_label = render_text(btn_font, f"Buy Booster Pack (-{self.booster_pack_cost})", booster_color)
+            booster_shadow = render_text(btn_font, f"Buy Booster Pack (-{self.booster_pack_cost})", shadow_color)
             self.surface.blit(booster_shadow,
                               (booster_rect.centerx - booster_label.get_width() // 2 + btn_shadow_offset,
                                booster_rect.centery - booster_label.get_height() // 2 + btn_shadow_offset))
@@ -3086,8 +3167,8 @@ class MahjongGame(QWidget):
             pygame.draw.rect(self.surface, btn_bg_color, continue_rect)
             pygame.draw.rect(self.surface, btn_border_color, continue_rect, 3)
 
-            continue_label = btn_font.render("Continue", True, continue_text_color)
-            continue_shadow = btn_font.render("Continue", True, shadow_color)
+            continue_label = render_text(btn_font, "Continue", continue_text_color)
+            continue_shadow = render_text(btn_font, "Continue", shadow_color)
             self.surface.blit(continue_shadow,
                               (continue_rect.centerx - continue_label.get_width() // 2 + btn_shadow_offset,
                                continue_rect.centery - continue_label.get_height() // 2 + btn_shadow_offset))
@@ -3099,7 +3180,7 @@ class MahjongGame(QWidget):
 
             # Message
             if self.shop_message:
-                msg = self.gui_font.render(self.shop_message, True, (255, 100, 100))
+                msg = render_text(self.gui_font, self.shop_message, (255, 100, 100))
                 # self.surface.blit(msg, (80, cont_y - 40))
 
         except Exception as e:
@@ -3173,17 +3254,51 @@ class MahjongGame(QWidget):
         if self.encounter_mode:
             self.trigger_encounter_effect()
 
+    def _selectable_cells(self):
+        """Cells of selectable tiles; the grid's answer unless Cerberus overrides selectability."""
+        if not getattr(self, "cerberus_active", False):
+            return self.board_index.selectable_cells()
+        return {(t.grid_x, t.grid_y, t.z) for t in self.get_selectable_tiles()}
+
+    def _selectable_type_counts(self):
+        """Selectable tiles per Tile.type_id, with the same Cerberus override as _selectable_cells."""
+        if not getattr(self, "cerberus_active", False):
+            return self.board_index.selectable_type_counts()
+        counts = [0] * Tile.type_count()
+        for tile in self.get_selectable_tiles():
+            counts[tile.type_id] += 1
+        return counts
+
     def apply_fog_of_war(self):
+        open_cells = self._selectable_cells()
         for tile in self.board:
-            tile["fogged"] = not self.is_tile_selectable(tile)
+            tile.fogged = (tile.grid_x, tile.grid_y, tile.z) not in open_cells
+        self.fog_active = True
 
         self.update_canvas()
 
     def clear_fog_of_war(self):
+        self.fog_active = False
         for tile in self.board:
             tile.pop("fogged", None)
         self.update_canvas()
 
+    def _refresh_fog_for_changes(self, changes):
+        """Board journal subscriber: re-fog only the cells a change could affect."""
+        if not getattr(self, "fog_active", False):
+            return
+        cells = BoardJournal.touched_cells(changes)
+        if cells is None:
+            tiles = self.board
+        else:
+            index = self.board_index
+            around = set(cells)
+            for cell in cells:
+                around.update(index.blockers.dependents(cell))
+            tiles = [t for gx, gy, gz in around for t in index.stack(gx, gy) if t.z == gz]
+        for tile in tiles:
+            tile.fogged = not self.is_tile_selectable(tile)
+
     def draw_booster_selector(self):
         # Transparent overlay (no fill color, just alpha surface)
         overlay = pygame.Surface(self.surface.get_size(), pygame.SRCALPHA)
@@ -3196,7 +3311,7 @@ class MahjongGame(QWidget):
         self.booster_button_rects = []
 
         # Title
-        title = self.gui_font.render("Choose 3 Tiles", True, (255, 255, 255))
+        title = render_text(self.gui_font, "Choose 3 Tiles", (255, 255, 255))
         self.surface.blit(title, (offset_x, offset_y))
 
         # Tile positioning
@@ -3210,9 +3325,10 @@ class MahjongGame(QWidget):
 
             # ✅ Load from self.tile_images
             if tile_name in self.tile_images:
-                img = self.tile_images[tile_name]
-                scaled_img = pygame.transform.scale(img, (TILE_WIDTH, TILE_HEIGHT))
-                self.surface.blit(scaled_img, (x, tile_y))
+                path = os.path.join(self.tiles_dir, f"{tile_name}.png")
+                scaled_img = load_image(path, (TILE_WIDTH, TILE_HEIGHT))
+                if scaled_img:
+                    self.surface.blit(scaled_img, (x, tile_y))
 
             # ✅ Draw green border if selected
             if i in self.booster_selected_indices:
@@ -3230,7 +3346,7 @@ class MahjongGame(QWidget):
         self.button_rects["booster_confirm"] = confirm_rect
 
         pygame.draw.rect(self.surface, confirm_color, confirm_rect)
-        label = self.button_font.render("Confirm", True, (255, 255, 255))
+        label = render_text(self.button_font, "Confirm", (255, 255, 255))
         self.surface.blit(label, (confirm_rect.centerx - label.get_width() // 2,
                                   confirm_rect.centery - label.get_height() // 2))
 
@@ -3239,7 +3355,7 @@ class MahjongGame(QWidget):
         self.button_rects["booster_skip"] = skip_rect
 
         pygame.draw.rect(self.surface, (150, 0, 0), skip_rect)
-        skip_label = self.button_font.render("Skip", True, (255, 255, 255))
+        skip_label = render_text(self.button_font, "Skip", (255, 255, 255))
         self.surface.blit(skip_label, (skip_rect.centerx - skip_label.get_width() // 2,
                                        skip_rect.centery - skip_label.get_height() // 2))
 
@@ -3292,18 +3408,12 @@ class MahjongGame(QWidget):
                 new_positions[(gx, gy, gz)] = tile
                 continue
 
-            tile["start_x"] = tile["x"]
-            tile["start_y"] = tile["y"]
-
-            tile["target_x"] = 80 + new_gx * TILE_WIDTH
-            tile["target_y"] = 60 + new_gy * TILE_HEIGHT - new_gz * TILE_DEPTH
-
-            tile["target_grid_x"] = new_gx
-            tile["target_grid_y"] = new_gy
-            tile["target_z"] = new_gz
-
-            tile["alpha"] = 255
-            tile["fading"] = True
+            self.animations.begin(
+                tile,
+                target_x=80 + new_gx * TILE_WIDTH,
+                target_y=60 + new_gy * TILE_HEIGHT - new_gz * TILE_DEPTH,
+                target_grid_x=new_gx, target_grid_y=new_gy, target_z=new_gz,
+                fading=True)
 
             animated_tiles.append(tile)
 
@@ -3344,9 +3454,8 @@ class MahjongGame(QWidget):
                 continue
 
             abs_x, abs_y = self.get_tile_pixel_position(new_gx, gy, new_gz, TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH, self.offset_x, self.offset_y)
-            tile.update({"start_x": tile["x"], "start_y": tile["y"], "target_x": abs_x, "target_y": abs_y,
-                         "target_grid_x": new_gx, "target_grid_y": gy, "target_z": new_gz,
-                         "alpha": 255, "fading": True})
+            self.animations.begin(tile, target_x=abs_x, target_y=abs_y,
+                                  target_grid_x=new_gx, target_grid_y=gy, target_z=new_gz, fading=True)
             animated_tiles.append(tile)
 
         for tile in self.board:
@@ -3386,9 +3495,8 @@ class MahjongGame(QWidget):
                 continue
 
             abs_x, abs_y = self.get_tile_pixel_position(new_gx, gy, new_gz, TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH, self.offset_x, self.offset_y)
-            tile.update({"start_x": tile["x"], "start_y": tile["y"], "target_x": abs_x, "target_y": abs_y,
-                         "target_grid_x": new_gx, "target_grid_y": gy, "target_z": new_gz,
-                         "alpha": 255, "fading": True})
+            self.animations.begin(tile, target_x=abs_x, target_y=abs_y,
+                                  target_grid_x=new_gx, target_grid_y=gy, target_z=new_gz, fading=True)
             animated_tiles.append(tile)
 
         for tile in self.board:
@@ -3428,9 +3536,8 @@ class MahjongGame(QWidget):
 
             abs_x, abs_y = self.get_tile_pixel_position(gx, new_gy, new_gz, TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH,
                                                         self.offset_x, self.offset_y)
-            tile.update({"start_x": tile["x"], "start_y": tile["y"], "target_x": abs_x, "target_y": abs_y,
-                         "target_grid_x": gx, "target_grid_y": new_gy, "target_z": new_gz,
-                         "alpha": 255, "fading": True})
+            self.animations.begin(tile, target_x=abs_x, target_y=abs_y,
+                                  target_grid_x=gx, target_grid_y=new_gy, target_z=new_gz, fading=True)
             animated_tiles.append(tile)
 
         for tile in self.board:
@@ -3478,15 +3585,8 @@ class MahjongGame(QWidget):
                 self.offset_x, self.offset_y
             )
 
-            tile["start_x"] = tile["x"]
-            tile["start_y"] = tile["y"]
-            tile["target_x"] = abs_x
-            tile["target_y"] = abs_y
-            tile["target_grid_x"] = gx
-            tile["target_grid_y"] = new_gy
-            tile["target_z"] = new_gz
-            tile["alpha"] = 255
-            tile["fading"] = True
+            self.animations.begin(tile, target_x=abs_x, target_y=abs_y,
+                                  target_grid_x=gx, target_grid_y=new_gy, target_z=new_gz, fading=True)
 
             animated_tiles.append(tile)
 
@@ -3534,12 +3634,11 @@ class MahjongGame(QWidget):
 
             for new_gy, (_, stack) in zip(range(len(gy_stacks)), gy_stacks):
                 for new_z, tile in enumerate(stack):
-                    tile["start_y"] = tile["y"]
-                    tile["target_y"] = 60 + new_gy * TILE_HEIGHT - new_z * TILE_DEPTH
-                    tile["target_grid_y"] = new_gy
-                    tile["target_z"] = new_z
-                    tile["flicker"] = True  # Give slot tiles a flicker glow
-                    tile["alpha"] = 255
+                    self.animations.begin(
+                        tile,
+                        target_y=60 + new_gy * TILE_HEIGHT - new_z * TILE_DEPTH,
+                        target_grid_y=new_gy, target_z=new_z,
+                        flicker=True)  # Give slot tiles a flicker glow
                     animated_tiles.append(tile)
 
         self.encounter_engine.animate_slot_tiles(animated_tiles, steps=14, interval=20)
@@ -3615,11 +3714,8 @@ class MahjongGame(QWidget):
                     tile_w, tile_h, tile_d, offset_x, offset_y
                 )
 
-                tile["start_x"] = tile["x"]
-                tile["target_x"] = abs_x
-                tile["target_grid_x"] = target_gx
-                tile["fading"] = (gx in [col_order[0], col_order[-1]])  # edge fades
-                tile["alpha"] = 255
+                self.animations.begin(tile, target_x=abs_x, target_grid_x=target_gx,
+                                      fading=(gx in [col_order[0], col_order[-1]]))  # edge fades
                 animated_tiles.append(tile)
 
         self.encounter_engine.animate_parallax_tiles(animated_tiles, steps=10, interval=30)
@@ -3655,7 +3751,6 @@ class MahjongGame(QWidget):
             for tile in stationary:
                 key = (tile["grid_x"], tile["grid_y"], tile["z"])
                 placed[key] = tile
-                tile["alpha"] = 255  # fully opaque
 
             for tile in left_sorted:
                 new_x = tile["grid_x"] + 1
@@ -3664,15 +3759,8 @@ class MahjongGame(QWidget):
                     gx, gz = new_x, z_spot
                     tx = 80 + gx * TILE_WIDTH
                     ty = 60 + gy * TILE_HEIGHT - gz * TILE_DEPTH
-                    tile["start_x"] = tile["x"]
-                    tile["start_y"] = tile["y"]
-                    tile["target_x"] = tx
-                    tile["target_y"] = ty
-                    tile["target_grid_x"] = gx
-                    tile["target_grid_y"] = gy
-                    tile["target_z"] = gz
-                    tile["fading"] = True
-                    tile["alpha"] = 255
+                    self.animations.begin(tile, target_x=tx, target_y=ty,
+                                          target_grid_x=gx, target_grid_y=gy, target_z=gz, fading=True)
                     animated_tiles.append(tile)
                 else:
                     placed[(tile["grid_x"], tile["grid_y"], tile["z"])] = tile
@@ -3684,15 +3772,8 @@ class MahjongGame(QWidget):
                     gx, gz = new_x, z_spot
                     tx = 80 + gx * TILE_WIDTH
                     ty = 60 + gy * TILE_HEIGHT - gz * TILE_DEPTH
-                    tile["start_x"] = tile["x"]
-                    tile["start_y"] = tile["y"]
-                    tile["target_x"] = tx
-                    tile["target_y"] = ty
-                    tile["target_grid_x"] = gx
-                    tile["target_grid_y"] = gy
-                    tile["target_z"] = gz
-                    tile["fading"] = True
-                    tile["alpha"] = 255
+                    self.animations.begin(tile, target_x=tx, target_y=ty,
+                                          target_grid_x=gx, target_grid_y=gy, target_z=gz, fading=True)
                     animated_tiles.append(tile)
                 else:
                     placed[(tile["grid_x"], tile["grid_y"], tile["z"])] = tile
@@ -3704,6 +3785,108 @@ class MahjongGame(QWidget):
         for tile in self.board:
             key = (tile["grid_x"], tile["grid_y"], tile["z"])
             self.tile_positions[key] = tile
+        self.board_index.rebuild(self.board)
+        self.board_journal.publish(self.board_index.generation, [BoardChange("reset", None, None, None)])
+
+    # ── Board mutations ────────────────────────────────────────────────────
+    # Everything that changes which tile sits in which cell goes through these,
+    # so tile_positions, board_index and the journal subscribers stay in step.
+
+    def _pixel_position(self, gx, gy, gz):
+        return self.get_tile_pixel_position(
+            gx, gy, gz, TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH,
+            getattr(self, "offset_x", 0), getattr(self, "offset_y", 0)
+        )
+
+    def _unplace(self, tile):
+        cell = (tile.grid_x, tile.grid_y, tile.z)
+        if self.tile_positions.get(cell) is tile:
+            del self.tile_positions[cell]
+        self.board_index.remove(tile)
+        return cell
+
+    def _place(self, tile):
+        cell = (tile.grid_x, tile.grid_y, tile.z)
+        self.tile_positions[cell] = tile
+        self.board_index.add(tile)
+        return cell
+
+    def move_tiles(self, moves):
+        """
+        Move tiles to new cells. moves: [(tile, (gx, gy, gz), (x, y) or None), ...]
+        All movers leave their cells before any lands, so swaps are safe.
+        Pixel position is recomputed from the cell when not given.
+        """
+        olds = [self._unplace(tile) for tile, _cell, _pixel in moves]
+        changes = []
+        for (tile, (gx, gy, gz), pixel), old in zip(moves, olds):
+            tile.grid_x, tile.grid_y, tile.z = gx, gy, gz
+            tile.x, tile.y = pixel if pixel is not None else self._pixel_position(gx, gy, gz)
+            changes.append(BoardChange("move", tile, old, self._place(tile)))
+        self.board_journal.publish(self.board_index.generation, changes)
+
+    def move_tile(self, tile, gx, gy, gz, pixel=None):
+        self.move_tiles([(tile, (gx, gy, gz), pixel)])
+
+    def remove_tile(self, tile):
+        """Take a tile off the board for good (matched / destroyed)."""
+        if tile in self.board:
+            self.board.remove(tile)
+        old = self._unplace(tile)
+        self.board_journal.publish(self.board_index.generation, [BoardChange("remove", tile, old, None)])
+
+    def rename_tiles(self, renames):
+        """Give tiles new faces in place. renames: [(tile, name), ...]; published as one batch."""
+        changes = []
+        for tile, name in renames:
+            old_name = tile.name
+            self.board_index.remove(tile)
+            tile.name = name
+            self.board_index.add(tile)
+            changes.append(BoardChange("rename", tile, old_name, name))
+        self.board_journal.publish(self.board_index.generation, changes)
+
+    def rename_tile(self, tile, name):
+        self.rename_tiles([(tile, name)])
+
+    def clear_board(self):
+        """Empty the board (new game / reset) and tell the journal subscribers."""
+        self.board.clear()
+        self.tile_positions.clear()
+        self.board_index.clear()
+        self.board_journal.publish(self.board_index.generation, [BoardChange("reset", None, None, None)])
+
+    def reorder_stack(self, key, new_order):
+        """
+        Write z=0..n for the stack at key in the given bottom→top order and keep
+        tile_positions / board_index / pixel positions in sync with it. Tiles not
+        in this stack are ignored; stack members missing from new_order go on top.
+        """
+        gx, gy = key
+        current = self.board_index.stack(gx, gy)
+        members = set(map(id, current))
+        new_order = [t for t in new_order if id(t) in members]
+        listed = set(map(id, new_order))
+        new_order += [t for t in current if id(t) not in listed]
+
+        old_z = {id(t): t.z for t in current}
+        for t in current:
+            if self.tile_positions.get((gx, gy, t.z)) is t:
+                del self.tile_positions[(gx, gy, t.z)]
+        self.board_index.restack(key, new_order)
+
+        changes = []
+        for t in new_order:
+            self.tile_positions[(gx, gy, t.z)] = t
+            t.x, t.y = self._pixel_position(gx, gy, t.z)
+            if old_z[id(t)] != t.z:
+                changes.append(BoardChange("move", t, (gx, gy, old_z[id(t)]), (gx, gy, t.z)))
+        self.board_journal.publish(self.board_index.generation, changes)
+
+    def replace_board(self, tiles):
+        """Swap in a whole new board list (encounter shuffles) and re-index it."""
+        self.board = tiles
+        self.rebuild_tile_positions()
 
     def get_modified_rarity_weights(self):
         weights = self.base_rarity_weights.copy()
@@ -3741,8 +3924,7 @@ class MahjongGame(QWidget):
         random.shuffle(tile_names)
 
         # Reassign names to tiles
-        for tile, new_name in zip(self.board, tile_names):
-            tile["name"] = new_name
+        self.rename_tiles(list(zip(self.board, tile_names)))
 
         # Optional: reset selected tiles
         self.selected_tiles.clear()
@@ -3766,40 +3948,38 @@ class MahjongGame(QWidget):
 
         # Find all tiles that match the selected name and are selectable
         matching_tiles = [
-            tile for tile in self.board
-            if tile["name"] == selected_name and tile != selected_tile and self.is_tile_selectable(tile)
+            tile for tile in self.board_index.tiles_named(selected_name)
+            if tile is not selected_tile and self.is_tile_selectable(tile)
         ]
 
         if not matching_tiles:
             print(f"[HINT] No matching tiles found for: {selected_name}")
+            for tile in self.board_index.tiles_named(selected_name):
+                blockers = self.board_index.blockers_of(tile) if tile is not selected_tile else []
+                if blockers:
+                    names = ", ".join(t["name"] for t in blockers)
+                    print(f"[HINT]   ({tile['grid_x']}, {tile['grid_y']}, {tile['z']}) blocked by: {names}")
             return
 
         print(f"[HINT] Showing possible matches for: {selected_name}")
 
         for tile in matching_tiles:
-            for _ in range(30):
+            for _ in range(self.governor.emit(30)):
                 self.particles.append(SelectedParticle_B(tile["x"], tile["y"], TILE_WIDTH, TILE_HEIGHT))
 
         self.update()
 
     def swap_tarot_tiles_moon_sun(self):
         board = self.board.copy()
-        sun_tiles = [tile for tile in board if tile['name'] == 'thesun']
-        moon_tiles = [tile for tile in board if tile['name'] == 'themoon']
-
-        count = min(len(sun_tiles), len(moon_tiles))
-        for i in range(count):
-            sun = sun_tiles[i]
-            moon = moon_tiles[i]
-
-            # Swap positions
-            sun['grid_x'], moon['grid_x'] = moon['grid_x'], sun['grid_x']
-            sun['grid_y'], moon['grid_y'] = moon['grid_y'], sun['grid_y']
-            sun['z'], moon['z'] = moon['z'], sun['z']
+        sun_tiles = list(self.board_index.tiles_named('thesun'))
+        moon_tiles = list(self.board_index.tiles_named('themoon'))
 
-            # Optional: swap screen positions
-            sun['x'], moon['x'] = moon['x'], sun['x']
-            sun['y'], moon['y'] = moon['y'], sun['y']
+        # Swap grid + screen positions of each sun/moon pair in one batch
+        moves = []
+        for sun, moon in zip(sun_tiles, moon_tiles):
+            moves.append((sun, (moon.grid_x, moon.grid_y, moon.z), (moon.x, moon.y)))
+            moves.append((moon, (sun.grid_x, sun.grid_y, sun.z), (sun.x, sun.y)))
+        self.move_tiles(moves)
 
         return board
 
@@ -3879,28 +4059,21 @@ class MahjongGame(QWidget):
         return None
 
     def is_top_of_stack(self, tile):
-        gx, gy, z = tile.get("grid_x", tile["x"]), tile.get("grid_y", tile["y"]), tile.get("z", 0)
-        return not any(
-            t for t in self.board
-            if t.get("grid_x", t["x"]) == gx and t.get("grid_y", t["y"]) == gy and t.get("z", 0) > z
-        )
+        return self.board_index.is_top(tile)
 
     def _is_exposed(self, tile) -> bool:
         """
         Exposed for Oni = not covered (no tile above in the SAME STACK KEY).
         This prevents moving Devils that are visually under another tile.
         """
-        key = self._stack_key(tile)
-        z = tile.get("z", 0)
-        return not any(self._stack_key(t) == key and t.get("z", 0) > z for t in self.board)
+        return self.board_index.is_top(tile)
 
     def _debug_report_devil_positions(self, label=""):
         DEVIL_KEY = "the devil"
         devils = self._get_type_tiles(DEVIL_KEY)
 
         def stack_stats(t):
-            stack = sorted([s for s in self.board if s["x"] == t["x"] and s["y"] == t["y"]],
-                           key=lambda s: s.get("z", 0))
+            stack = self._stack_tiles_at(t["grid_x"], t["grid_y"])
             topz = stack[-1].get("z", 0) if stack else 0
             return (t.get("z", 0), topz, self._is_exposed(t), len(stack))
 
@@ -3941,10 +4114,11 @@ class MahjongGame(QWidget):
         base_x = gx * self.cell_w if self.USE_PIXEL_COORDS else gx * self.TILE_WIDTH
         base_y = gy * self.cell_h if self.USE_PIXEL_COORDS else gy * self.TILE_HEIGHT
 
-        # Visual stack offsets (example: slight x/y shift per z for depth)
+        # Visual stack offsets (example: slight x/y shift per z for depth);
+        # the key is a grid cell, so the board offset is added back here
         z = tile.get("z", 0)
-        draw_x = self.board_origin_x + base_x + z * getattr(self, "stack_dx", 0)
-        draw_y = self.board_origin_y + base_y - z * getattr(self, "stack_dy", 0)
+        draw_x = self.board_origin_x + getattr(self, "offset_x", 0) + base_x + z * getattr(self, "stack_dx", 0)
+        draw_y = self.board_origin_y + getattr(self, "offset_y", 0) + base_y - z * getattr(self, "stack_dy", 0)
 
         # If you have per-tile animation offsets, add here (dx/dy), not to logic
         draw_x += tile.get("dx", 0)
@@ -3968,12 +4142,11 @@ class MahjongGame(QWidget):
 
     def _normalize_stack_z(self, gx, gy):
         stack = sorted(self._stack_tiles_at(gx, gy), key=lambda t: t.get("z", 0))
-        for i, t in enumerate(stack):
-            t["z"] = i
+        self.reorder_stack((gx, gy), stack)
 
-    def _stack_tiles_at(self, x, y):
-        """All tiles at (x,y)."""
-        return [t for t in self.board if t["x"] == x and t["y"] == y]
+    def _stack_tiles_at(self, gx, gy):
+        """All tiles at grid (gx,gy), bottom→top."""
+        return list(self.board_index.stack(gx, gy))
 
     def _set_stack_order(self, x, y, tiles_bottom_to_top):
         """Write z=0..n for this (x,y) stack according to the given order."""
@@ -3995,35 +4168,22 @@ class MahjongGame(QWidget):
 
     def _stack_key(self, tile):
         """
-        Logical stack key for a tile. If x,y are board pixels aligned to your grid,
-        quantize by TILE sizes. If they’re already grid coords, this still works.
+        Logical stack key for a tile: its (grid_x, grid_y) cell, the same key
+        tile_positions and board_index use. Pixel x,y drift during animations.
         """
-        tw = getattr(self, "TILE_WIDTH", TILE_WIDTH)
-        th = getattr(self, "TILE_HEIGHT", TILE_HEIGHT)
-        gx = int(math.floor(tile["x"] / max(tw, 1)))
-        gy = int(math.floor(tile["y"] / max(th, 1)))
-        return (gx, gy)
+        return (tile["grid_x"], tile["grid_y"])
 
     def _tiles_in_stack(self, key):
         """All tiles that share the same stack (by key), sorted bottom→top."""
-        gx, gy = key
-
-        def key_of(t): return self._stack_key(t) == (gx, gy)
-
-        return sorted([t for t in self.board if key_of(t)], key=lambda t: t.get("z", 0))
+        return list(self.board_index.stack(*key))
 
     def _reindex_stack(self, key):
         """Write z=0..n for the stack at key."""
-        stack = self._tiles_in_stack(key)
-        for i, t in enumerate(stack):
-            t["z"] = i
+        self.reorder_stack(key, self._tiles_in_stack(key))
 
     def _send_to_bottom_of_current_stack(self, tile):
         """Make this tile the bottom (z=0) of its current stack."""
-        x, y = tile["x"], tile["y"]
-        # Set temporary negative z so it sorts to the bottom, then normalize
-        tile["z"] = -1
-        self._normalize_stack_z(x, y)
+        self._move_tile_to_bottom_of_current_stack(tile)
 
     def _move_tile_to_bottom_of_current_stack(self, tile):
         """
@@ -4037,8 +4197,7 @@ class MahjongGame(QWidget):
         others = [t for t in stack if t is not tile]
         new_order = [tile] + others
         # write back
-        for i, t in enumerate(new_order):
-            t["z"] = i
+        self.reorder_stack(key, new_order)
 
     def _find_nearest_stack_horiz(self, sx, sy):
         """
@@ -4048,15 +4207,7 @@ class MahjongGame(QWidget):
         s_key = self._stack_key_from_xy(sx, sy)
         sgx, sgy = s_key
 
-        occupied = {self._stack_key(t) for t in self.board}
-        row = sorted({(gx, gy) for (gx, gy) in occupied if gy == sgy and gx != sgx})
-        if not row:
-            return None
-
-        left = [gx for gx, gy in row if gx < sgx]
-        right = [gx for gx, gy in row if gx > sgx]
-        left_choice = max(left) if left else None
-        right_choice = min(right) if right else None
+        left_choice, right_choice = self._stack_rows().neighbours(sgx, sgy)
 
         if left_choice is None and right_choice is None:
             return None
@@ -4083,7 +4234,7 @@ class MahjongGame(QWidget):
         gx, gy = tile["grid_x"], tile["grid_y"]
 
         # Get all tiles in this grid column (including the target tile)
-        stack = [t for t in self.board if t["grid_x"] == gx and t["grid_y"] == gy]
+        stack = self._stack_tiles_at(gx, gy)
 
         if len(stack) <= 1:
             print("[BANISH] No stack to modify.")
@@ -4091,12 +4242,8 @@ class MahjongGame(QWidget):
 
         print(f"[BANISH] Reordering stack at ({gx}, {gy}). Stack size: {len(stack)})")
 
-        # Step 1: Increment z of all tiles in the stack
-        for t in stack:
-            t["z"] += 1
-
-        # Step 2: Move selected tile to z = 0
-        tile["z"] = 0
+        # Move selected tile to z = 0, everything else shifts up one
+        self.reorder_stack((gx, gy), [tile] + [t for t in stack if t is not tile])
 
         print(f"[BANISH] Tile '{tile['name']}' moved to bottom (z=0).")
 
@@ -4113,8 +4260,8 @@ class MahjongGame(QWidget):
 
         # Step 1: Find the closest matching tile
         matching_tiles = [
-            t for t in self.board
-            if t != tile and t["name"] == tile_name
+            t for t in self.board_index.tiles_named(tile_name)
+            if t is not tile
         ]
 
         if not matching_tiles:
@@ -4127,55 +4274,39 @@ class MahjongGame(QWidget):
         )
 
         # Step 2: Find the closest selectable tile with no available match
+        type_counts = self._selectable_type_counts()
+
         def has_available_match(target):
-            return any(
-                other for other in self.board
-                if other != target and
-                other["name"] == target["name"] and
-                self.is_tile_selectable(other) and
-                self.is_tile_selectable(target)
-            )
+            return self.is_tile_selectable(target) and type_counts[target.type_id] >= 2
 
-        nonmatch_tiles = [
-            t for t in self.board
-            if t != matching_tile and
-               self.is_tile_selectable(t) and
-               not has_available_match(t)
-        ]
+        swap_target = self._selectable_nearest().nearest(
+            matching_tile.x, matching_tile.y,
+            accept=lambda t: t is not matching_tile and not has_available_match(t)
+        )
 
-        if not nonmatch_tiles:
+        if swap_target is None:
             print("[DOPPELGANGER] No unmatchable selectable tiles found.")
             return
 
-        swap_target = min(
-            nonmatch_tiles,
-            key=lambda t: (t["x"] - matching_tile["x"]) ** 2 + (t["y"] - matching_tile["y"]) ** 2
-        )
-
         # Step 3: Swap grid positions and z
         print(f"[DOPPELGANGER] Swapping '{matching_tile['name']}' with unmatchable '{swap_target['name']}'")
 
-        matching_tile["grid_x"], swap_target["grid_x"] = swap_target["grid_x"], matching_tile["grid_x"]
-        matching_tile["grid_y"], swap_target["grid_y"] = swap_target["grid_y"], matching_tile["grid_y"]
-        matching_tile["x"], swap_target["x"] = swap_target["x"], matching_tile["x"]
-        matching_tile["y"], swap_target["y"] = swap_target["y"], matching_tile["y"]
-        matching_tile["z"], swap_target["z"] = swap_target["z"], matching_tile["z"]
+        self._swap_tiles(matching_tile, swap_target)
 
         # Refresh game state
         self.update_game_state()
         self.update()
 
     def _swap_tiles(self, t1, t2):
-        t1["grid_x"], t2["grid_x"] = t2["grid_x"], t1["grid_x"]
-        t1["grid_y"], t2["grid_y"] = t2["grid_y"], t1["grid_y"]
-        t1["x"], t2["x"] = t2["x"], t1["x"]
-        t1["y"], t2["y"] = t2["y"], t1["y"]
-        t1["z"], t2["z"] = t2["z"], t1["z"]
+        self.move_tiles([
+            (t1, (t2.grid_x, t2.grid_y, t2.z), (t2.x, t2.y)),
+            (t2, (t1.grid_x, t1.grid_y, t1.z), (t1.x, t1.y)),
+        ])
 
     def force_death_tiles_selectable(self):
         print("[BANSHEE] Forcing Death tiles into guaranteed selectable positions...")
 
-        death_tiles = [t for t in self.board if t['name'] == "death"]
+        death_tiles = list(self.board_index.tiles_named("death"))
         print(f"[BANSHEE] Found {len(death_tiles)} Death tiles.")
 
         if not death_tiles:
@@ -4183,17 +4314,12 @@ class MahjongGame(QWidget):
             return
 
         # Get all selectable tiles
-        selectable_tiles = [t for t in self.board if self.is_tile_selectable(t)]
+        selectable_tiles = self.get_selectable_tiles()
         print(f"[BANSHEE] Found {len(selectable_tiles)} currently selectable tiles.")
 
         # Classify: Selectable tiles with no match
-        unmatched_selectables = [
-            t for t in selectable_tiles
-            if not any(
-                other for other in self.board
-                if other != t and other["name"] == t["name"] and self.is_tile_selectable(other)
-            )
-        ]
+        type_counts = self._selectable_type_counts()
+        unmatched_selectables = [t for t in selectable_tiles if type_counts[t.type_id] < 2]
         print(f"[BANSHEE] Found {len(unmatched_selectables)} unmatched selectable tiles.")
 
         # Replace unmatched selectable tiles with Death tiles
@@ -4277,32 +4403,20 @@ class MahjongGame(QWidget):
                     f"[DULLAHAN] Moving '{tile['name']}' from ({original_gx},{original_gy},{original_z}) → ({gx},{gy},{gz})")
 
                 # Compute pixel positions using offsets
-                start_x, start_y = tile["x"], tile["y"]
                 target_x, target_y = self.get_tile_pixel_position(
                     gx, gy, gz, TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH,
                     self.offset_x, self.offset_y
                 )
 
                 # Prepare for animation
-                tile.update({
-                    "start_x": start_x,
-                    "start_y": start_y,
-                    "target_x": target_x,
-                    "target_y": target_y,
-                    "target_grid_x": gx,
-                    "target_grid_y": gy,
-                    "target_z": gz,
-                    "alpha": 255,
-                    "fading": False
-                })
+                self.animations.begin(tile, target_x=target_x, target_y=target_y,
+                                      target_grid_x=gx, target_grid_y=gy, target_z=gz)
                 animated_tiles.append(tile)
 
                 # Reveal top tile below original
                 stack_below = [
-                    t for t in self.board
-                    if t["grid_x"] == original_gx and
-                       t["grid_y"] == original_gy and
-                       t["z"] < original_z
+                    t for t in self.board_index.stack(original_gx, original_gy)
+                    if t["z"] < original_z
                 ]
                 if stack_below:
                     top_below = max(stack_below, key=lambda t: t["z"])
@@ -4324,58 +4438,42 @@ class MahjongGame(QWidget):
         gx, gy = tile["grid_x"], tile["grid_y"]
         self.calculate_grid_bounds()
         search_radius = 5
-        candidates = []
+        index = self.board_index
 
-        for dx in range(-search_radius, search_radius + 1):
-            for dy in range(-search_radius, search_radius + 1):
-                test_gx = gx + dx
-                test_gy = gy + dy
+        # Window cells nearest-first: the first one that passes is the landing
+        for dx, dy in window_offsets(search_radius):
+            test_gx = gx + dx
+            test_gy = gy + dy
 
-                if (
-                        test_gx < self.min_grid_x or test_gx > self.max_grid_x or
-                        test_gy < self.min_grid_y or test_gy > self.max_grid_y
-                ):
-                    continue
-
-                if (test_gx, test_gy) in used_positions:
-                    continue
+            if (
+                    test_gx < self.min_grid_x or test_gx > self.max_grid_x or
+                    test_gy < self.min_grid_y or test_gy > self.max_grid_y
+            ):
+                continue
 
-                stack = [t for t in self.board if t["grid_x"] == test_gx and t["grid_y"] == test_gy]
-                test_z = max([t["z"] for t in stack], default=-1) + 1
+            if (test_gx, test_gy) in used_positions:
+                continue
 
-                if test_z >= original_z:
-                    continue  # ⛔ Only move downwards
+            top = index.top(test_gx, test_gy)
+            test_z = top.z + 1 if top else 0
 
-                if test_z > 0 and not any(
-                        t for t in self.board
-                        if t["grid_x"] == test_gx and t["grid_y"] == test_gy and t["z"] == test_z - 1
-                ):
-                    continue  # Must be supported
+            if test_z >= original_z:
+                continue  # ⛔ Only move downwards
 
-                left_blocked = any(
-                    t for t in self.board
-                    if t["z"] == test_z and t["grid_x"] == test_gx - 1 and t["grid_y"] == test_gy
-                )
-                right_blocked = any(
-                    t for t in self.board
-                    if t["z"] == test_z and t["grid_x"] == test_gx + 1 and t["grid_y"] == test_gy
-                )
-                if left_blocked or right_blocked:
-                    continue  # Must be horizontally free (selectable)
+            if test_z > 0 and not index.occupied(test_gx, test_gy, test_z - 1):
+                continue  # Must be supported
 
-                if any(
-                        t for t in self.board
-                        if t["grid_x"] == test_gx and t["grid_y"] == test_gy and t["z"] == test_z
-                ):
-                    continue  # Already occupied
+            left_blocked = index.occupied(test_gx - 1, test_gy, test_z)
+            right_blocked = index.occupied(test_gx + 1, test_gy, test_z)
+            if left_blocked or right_blocked:
+                continue  # Must be horizontally free (selectable)
 
-                candidates.append(((test_gx, test_gy, test_z), dx ** 2 + dy ** 2))
+            if index.occupied(test_gx, test_gy, test_z):
+                continue  # Already occupied
 
-        if not candidates:
-            return None
+            return (test_gx, test_gy, test_z)
 
-        candidates.sort(key=lambda c: c[1])  # Sort by distance
-        return candidates[0][0]
+        return None
 
     def arachne_swap(self, item):
         if item["charges"] <= 0:
@@ -4397,34 +4495,22 @@ class MahjongGame(QWidget):
 
         swap_pairs = []
         for (gx1, gy1), (gx2, gy2) in corner_pairs:
-            stack1 = [t for t in self.board if t["grid_x"] == gx1 and t["grid_y"] == gy1]
-            stack2 = [t for t in self.board if t["grid_x"] == gx2 and t["grid_y"] == gy2]
+            top1 = self.board_index.top(gx1, gy1)
+            top2 = self.board_index.top(gx2, gy2)
 
-            if not stack1 or not stack2:
+            if not top1 or not top2:
                 continue
 
-            top1 = max(stack1, key=lambda t: t["z"])
-            top2 = max(stack2, key=lambda t: t["z"])
-
             # Setup animation targets
             temp_x1, temp_y1 = self.get_tile_pixel_position(gx2, gy2, top2["z"], TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH,
                                                             self.offset_x, self.offset_y)
             temp_x2, temp_y2 = self.get_tile_pixel_position(gx1, gy1, top1["z"], TILE_WIDTH, TILE_HEIGHT, TILE_DEPTH,
                                                             self.offset_x, self.offset_y)
 
-            top1.update({
-                "start_x": top1["x"], "start_y": top1["y"],
-                "target_x": temp_x1, "target_y": temp_y1,
-                "target_grid_x": gx2, "target_grid_y": gy2, "target_z": top2["z"],
-                "fading": False, "alpha": 255
-            })
-
-            top2.update({
-                "start_x": top2["x"], "start_y": top2["y"],
-                "target_x": temp_x2, "target_y": temp_y2,
-                "target_grid_x": gx1, "target_grid_y": gy1, "target_z": top1["z"],
-                "fading": False, "alpha": 255
-            })
+            self.animations.begin(top1, target_x=temp_x1, target_y=temp_y1,
+                                  target_grid_x=gx2, target_grid_y=gy2, target_z=top2["z"])
+            self.animations.begin(top2, target_x=temp_x2, target_y=temp_y2,
+                                  target_grid_x=gx1, target_grid_y=gy1, target_z=top1["z"])
 
             swap_pairs.append((top1, top2))
 
@@ -4504,7 +4590,8 @@ class MahjongGame(QWidget):
         if all_exposed_and_z0:
             removed_count = len(devils)
             before = len(self.board)
-            self.board = [t for t in self.board if not self._is_tile_type(t, DEVIL_KEY)]
+            for t in devils:
+                self.remove_tile(t)
             after = len(self.board)
             gained = 666 * (removed_count // 2)
             self.score += gained
@@ -4517,7 +4604,8 @@ class MahjongGame(QWidget):
         moved = 0
         for t in self._get_type_tiles(DEVIL_KEY):
             if t.get("z", 0) == 0 and self._is_exposed(t):
-                target = self._find_nearest_stack_horiz(t["x"], t["y"])
+                # grid cell, not pixels: with USE_PIXEL_COORDS off _stack_key_from_xy takes grid coords
+                target = self._find_nearest_stack_horiz(t["grid_x"], t["grid_y"])
                 if target is not None:
                     tx, ty = target
                     self._move_tile_to_stack_bottom(t, tx, ty)  # ← no -1, proper reindex
@@ -4537,24 +4625,13 @@ class MahjongGame(QWidget):
         src_key = self._stack_key(tile)
         dst_key = self._stack_key_from_xy(tx, ty)
 
-        # remove from source
-        src_stack = [t for t in self._tiles_in_stack(src_key) if t is not tile]
-        for i, t in enumerate(src_stack):
-            t["z"] = i
-
-        # add to destination at bottom
+        # move onto the destination stack, then reorder it so the tile is at the bottom
         dst_stack = self._tiles_in_stack(dst_key)
-        new_order = [tile] + dst_stack
-        for i, t in enumerate(new_order):
-            # IMPORTANT: set tile’s logical stack position to dst key
-            if t is tile:
-                # if you store grid index separately, set those here instead of raw x,y
-                if self.USE_PIXEL_COORDS:
-                    t["x"] = dst_key[0] * self.cell_w
-                    t["y"] = dst_key[1] * self.cell_h
-                else:
-                    t["x"], t["y"] = dst_key
-            t["z"] = i
+        self.move_tile(tile, dst_key[0], dst_key[1], len(dst_stack))
+        self.reorder_stack(dst_key, [tile] + dst_stack)
+
+        # source closes the gap
+        self.reorder_stack(src_key, self._tiles_in_stack(src_key))
 
     def apply_wendigo_start_of_round(self):
         w = self.get_item_by_id("wendigo")
@@ -4662,6 +4739,9 @@ class MahjongGame(QWidget):
         """Board pixels → integer grid cell."""
         tw = getattr(self, "TILE_WIDTH", TILE_WIDTH)
         th = getattr(self, "TILE_HEIGHT", TILE_HEIGHT)
+        # tile pixels include the board offset; stack keys are grid cells (see _stack_key)
+        bx -= getattr(self, "offset_x", 0)
+        by -= getattr(self, "offset_y", 0)
         return (int(math.floor(bx / max(tw, 1))),
                 int(math.floor(by / max(th, 1))))
 
@@ -4718,9 +4798,7 @@ class MahjongGame(QWidget):
             stack = self._tiles_in_stack(key)
             if not stack:
                 continue
-            new_order = list(reversed(stack))
-            for i, t in enumerate(new_order):
-                t["z"] = i
+            self.reorder_stack(key, list(reversed(stack)))
             inverted += 1
 
         # Effect is now active: persistent emit + side-free select in these stacks
@@ -4784,8 +4862,7 @@ class MahjongGame(QWidget):
             # Append any newcomers (should be rare), preserving their current relative order
             extras = [t for t in current if t not in restored_order]
             new_order = restored_order + extras
-            for i, t in enumerate(new_order):
-                t["z"] = i
+            self.reorder_stack(key, new_order)
             restored += 1
 
         print(f"[CERBERUS] Non-marked match detected → reverted {restored} stack(s) and clearing effect.")
@@ -4800,7 +4877,7 @@ class MahjongGame(QWidget):
 
         # purge existing particles we tagged
         if hasattr(self, "particles"):
-            self.particles = [p for p in self.particles if getattr(p, "tag", None) != "cerberus"]
+            self.particles.remove_tag("cerberus")
 
     def _cerberus_emit_particles(self):
         if not getattr(self, "cerberus_effect_active", False):
@@ -4816,7 +4893,7 @@ class MahjongGame(QWidget):
             if not stack:
                 continue
             sx, sy, sw, sh = self._tile_screen_rect(stack[-1])
-            for _ in range(6):  # raise for more density
+            for _ in range(self.governor.emit(6)):  # raise for more density
                 try:
                     p = SelectedParticle_Fire(int(sx), int(sy), int(sw), int(sh))
                 except TypeError:
@@ -4840,10 +4917,7 @@ class MahjongGame(QWidget):
             present = [(t, z) for (t, z) in original if t in self.board]
             # Sort by original z then write z=0..n
             present.sort(key=lambda pair: pair[1])
-            for i, (t, _z) in enumerate(present):
-                t["z"] = i
-            # Ensure contiguous
-            self._reindex_stack(key)
+            self.reorder_stack(key, [t for (t, _z) in present])
 
         self.cerberus_active = False
         self.cerberus_marked_stacks = set()
@@ -4852,8 +4926,28 @@ class MahjongGame(QWidget):
         print(f"[CERBERUS] Reverted stacks due to {reason}.")
         self.update_canvas()
 
+    @memoize_per_generation
     def _occupied_stack_keys(self):
-        return {self._stack_key(t) for t in self.board}
+        return set(self.board_index.stack_keys())
+
+    @memoize_per_generation
+    def _stack_key_nearest(self):
+        """Nearest-neighbour lookup over occupied stack keys."""
+        index = NearestIndex(bucket_size=4)
+        index.rebuild((gx, gy, (gx, gy)) for gx, gy in self.board_index.stack_keys())
+        return index
+
+    @memoize_per_generation
+    def _stack_rows(self):
+        """Occupied stack columns per row, for left/right neighbour lookups."""
+        return RowIndex(self.board_index.stack_keys())
+
+    @memoize_per_generation
+    def _selectable_nearest(self):
+        """Nearest-neighbour lookup over selectable tiles by pixel position."""
+        index = NearestIndex(bucket_size=TILE_HEIGHT * 2)
+        index.rebuild((t.x, t.y, t) for t in self.board if self.is_tile_selectable(t))
+        return index
 
     def _stack_key_from_point(self, px, py, *, snap=True):
         """Screen click → (snapped) stack key or None."""
@@ -4887,7 +4981,7 @@ class MahjongGame(QWidget):
 
         if not occ:
             return None
-        nearest = min(occ, key=lambda k: (k[0] - rx) ** 2 + (k[1] - ry) ** 2)
+        nearest = self._stack_key_nearest().nearest(rx, ry)
         cheby = max(abs(nearest[0] - rx), abs(nearest[1] - ry))
         return nearest if cheby <= max_dist_keys else None
 
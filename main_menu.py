@@ -3,6 +3,9 @@ import os
 import math
 import random
 from paths import asset
+from text_cache import render_text
+from sprite_cache import TiledBackground
+from asset_manager import load_image
 import threading
 vergilia = os.path.join("assets", "fonts", "vergilia.ttf")
 Aveschon = os.path.join("assets", "fonts", "Aveschon.otf")
@@ -38,7 +41,8 @@ class MainMenuOverlay:
 
         # Load background tile
         bg_path = os.path.join("assets", "bg", "bg.png")
-        self.background_tile = pygame.image.load(bg_path).convert()
+        self.background_tile = load_image(bg_path, alpha=False)
+        self.background = TiledBackground(self.background_tile)
 
         # Shrunk emitter
         self.emitter_center = (469, 372)
@@ -313,15 +317,7 @@ class MainMenuOverlay:
         self.bg_scroll_y = (self.bg_scroll_y + self.bg_scroll_speed_y) % self.background_tile.get_height()
 
     def draw_scrolling_background(self):
-        tile_w, tile_h = self.background_tile.get_size()
-        screen_w, screen_h = self.surface.get_size()
-
-        start_x = -int(self.bg_scroll_x)
-        start_y = -int(self.bg_scroll_y)
-
-        for x in range(start_x, screen_w, tile_w):
-            for y in range(start_y, screen_h, tile_h):
-                self.surface.blit(self.background_tile, (x, y))
+        self.background.draw(self.surface, self.bg_scroll_x, self.bg_scroll_y)
 
     def draw_particles(self):
         cx, cy = self.emitter_center
@@ -384,6 +380,12 @@ class MainMenuOverlay:
             thread.start()
             thread.join()  # Optional: remove if you don't need particles immediately
 
+    def draw_title(self):
+        # White title with a 2px black outline (8 directions), composited once
+        outlined = render_text(self.logo_font_2, "Curiosa", (255, 255, 255),
+                               outline=(0, 0, 0), outline_width=2, diagonals=True)
+        self.surface.blit(outlined, self.title_rect.move(-2, -2))
+
     def draw(self):
         self.draw_scrolling_background()
 
@@ -403,33 +405,20 @@ class MainMenuOverlay:
         self.surface.blit(self.logo, self.logo_rect)
 
         if self.title_surf_2:
-            outline_offsets = [(-2, 0), (2, 0), (0, -2), (0, 2), (-2, -2), (-2, 2), (2, -2), (2, 2)]
-            for ox, oy in outline_offsets:
-                outline_pos = self.title_rect.move(ox, oy)
-                outline_surf = self.logo_font_2.render("Curiosa", True, (0, 0, 0))
-                self.surface.blit(outline_surf, outline_pos)
-
-            self.surface.blit(self.title_surf_2, self.title_rect)
+            self.draw_title()
 
 
 
         # Draw black background behind title
         if self.title_surf_2:
-            outline_offsets = [(-2, 0), (2, 0), (0, -2), (0, 2), (-2, -2), (-2, 2), (2, -2), (2, 2)]
-            for ox, oy in outline_offsets:
-                outline_pos = self.title_rect.move(ox, oy)
-                outline_surf = self.logo_font_2.render("Curiosa", True, (0, 0, 0))
-                self.surface.blit(outline_surf, outline_pos)
-
-            # White foreground text
-            self.surface.blit(self.title_surf_2, self.title_rect)
+            self.draw_title()
 
         # Draw buttons
         for button in self.buttons:
             pygame.draw.rect(self.surface, (50, 50, 50), button["rect"])
             pygame.draw.rect(self.surface, (200, 200, 200), button["rect"], 2)
 
-            label_surf = self.font.render(button["label"], True, (255, 255, 255))
+            label_surf = render_text(self.font, button["label"], (255, 255, 255))
             label_rect = label_surf.get_rect(center=button["rect"].center)
             self.surface.blit(label_surf, label_rect)
 
@@ -447,10 +436,9 @@ if __name__ == "__main__":
     pygame.display.set_caption("Curiosa")
     font = pygame.font.SysFont("Arial", 48)
 
-    try:
-        logo = pygame.image.load("assets/logo.png").convert_alpha()
-    except Exception as e:
-        print(f"[ERROR] Could not load logo image: {e}")
+    logo = load_image("assets/logo.png")
+    if logo is None:
+        print("[ERROR] Could not load logo image")
         logo = pygame.Surface((200, 100), pygame.SRCALPHA)
         pygame.draw.rect(logo, (255, 255, 255), logo.get_rect(), 2)
 
@@ -0,0 +1,97 @@
+# nearest_index.py
+import bisect
+import functools
+import math
+
+
+class NearestIndex:
+    """
+    Grid-bucket nearest-neighbour lookup over 2D points (stack keys or
+    pixel positions). Queries search outward ring by ring and stop once no
+    unvisited bucket can hold anything closer.
+
+    Ties go to the point inserted first, same as min() over the original list.
+    """
+
+    def __init__(self, bucket_size):
+        self.bucket_size = bucket_size
+        self.buckets = {}  # (bx, by) -> [(seq, x, y, item), ...]
+        self.count = 0
+        self.min_b = self.max_b = None
+
+    def insert(self, x, y, item):
+        b = self.bucket_size
+        key = (math.floor(x / b), math.floor(y / b))
+        self.buckets.setdefault(key, []).append((self.count, x, y, item))
+        self.count += 1
+        if self.min_b is None:
+            self.min_b, self.max_b = key, key
+        else:
+            self.min_b = (min(self.min_b[0], key[0]), min(self.min_b[1], key[1]))
+            self.max_b = (max(self.max_b[0], key[0]), max(self.max_b[1], key[1]))
+
+    def rebuild(self, entries):
+        """entries: iterable of (x, y, item)"""
+        self.buckets.clear()
+        self.count = 0
+        self.min_b = self.max_b = None
+        for x, y, item in entries:
+            self.insert(x, y, item)
+
+    def nearest(self, x, y, accept=None):
+        """Closest item (squared euclidean) passing accept(item), or None."""
+        if not self.buckets:
+            return None
+        b = self.bucket_size
+        qx, qy = math.floor(x / b), math.floor(y / b)
+        max_ring = max(abs(qx - self.min_b[0]), abs(qx - self.max_b[0]),
+                       abs(qy - self.min_b[1]), abs(qy - self.max_b[1]))
+        best = None  # (d2, seq, item)
+        for r in range(max_ring + 1):
+            for bx in range(qx - r, qx + r + 1):
+                edge = bx in (qx - r, qx + r)
+                for by in (range(qy - r, qy + r + 1) if edge else (qy - r, qy + r)):
+                    for seq, px, py, item in self.buckets.get((bx, by), ()):
+                        d2 = (px - x) ** 2 + (py - y) ** 2
+                        if best is not None and (d2, seq) >= best[:2]:
+                            continue
+                        if accept is not None and not accept(item):
+                            continue
+                        best = (d2, seq, item)
+            # anything in ring r+1 is at least r*b away from the query
+            if best is not None and best[0] <= (r * b) ** 2:
+                break
+        return best[2] if best else None
+
+
+class RowIndex:
+    """Occupied stack columns per row, sorted, for left/right neighbour lookups."""
+
+    def __init__(self, keys=()):
+        rows = {}
+        for gx, gy in keys:
+            rows.setdefault(gy, []).append(gx)
+        for xs in rows.values():
+            xs.sort()
+        self.rows = rows
+
+    def neighbours(self, gx, gy):
+        """(nearest gx to the left, nearest gx to the right) on row gy; None if absent."""
+        xs = self.rows.get(gy)
+        if not xs:
+            return None, None
+        i = bisect.bisect_left(xs, gx)
+        left = xs[i - 1] if i > 0 else None
+        j = bisect.bisect_right(xs, gx)
+        right = xs[j] if j < len(xs) else None
+        return left, right
+
+
+@functools.lru_cache(maxsize=None)
+def window_offsets(radius):
+    """(dx, dy) offsets of a square window, nearest first (stable for equal distance)."""
+    offsets = [(dx, dy)
+               for dx in range(-radius, radius + 1)
+               for dy in range(-radius, radius + 1)]
+    offsets.sort(key=lambda o: o[0] ** 2 + o[1] ** 2)
+    return tuple(offsets)
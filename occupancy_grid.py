@@ -0,0 +1,91 @@
+# occupancy_grid.py
+try:
+    import numpy as np
+except ImportError:  # optional: BoardIndex falls back to its per-tile checks
+    np = None
+
+EMPTY = -1
+
+
+class OccupancyGrid:
+    """
+    Array-backed copy of the board: grid[z, gy, gx] is the tile type id in
+    that cell, EMPTY (-1) if the cell is free. The grid keeps a small margin
+    around the occupied cells and grows when a tile lands outside it.
+
+    Whole-board selectability (nothing above, not both sides blocked) is a
+    handful of shifted-array comparisons instead of a per-tile loop.
+    """
+
+    available = np is not None
+    MARGIN = 2
+
+    def __init__(self):
+        self.grid = np.full((1, 1, 1), EMPTY, dtype=np.int16)
+        self.origin_x = 0
+        self.origin_y = 0
+
+    def rebuild(self, cells):
+        """cells: {(gx, gy, gz): tile}"""
+        if not cells:
+            self.grid = np.full((1, 1, 1), EMPTY, dtype=np.int16)
+            self.origin_x = self.origin_y = 0
+            return
+        keys = np.array(list(cells), dtype=np.int64)
+        gx, gy, gz = keys[:, 0], keys[:, 1], keys[:, 2]
+        self._allocate(int(gx.min()), int(gy.min()), int(gx.max()), int(gy.max()), int(gz.max()))
+        self.grid[gz, gy - self.origin_y, gx - self.origin_x] = [t.type_id for t in cells.values()]
+
+    def _allocate(self, min_x, min_y, max_x, max_y, max_z):
+        m = self.MARGIN
+        self.origin_x = min_x - m
+        self.origin_y = min_y - m
+        cols = max_x - self.origin_x + 1 + m
+        rows = max_y - self.origin_y + 1 + m
+        self.grid = np.full((max_z + 1 + m, rows, cols), EMPTY, dtype=np.int16)
+
+    def _contains(self, gx, gy, gz):
+        depth, rows, cols = self.grid.shape
+        return (0 <= gz < depth and
+                0 <= gy - self.origin_y < rows and
+                0 <= gx - self.origin_x < cols)
+
+    def _grow(self, gx, gy, gz):
+        old, ox, oy = self.grid, self.origin_x, self.origin_y
+        depth, rows, cols = old.shape
+        self._allocate(min(ox, gx), min(oy, gy),
+                       max(ox + cols - 1, gx), max(oy + rows - 1, gy), max(depth - 1, gz))
+        dx, dy = ox - self.origin_x, oy - self.origin_y
+        self.grid[:depth, dy:dy + rows, dx:dx + cols] = old
+
+    def set(self, gx, gy, gz, type_id):
+        if gz < 0:
+            return
+        if not self._contains(gx, gy, gz):
+            self._grow(gx, gy, gz)
+        self.grid[gz, gy - self.origin_y, gx - self.origin_x] = type_id
+
+    def clear(self, gx, gy, gz):
+        if self._contains(gx, gy, gz):
+            self.grid[gz, gy - self.origin_y, gx - self.origin_x] = EMPTY
+
+    # ── Vectorized queries ────────────────────────────────────────────────
+    def selectable_mask(self):
+        occ = self.grid >= 0
+        covered = np.zeros_like(occ)
+        covered[:-1] = occ[1:]
+        left = np.zeros_like(occ)
+        left[:, :, 1:] = occ[:, :, :-1]
+        right = np.zeros_like(occ)
+        right[:, :, :-1] = occ[:, :, 1:]
+        return occ & ~covered & ~(left & right)
+
+    def selectable_cells(self):
+        """[(gx, gy, gz), ...] for every selectable cell."""
+        zs, ys, xs = np.nonzero(self.selectable_mask())
+        return list(zip((xs + self.origin_x).tolist(), (ys + self.origin_y).tolist(), zs.tolist()))
+
+    def type_counts(self, mask=None, minlength=0):
+        """Tiles per type id (optionally only where mask is set)."""
+        values = self.grid[mask] if mask is not None else self.grid[self.grid >= 0]
+        return np.bincount(values.astype(np.intp), minlength=minlength)
@@ -3,7 +3,9 @@ import json
 import random
 import pygame
 import traceback
-from constants import TILE_WIDTH, TILE_HEIGHT, ITEMS, BASE_DIR
+from constants import TILE_WIDTH, TILE_HEIGHT, ITEMS
+from text_cache import render_text
+from asset_manager import load_image
 
 
 class Shop:
@@ -116,7 +118,7 @@ class Shop:
     def __draw_shop_message(self):
         if self.shop_message:
             y = self.surface.get_height() - 70  # Adjust up/down
-            msg = self.gui_font.render(self.shop_message, True, (255, 100, 100))
+            msg = render_text(self.gui_font, self.shop_message, (255, 100, 100))
             self.surface.blit(msg, (80, y))
 
     def __draw_overlay_background(self):
@@ -142,15 +144,13 @@ class Shop:
 
             # Draw icon
             if img_path:
-                full_path = os.path.join(BASE_DIR, img_path)
-                if os.path.exists(full_path):
-                    icon = pygame.image.load(full_path).convert_alpha()
-                    icon = pygame.transform.scale(icon, (TILE_WIDTH, TILE_HEIGHT))
+                icon = load_image(img_path, (TILE_WIDTH, TILE_HEIGHT))
+                if icon:
                     self.surface.blit(icon, (x + 10, y + 5))
 
             # Draw name and cost
-            name_text = self.item_font.render(name, True, (255, 255, 255))
-            cost_text = self.money_font.render(f"{cost} pts", True, (255, 255, 100))
+            name_text = render_text(self.item_font, name, (255, 255, 255))
+            cost_text = render_text(self.money_font, f"{cost} pts", (255, 255, 100))
             self.surface.blit(name_text, (x + TILE_WIDTH + 20, y + 5))
             self.surface.blit(cost_text, (x + TILE_WIDTH + 20, y + TILE_HEIGHT // 2))
 
@@ -191,8 +191,8 @@ class Shop:
                                     shadow_color, shadow_offset)
 
     def __draw_title_and_wallet(self):
-        self.surface.blit(self.gui_font.render("Welcome to the Shop", True, (255, 255, 255)), (80, 60))
-        self.surface.blit(self.money_font.render(f"Wallet: {self.wallet} pts", True, (255, 255, 100)), (80, 100))
+        self.surface.blit(render_text(self.gui_font, "Welcome to the Shop", (255, 255, 255)), (80, 60))
+        self.surface.blit(render_text(self.money_font, f"Wallet: {self.wallet} pts", (255, 255, 100)), (80, 100))
 
     def __draw_items(self):
         self.shop_button_rects.clear()
@@ -205,14 +205,12 @@ class Shop:
             item_rect = pygame.Rect(80, y, 400, TILE_HEIGHT + 10)
 
             if img_path:
-                full_path = os.path.join(BASE_DIR, img_path)
-                if os.path.exists(full_path):
-                    icon = pygame.image.load(full_path).convert_alpha()
-                    icon = pygame.transform.scale(icon, (TILE_WIDTH, TILE_HEIGHT))
+                icon = load_image(img_path, (TILE_WIDTH, TILE_HEIGHT))
+                if icon:
                     self.surface.blit(icon, (90, y + 5))
 
-            name_text = self.item_font.render(name, True, (255, 255, 255))
-            cost_text = self.money_font.render(f"{cost} pts", True, (255, 255, 100))
+            name_text = render_text(self.item_font, name, (255, 255, 255))
+            cost_text = render_text(self.money_font, f"{cost} pts", (255, 255, 100))
             self.surface.blit(name_text, (100 + TILE_WIDTH, y + 5))
             self.surface.blit(cost_text, (100 + TILE_WIDTH, y + TILE_HEIGHT // 2))
 
@@ -246,7 +244,7 @@ class Shop:
         self.__blit_centered_button(font, "Continue", continue_rect, green if hover_continue else green, shadow, shadow_offset)
 
     def __draw_inventory(self):
-        self.surface.blit(self.gui_font.render("Inventory:", True, (255, 255, 255)), (500, 150))
+        self.surface.blit(render_text(self.gui_font, "Inventory:", (255, 255, 255)), (500, 150))
         for i in range(5):
             x = 500 + i * (TILE_WIDTH + 10)
             y = 190
@@ -256,21 +254,19 @@ class Shop:
             if i < len(self.inventory):
                 icon_path = self.inventory[i].get("image", None)
                 if icon_path:
-                    full_path = os.path.join(BASE_DIR, icon_path)
-                    if os.path.exists(full_path):
-                        icon = pygame.image.load(full_path).convert_alpha()
-                        icon = pygame.transform.scale(icon, (TILE_WIDTH, TILE_HEIGHT))
+                    icon = load_image(icon_path, (TILE_WIDTH, TILE_HEIGHT))
+                    if icon:
                         self.surface.blit(icon, (x, y))
             self.game.button_rects[f"inventory_{i}"] = rect
 
     def __draw_message(self):
         if self.shop_message:
-            msg = self.gui_font.render(self.shop_message, True, (255, 100, 100))
+            msg = render_text(self.gui_font, self.shop_message, (255, 100, 100))
             self.surface.blit(msg, (80, self.surface.get_height() - 70))
 
     def __blit_centered_button(self, font, text, rect, color, shadow_color, offset):
-        label = font.render(text, True, color)
-        shadow = font.render(text, True, shadow_color)
+        label = render_text(font, text, color)
+        shadow = render_text(font, text, shadow_color)
         self.surface.blit(shadow, (rect.centerx - label.get_width() // 2 + offset,
                                    rect.centery - label.get_height() // 2 + offset))
         self.surface.blit(label, (rect.centerx - label.get_width() // 2,
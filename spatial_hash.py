@@ -0,0 +1,44 @@
+# spatial_hash.py
+import math
+
+
+class SpatialHash:
+    """
+    Uniform-grid hash from screen space to tiles.
+
+    Each bucket lists the tiles whose screen rect overlaps it, in the order
+    they were inserted; insert topmost-first and a point query returns the
+    tile the player actually sees under the cursor. Rebuild whenever tile
+    screen positions change.
+    """
+
+    def __init__(self, cell_w, cell_h):
+        self.cell_w = max(1, int(cell_w))
+        self.cell_h = max(1, int(cell_h))
+        self.buckets = {}  # (cx, cy) -> [(tile, (sx, sy, sw, sh)), ...]
+
+    def clear(self):
+        self.buckets.clear()
+
+    def insert(self, tile, rect):
+        sx, sy, sw, sh = rect
+        cw, ch = self.cell_w, self.cell_h
+        entry = (tile, rect)
+        for cx in range(math.floor(sx / cw), math.floor((sx + sw) / cw) + 1):
+            for cy in range(math.floor(sy / ch), math.floor((sy + sh) / ch) + 1):
+                self.buckets.setdefault((cx, cy), []).append(entry)
+
+    def rebuild(self, tiles_with_rects):
+        self.clear()
+        for tile, rect in tiles_with_rects:
+            self.insert(tile, rect)
+
+    def at_point(self, px, py):
+        """First inserted tile whose rect contains (px, py), or None."""
+        bucket = self.buckets.get((math.floor(px / self.cell_w), math.floor(py / self.cell_h)))
+        if not bucket:
+            return None
+        for tile, (sx, sy, sw, sh) in bucket:
+            if sx <= px <= sx + sw and sy <= py <= sy + sh:
+                return tile
+        return None
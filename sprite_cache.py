@@ -0,0 +1,128 @@
+# sprite_cache.py
+from collections import OrderedDict
+
+import pygame
+
+
+class AlphaSpriteCache:
+    """
+    Pre-baked alpha variants of shared images (tile faces, item icons).
+
+    Alpha is quantized to `levels` steps and each (image, level) copy is
+    made once, on first use; fades then blit a cached surface instead of
+    copying the image every frame. Least recently used variants are dropped
+    past max_entries. Full opacity returns the image itself.
+    """
+
+    def __init__(self, levels=32, max_entries=512):
+        self.levels = levels
+        self.max_entries = max_entries
+        self.variants = OrderedDict()  # (id(image), level) -> (image, variant)
+
+    def level_for(self, alpha):
+        alpha = max(0, min(255, int(alpha)))
+        return round(alpha * (self.levels - 1) / 255)
+
+    def get(self, image, alpha):
+        level = self.level_for(alpha)
+        if level == self.levels - 1:
+            return image
+        key = (id(image), level)
+        entry = self.variants.get(key)
+        if entry is not None and entry[0] is image:
+            self.variants.move_to_end(key)
+            return entry[1]
+
+        variant = image.copy()
+        variant.set_alpha(round(level * 255 / (self.levels - 1)))
+        # keep the source alive with its variant so id(image) can't be reused
+        self.variants[key] = (image, variant)
+        self.variants.move_to_end(key)
+        while len(self.variants) > self.max_entries:
+            self.variants.popitem(last=False)
+        return variant
+
+    def clear(self):
+        self.variants.clear()
+
+
+class ShadowSprite:
+    """
+    One prebuilt shadow for buried tiles, drawn only where it can be seen.
+
+    A buried tile sits TILE_DEPTH px lower per level than the tile on top
+    of its stack, so most of its shadow lands under the top tile's fully
+    opaque rows. draw() skips that span and blits just the visible slivers
+    of the shared sprite.
+    """
+
+    def __init__(self, size, color=(0, 0, 0, 200)):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.surface.fill(color)
+        self.opaque_rows = {}  # id(image) -> (image, first row, end row)
+
+    def opaque_span(self, image):
+        """Longest run [first, end) of rows where every pixel of image is opaque."""
+        entry = self.opaque_rows.get(id(image))
+        if entry is not None and entry[0] is image:
+            return entry[1], entry[2]
+        width, height = image.get_size()
+        solid = pygame.mask.from_surface(image, 254)  # set where alpha == 255
+        row_mask = pygame.Mask((width, 1), fill=True)
+        best = (0, 0)
+        start = None
+        for row in range(height + 1):
+            opaque = row < height and solid.overlap_area(row_mask, (0, row)) == width
+            if opaque and start is None:
+                start = row
+            elif not opaque and start is not None:
+                if row - start > best[1] - best[0]:
+                    best = (start, row)
+                start = None
+        self.opaque_rows[id(image)] = (image, best[0], best[1])
+        return best
+
+    def draw(self, target, x, y, cover=None):
+        """cover: (image, x, y) of the tile drawn over this one later, if any."""
+        width, height = self.surface.get_size()
+        if cover is None or cover[1] != x or not isinstance(y, int) or not isinstance(cover[2], int):
+            target.blit(self.surface, (x, y))
+            return
+        image, _, cover_y = cover
+        first, end = self.opaque_span(image)
+        hidden_top, hidden_bottom = cover_y + first, cover_y + end
+        if hidden_top > y:
+            target.blit(self.surface, (x, y), (0, 0, width, min(height, hidden_top - y)))
+        if hidden_bottom < y + height:
+            skip = max(0, hidden_bottom - y)
+            target.blit(self.surface, (x, y + skip), (0, skip, width, height - skip))
+
+
+class TiledBackground:
+    """
+    A repeating background image, pre-tiled once into a single surface.
+
+    The surface is one tile larger than the target in each dimension, so any
+    scroll offset is a sub-rect of it and a frame costs one blit no matter
+    how small the tile is.
+    """
+
+    def __init__(self, tile):
+        self.tile = tile
+        self.surface = None
+
+    def _build(self, size):
+        tile_w, tile_h = self.tile.get_size()
+        width, height = size[0] + tile_w, size[1] + tile_h
+        self.surface = pygame.Surface((width, height)).convert(self.tile)
+        for x in range(0, width, tile_w):
+            for y in range(0, height, tile_h):
+                self.surface.blit(self.tile, (x, y))
+
+    def draw(self, target, scroll_x=0, scroll_y=0):
+        width, height = target.get_size()
+        tile_w, tile_h = self.tile.get_size()
+        if self.surface is None or self.surface.get_size() != (width + tile_w, height + tile_h):
+            self._build((width, height))
+        area = (int(scroll_x) % tile_w, int(scroll_y) % tile_h, width, height)
+        target.blit(self.surface, (0, 0), area)
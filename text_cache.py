@@ -0,0 +1,69 @@
+# text_cache.py
+import functools
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (font, text, colour, outline).
+
+    UI code re-renders the same labels every frame; this hands back the
+    surface from the first render instead. Outlined text is composited
+    once (stroke copies at the outline offsets, then the text) into a
+    single surface that is outline_width px larger on every side.
+    Surfaces are shared: don't set_alpha() or draw on them.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (font, surface)
+
+    def render(self, font, text, color, outline=None, outline_width=1, diagonals=False):
+        key = (id(font), text, tuple(color), tuple(outline) if outline else None, outline_width, diagonals)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] is font:
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        if outline:
+            surface = self._outlined(font, text, color, outline, outline_width, diagonals)
+        else:
+            surface = font.render(text, True, color)
+        self.entries[key] = (font, surface)  # keeps the font alive so id(font) stays unique
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def _outlined(font, text, color, outline, width, diagonals):
+        label = font.render(text, True, color)
+        stroke = font.render(text, True, outline)
+        offsets = [(-width, 0), (width, 0), (0, -width), (0, width)]
+        if diagonals:
+            offsets += [(-width, -width), (-width, width), (width, -width), (width, width)]
+        w, h = label.get_size()
+        surface = pygame.Surface((w + width * 2, h + width * 2), pygame.SRCALPHA)
+        for dx, dy in offsets:
+            surface.blit(stroke, (width + dx, width + dy))
+        surface.blit(label, (width, width))
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, outline=None, outline_width=1, diagonals=False):
+    """Cached font.render(text, True, color); see TextCache for outlines."""
+    return text_cache.render(font, text, color, outline, outline_width, diagonals)
+
+
+@functools.lru_cache(maxsize=32)
+def sys_font(name, size, bold=False, italic=False):
+    """pygame.font.SysFont, created once per (name, size, style)."""
+    return pygame.font.SysFont(name, size, bold=bold, italic=italic)
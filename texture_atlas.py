@@ -0,0 +1,91 @@
+# texture_atlas.py
+import pygame
+
+
+class TextureAtlas:
+    """
+    Small sprites (tile faces, item icons) packed into a few large pages.
+
+    build() shelf-packs every (key, surface) pair into page_size pages and
+    records a rect per key, so callers can draw many sprites with one
+    Surface.blits() call of (page, dest, rect) entries instead of blitting
+    separate surfaces. Sprites taller than a page get a page of their own.
+    Pages are shared: blit from them, don't draw on them.
+    """
+
+    def __init__(self, page_size=(1024, 1024), padding=1):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.rects = {}  # key -> (page index, Rect)
+        self._views = {}  # key -> subsurface
+        self._shelf = None  # (x, y, height) of the open row on the last page
+
+    def build(self, entries):
+        """Replace the atlas contents with (key, surface) pairs; None surfaces are skipped."""
+        self.clear()
+        entries = [(key, surface) for key, surface in entries if surface is not None]
+        entries.sort(key=lambda e: e[1].get_height(), reverse=True)  # tallest first packs shelves tighter
+        for key, surface in entries:
+            self.add(key, surface)
+        print(f"[ATLAS] Packed {len(self.rects)} sprites into {len(self.pages)} page(s)")
+
+    def add(self, key, surface):
+        w, h = surface.get_size()
+        page_w, page_h = self.page_size
+        pad = self.padding
+
+        if not self.pages or w > page_w:
+            self._new_page(max(w, page_w), max(h, page_h))
+        x, y, shelf_h = self._shelf
+        page = self.pages[-1]
+        if x + w > page.get_width():  # row full: open the next shelf
+            x, y, shelf_h = 0, y + shelf_h + pad, 0
+        if y + h > page.get_height():
+            page = self._new_page(max(w, page_w), max(h, page_h))
+            x, y, shelf_h = self._shelf
+
+        # MAX onto the cleared page copies pixels exactly; a normal alpha
+        # blit would darken the colour of semi-transparent edges
+        page.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        self.rects[key] = (len(self.pages) - 1, pygame.Rect(x, y, w, h))
+        self._views.pop(key, None)
+        self._shelf = (x + w + pad, y, max(shelf_h, h))
+
+    def _new_page(self, w, h):
+        page = pygame.Surface((w, h), pygame.SRCALPHA)
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._shelf = (0, 0, 0)
+        return page
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def get(self, key):
+        """(page surface, rect) for key, or None."""
+        entry = self.rects.get(key)
+        if entry is None:
+            return None
+        return self.pages[entry[0]], entry[1]
+
+    def blit_entry(self, key, dest):
+        """A (page, dest, rect) item for Surface.blits(), or None."""
+        entry = self.rects.get(key)
+        if entry is None:
+            return None
+        return self.pages[entry[0]], dest, entry[1]
+
+    def surface(self, key):
+        """The sprite as a subsurface of its page (for single blits), or None."""
+        view = self._views.get(key)
+        if view is None and key in self.rects:
+            page, rect = self.get(key)
+            view = self._views[key] = page.subsurface(rect)
+        return view
+
+    def clear(self):
+        self.pages.clear()
+        self.rects.clear()
+        self._views.clear()
+        self._shelf = None
@@ -0,0 +1,111 @@
+# tile.py
+import itertools
+
+_uids = itertools.count(1)
+
+
+class Tile:
+    """
+    One board tile.
+
+    Fixed __slots__ instead of a per-tile dict; the tile name is stored as a
+    small integer type id shared by every tile of that name. Match-fade
+    state lives in slots that are simply left unset when not in use, so
+    "key not present" keeps its old meaning; encounter/item tweens live in
+    the game's AnimationStore, not on the tile.
+
+    Tiles still answer the dict protocol (tile["z"], tile.get("fogged"),
+    tile.pop("fade_start", None), tile.update({...}), "fade_start" in tile) for
+    code that hasn't moved to attribute access yet. Equality and hashing are
+    by identity.
+    """
+
+    __slots__ = (
+        "uid", "type_id", "x", "y", "z", "grid_x", "grid_y",
+        # match fade-out
+        "fade_start", "fade_duration", "fading_out", "will_become_exposed",
+        "fogged", "dx", "dy",
+        "tarot",
+    )
+
+    _type_names = []  # type_id -> name
+    _type_ids = {}    # name -> type_id
+
+    def __init__(self, name, x, y, z, grid_x, grid_y):
+        self.uid = next(_uids)
+        self.type_id = Tile.type_id_for(name)
+        self.x = x
+        self.y = y
+        self.z = z
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+
+    @classmethod
+    def type_id_for(cls, name):
+        type_id = cls._type_ids.get(name)
+        if type_id is None:
+            type_id = len(cls._type_names)
+            cls._type_names.append(name)
+            cls._type_ids[name] = type_id
+        return type_id
+
+    @classmethod
+    def type_name(cls, type_id):
+        return cls._type_names[type_id]
+
+    @classmethod
+    def type_count(cls):
+        return len(cls._type_names)
+
+    @property
+    def name(self):
+        return Tile._type_names[self.type_id]
+
+    @name.setter
+    def name(self, value):
+        self.type_id = Tile.type_id_for(value)
+
+    def __repr__(self):
+        return f"Tile({self.name!r}, grid=({self.grid_x}, {self.grid_y}, {self.z}))"
+
+    # ── dict compatibility ─────────────────────────────────────────────────
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __delitem__(self, key):
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def pop(self, key, *default):
+        try:
+            value = getattr(self, key)
+            delattr(self, key)
+        except AttributeError:
+            if default:
+                return default[0]
+            raise KeyError(key) from None
+        return value
+
+    def update(self, values=(), **kwargs):
+        for key, value in dict(values, **kwargs).items():
+            self[key] = value
+
+    def keys(self):
+        return [key for key in ("name",) + Tile.__slots__[2:] if hasattr(self, key)]